@@ -2,6 +2,7 @@ from flask import Flask
 
 from config import Config
 from app.extensions import db, ma, login_manager, mail
+from app.utils import create_json_provider, password_hasher, pool_metrics, response_compressor
 
 
 def create_app():
@@ -9,19 +10,37 @@ def create_app():
     app = Flask(__name__)
 
     app.config.from_object(Config)
+    app.json = create_json_provider(app, app.config['JSON_PROVIDER'])
 
+    pool_metrics.init_app(app)
     db.init_app(app)
     ma.init_app(app)
     login_manager.init_app(app)
     mail.init_app(app)
+    password_hasher.init_app(app)
+    response_compressor.init_app(app)
 
-    from app.routes import auth_bp
+    from app.routes import auth_bp, course_bp, lecture_bp, submission_bp, grading_bp
 
     app.register_blueprint(auth_bp)
+    app.register_blueprint(course_bp)
+    app.register_blueprint(lecture_bp)
+    app.register_blueprint(submission_bp)
+    app.register_blueprint(grading_bp)
+
+    from app.factories import login_record_buffer
+
+    login_record_buffer.init_app(app)
+
+    from app.commands import email_cli, gradebook_cli, retention_cli
+
+    app.cli.add_command(email_cli)
+    app.cli.add_command(gradebook_cli)
+    app.cli.add_command(retention_cli)
 
     @login_manager.user_loader
     def user_loader(user_id):
-        from app.models import User
-        return User.query.get(int(user_id))
+        from app.factories import principal_service
+        return principal_service.load(int(user_id))
 
     return app
\ No newline at end of file
@@ -0,0 +1,3 @@
+from .email import email_cli
+from .gradebook import gradebook_cli
+from .retention import retention_cli
@@ -0,0 +1,31 @@
+import time
+
+import click
+from flask.cli import AppGroup
+
+from app.constants import GeneralConstants
+
+
+email_cli = AppGroup('email', help="Email delivery commands.")
+
+
+@email_cli.command('deliver')
+@click.option('--batch-size', default=GeneralConstants.Email.OUTBOX_BATCH_SIZE, show_default=True)
+@click.option('--loop', is_flag=True, help="Keep polling the outbox instead of exiting when it is drained.")
+@click.option('--interval', default=GeneralConstants.Email.OUTBOX_POLL_SECONDS, show_default=True)
+def deliver(batch_size: int, loop: bool, interval: int) -> None:
+    """Send pending emails from the outbox table (outbox delivery backend)."""
+    from app.factories import email_queue
+    from app.services import OutboxEmailQueue
+
+    if not isinstance(email_queue, OutboxEmailQueue):
+        raise click.UsageError("EMAIL_DELIVERY_BACKEND is not 'outbox'")
+
+    while True:
+        processed = email_queue.deliver_pending(batch_size)
+        click.echo(f"Processed {processed} email(s)")
+        if processed == batch_size:
+            continue
+        if not loop:
+            return
+        time.sleep(interval)
@@ -0,0 +1,14 @@
+import click
+from flask.cli import AppGroup
+
+
+gradebook_cli = AppGroup('gradebook', help="Materialized gradebook commands.")
+
+
+@gradebook_cli.command('rebuild')
+def rebuild() -> None:
+    """Recompute the gradebook entries of every course from the grades."""
+    from app.factories import gradebook_service
+
+    refreshed = gradebook_service.refresh_all()
+    click.echo(f"Gradebook rebuilt for {refreshed} course(s)")
\ No newline at end of file
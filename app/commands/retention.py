@@ -0,0 +1,24 @@
+import time
+
+import click
+from flask.cli import AppGroup
+
+from app.constants import GeneralConstants
+
+
+retention_cli = AppGroup('retention', help="Data retention commands.")
+
+
+@retention_cli.command('purge')
+@click.option('--loop', is_flag=True, help="Keep running, purging every --interval hours.")
+@click.option('--interval', default=GeneralConstants.Retention.INTERVAL_HOURS, show_default=True)
+def purge(loop: bool, interval: float) -> None:
+    """Delete expired tokens and old login records in bounded batches."""
+    from app.factories import retention_service
+
+    while True:
+        deleted = retention_service.purge()
+        click.echo(", ".join(f"{table}: {count} deleted" for table, count in deleted.items()))
+        if not loop:
+            return
+        time.sleep(interval * 3600)
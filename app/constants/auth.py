@@ -3,4 +3,8 @@ class AuthConstants:
         ADMIN = "admin"
         TEACHER = "teacher"
         STUDENT = "student"
-        CHOICES = [ADMIN, TEACHER, STUDENT]
\ No newline at end of file
+        CHOICES = [ADMIN, TEACHER, STUDENT]
+
+    class TokenHash:
+        # reset tokens issued before HMAC hashing were stored as bcrypt hashes
+        LEGACY_BCRYPT_PREFIX = "$2"
\ No newline at end of file
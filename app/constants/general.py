@@ -7,6 +7,68 @@ class GeneralConstants:
         DEFAULT_EXERCISE_TARGET_DAYS = 7
         DEFAULT_TOKEN_EXPIRATION_HOURS = 1
         DEFAULT_SESSION_LIFETIME_WEEKS = 3
+        PRINCIPAL_CACHE_TTL_SECONDS = 30
+
+    class Principal:
+        CACHE_MAX_ENTRIES = 10_000
+
+    class Pagination:
+        DEFAULT_PAGE_SIZE = 50
+        MAX_PAGE_SIZE = 500
+        STREAM_BATCH_SIZE = 100
+
+    class Email:
+        MAX_RETRIES = 3
+        RETRY_BACKOFF_SECONDS = 2
+        QUEUE_WORKERS = 4
+        OUTBOX_BATCH_SIZE = 100
+        OUTBOX_POLL_SECONDS = 5
+        OUTBOX_CLAIM_SECONDS = 300
+        SMTP_IDLE_TIMEOUT_SECONDS = 60
+
+        class Backend:
+            SYNC = "sync"
+            THREAD = "thread"
+            OUTBOX = "outbox"
+            CHOICES = [SYNC, THREAD, OUTBOX]
+
+    class LoginRecord:
+        BUFFER_SIZE = 100
+        FLUSH_INTERVAL_SECONDS = 5
+        MAX_RETAINED = 10_000
+
+    class Retention:
+        TOKEN_DAYS = 7
+        LOGIN_RECORD_DAYS = 365
+        BATCH_SIZE = 1000
+        INTERVAL_HOURS = 24
+
+    class Batch:
+        CHUNK_SIZE = 1000
+
+    class Submission:
+        MAX_REQUEST_BYTES = 256 * 1024
+
+    class Cache:
+        TTL_SECONDS = 60
+        MAX_ENTRIES = 1024
+        COURSES_NAMESPACE = "courses"
+        COURSE_NAMESPACE = "course:{name}"
+
+        class Backend:
+            LRU = "lru"
+            REDIS = "redis"
+            CHOICES = [LRU, REDIS]
+
+    class Compression:
+        MIN_SIZE = 1024
+        GZIP_LEVEL = 6
+        BROTLI_QUALITY = 4
+        MIMETYPES = frozenset({'application/json', 'text/csv', 'text/html', 'text/plain'})
+
+        class Encoding:
+            BROTLI = "br"
+            GZIP = "gzip"
 
     class Status:
         PENDING = "pending"
@@ -19,8 +19,14 @@ class ModelConstants:
         TOKEN_ENTROPY_BYTES = 8
         MAX_IP_ADDRESS = 45
         MAX_USER_AGENT = 255
+        MAX_SUBJECT = 255
+        MAX_ERROR = 255
+        MAX_SOLUTION_CONTENT = 16_000  # fits a MySQL TEXT column even with 4-byte characters
 
 
+    class DeferredGroup:
+        CONTENT = "content"
+
     class DefaultValues:
         DEFAULT_IS_MANDATORY = True
         DEFAULT_STATUS = "pending"
@@ -29,4 +35,10 @@ class ModelConstants:
         ACTIVE = "active"
         USED = "used"
         INVALIDATED = "invalidated"
-        CHOICES = [ACTIVE, USED, INVALIDATED]
\ No newline at end of file
+        CHOICES = [ACTIVE, USED, INVALIDATED]
+
+    class EmailStatus:
+        PENDING = "pending"
+        SENT = "sent"
+        FAILED = "failed"
+        CHOICES = [PENDING, SENT, FAILED]
\ No newline at end of file
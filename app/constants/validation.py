@@ -15,8 +15,11 @@ class ValidationConstants:
                 'first_name': 'First name length must be between 2 and 20 characters',
                 'last_name': 'Last name length must be between 2 and 20 characters',
                 'general': 'Name length must be between 2 and 255 characters'
-            }
+            },
+            'reserved': "'{name}' is a reserved lecture name"
         }
+        # names taken by lecture routes (/course/<course>/lecture/bulk)
+        RESERVED_LECTURE_NAMES = frozenset({'bulk'})
 
     class Phone:
         PATTERN = r"^05\d{8}$"
@@ -0,0 +1,91 @@
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from flask import current_app, has_request_context, session as flask_session
+from flask_sqlalchemy.session import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+
+class RoutingSession(Session):
+    """
+    Session that sends marked reads to the read replica and everything else to the primary.
+
+    Reads run on the replica only inside `using_replica()` (CRUDService read methods),
+    and only when the `replica` bind is configured. They stay on the primary:
+
+    - inside `primary_only()` (DatabaseService.transaction / DatabaseService.primary), so a
+      transaction reads its own rows
+    - once this session has written (flush or DML) until it commits or rolls back, and
+      after a commit for the rest of the request
+    - for `REPLICA_STICKY_SECONDS` after the client's last commit, so the next requests
+      read their own writes while the replica catches up
+
+    The sticky rules only cover the client that wrote. Any read whose result drives a write
+    (conflict checks, token lookups, outbox / CLI jobs picking the rows to process) must run
+    inside `primary_only()` - the replica may not have another client's or worker's writes yet.
+    """
+
+    REPLICA_BIND = 'replica'
+    _STICKY_KEY = '_primary_until'
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._replica_depth = 0
+        self._primary_depth = 0
+        self._has_writes = False
+        self._sticky_primary = False
+
+    def get_bind(self, mapper: Any | None = None, clause: Any | None = None, bind: Any | None = None, **kwargs: Any):
+        if bind is None and (self._flushing or isinstance(clause, UpdateBase)):
+            self._has_writes = True
+        elif bind is None and self._reads_from_replica():
+            return self._db.engines[self.REPLICA_BIND]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    @contextmanager
+    def using_replica(self) -> Iterator[None]:
+        self._replica_depth += 1
+        try:
+            yield
+        finally:
+            self._replica_depth -= 1
+
+    @contextmanager
+    def primary_only(self) -> Iterator[None]:
+        self._primary_depth += 1
+        try:
+            yield
+        finally:
+            self._primary_depth -= 1
+
+    def commit(self) -> None:
+        super().commit()
+        if self._has_writes:
+            self._has_writes = False
+            self._sticky_primary = True
+            self._stick_client_to_primary()
+
+    def rollback(self) -> None:
+        super().rollback()
+        self._has_writes = False
+
+    def _reads_from_replica(self) -> bool:
+        return (
+            self._replica_depth > 0
+            and self._primary_depth == 0
+            and not self._has_writes
+            and not self._sticky_primary
+            and not (self.new or self.dirty or self.deleted)
+            and self.REPLICA_BIND in self._db.engines
+            and not self._client_sticks_to_primary()
+        )
+
+    def _stick_client_to_primary(self) -> None:
+        if has_request_context() and self.REPLICA_BIND in self._db.engines:
+            sticky_seconds = current_app.config.get('REPLICA_STICKY_SECONDS', 0)
+            if sticky_seconds:
+                flask_session[self._STICKY_KEY] = time.time() + sticky_seconds
+
+    def _client_sticks_to_primary(self) -> bool:
+        return has_request_context() and flask_session.get(self._STICKY_KEY, 0) > time.time()
\ No newline at end of file
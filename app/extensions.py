@@ -4,8 +4,10 @@ from flask_mail import Mail
 from flask_marshmallow import Marshmallow
 from flask_sqlalchemy import SQLAlchemy
 
+from app.db_routing import RoutingSession
 
-db = SQLAlchemy()
+
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 ma = Marshmallow()
 bcrypt = Bcrypt()
 login_manager = LoginManager()
@@ -9,7 +9,16 @@ from app.schemas import (
     CourseWriteSchema,
     CourseReadSchema,
     CourseAdminSchema,
-    UserPublicSchema
+    LectureSchema,
+    LectureCreateSchema,
+    LectureBulkSchema,
+    LectureBulkDeleteSchema,
+    UserPublicSchema,
+    PaginationSchema,
+    EnrollmentSchema,
+    StudentSolutionSchema,
+    GradeSchema,
+    GradeBatchSchema
 )
 
 
@@ -26,9 +35,29 @@ create_login_record_schema = LoginRecordSchema(only=('user_id', 'ip_address', 'u
 create_token_schema = TokenSchema()
 
 
-course_write_schema = CourseWriteSchema()
+# request schemas load plain dicts (see validate_json_request), the services build the models
+course_write_schema = CourseWriteSchema(load_instance=False)
 course_read_schema = CourseReadSchema()
 course_admin_schema = CourseAdminSchema()
 
 course_read_list_schema = CourseReadSchema(many=True)
-course_admin_list_schema = CourseAdminSchema(many=True)
\ No newline at end of file
+course_admin_list_schema = CourseAdminSchema(many=True)
+
+
+lecture_schema = LectureSchema(load_instance=False)
+lecture_create_schema = LectureCreateSchema()
+lecture_bulk_schema = LectureBulkSchema()
+lecture_bulk_delete_schema = LectureBulkDeleteSchema()
+
+
+pagination_schema = PaginationSchema()
+
+
+enrollment_schema = EnrollmentSchema()
+
+
+submission_schema = StudentSolutionSchema(only=('content',), load_instance=False)
+
+
+grade_schema = GradeSchema(load_instance=False)
+grade_batch_schema = GradeBatchSchema()
\ No newline at end of file
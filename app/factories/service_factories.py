@@ -1,19 +1,61 @@
 from app.services.db import DatabaseService
 from app.services.crud import CRUDService
+from app.services.cache import CacheBackend, LRUCacheBackend, RedisCacheBackend, ResponseCache
+from app.services.principal import PrincipalService
 from app.services.auth import AuthService
-from app.services.login_record import LoginRecordService
+from app.services.login_record import LoginRecordBuffer, LoginRecordService
 from app.services.token import TokenService
 from app.services.email import EmailService
+from app.services.email_queue import EmailQueue, SyncEmailQueue, ThreadPoolEmailQueue, OutboxEmailQueue
+from app.services.smtp_pool import SMTPConnectionPool
 from app.services.user import UserService
 from app.services.course import CourseService
-from .schema_factories import create_login_record_schema, user_register_schema, create_token_schema, course_write_schema
+from app.services.gradebook import GradebookService
+from app.services.lecture import LectureService
+from app.services.enrollment import EnrollmentService
+from app.services.exercise import ExerciseService
+from app.services.submission import SubmissionService
+from app.services.grading import GradingService
+from app.services.retention import RetentionService
+from app.constants import GeneralConstants
+from config import Config
+from .schema_factories import (
+    create_login_record_schema,
+    user_register_schema,
+    create_token_schema,
+    lecture_schema,
+    lecture_create_schema,
+    grade_schema
+)
 
 db_service = DatabaseService()
 crud_service = CRUDService(db_service)
-login_record_service = LoginRecordService(crud_service, create_login_record_schema)
-token_service = TokenService(crud_service, create_token_schema)
-email_service = EmailService()
-user_service = UserService(crud_service)
+principal_service = PrincipalService(
+    crud_service,
+    ttl=Config.PRINCIPAL_CACHE_TTL,
+    max_entries=Config.PRINCIPAL_CACHE_MAX_ENTRIES
+)
+login_record_buffer = LoginRecordBuffer(
+    max_size=Config.LOGIN_RECORD_BUFFER_SIZE,
+    flush_interval=Config.LOGIN_RECORD_FLUSH_INTERVAL
+)
+login_record_service = LoginRecordService(login_record_buffer, create_login_record_schema)
+token_service = TokenService(db_service, crud_service, create_token_schema)
+
+
+def _create_email_queue(backend: str) -> EmailQueue:
+    if backend == GeneralConstants.Email.Backend.SYNC:
+        return SyncEmailQueue(smtp_pool)
+    if backend == GeneralConstants.Email.Backend.OUTBOX:
+        return OutboxEmailQueue(db_service, crud_service, smtp_pool)
+    return ThreadPoolEmailQueue(smtp_pool, max_workers=Config.EMAIL_QUEUE_WORKERS)
+
+
+smtp_pool = SMTPConnectionPool(max_size=Config.EMAIL_QUEUE_WORKERS)
+
+email_queue = _create_email_queue(Config.EMAIL_DELIVERY_BACKEND)
+email_service = EmailService(email_queue)
+user_service = UserService(crud_service, principal_service)
 auth_service = AuthService(
     db_service,
     crud_service,
@@ -23,4 +65,30 @@ auth_service = AuthService(
     email_service,
     user_register_schema
 )
-course_service = CourseService(crud_service, course_write_schema)
\ No newline at end of file
+def _create_cache_backend(backend: str) -> CacheBackend:
+    if backend == GeneralConstants.Cache.Backend.REDIS:
+        return RedisCacheBackend.from_url(Config.CACHE_REDIS_URL)
+    return LRUCacheBackend(max_entries=Config.CACHE_MAX_ENTRIES)
+
+
+response_cache = ResponseCache(_create_cache_backend(Config.CACHE_BACKEND), ttl=Config.CACHE_TTL)
+
+course_service = CourseService(crud_service, principal_service, response_cache)
+gradebook_service = GradebookService(db_service, crud_service, course_service)
+lecture_service = LectureService(
+    crud_service,
+    course_service,
+    gradebook_service,
+    response_cache,
+    lecture_schema,
+    lecture_create_schema
+)
+enrollment_service = EnrollmentService(db_service, crud_service, course_service, principal_service, response_cache)
+exercise_service = ExerciseService(crud_service)
+submission_service = SubmissionService(db_service, crud_service, exercise_service, gradebook_service)
+grading_service = GradingService(db_service, crud_service, exercise_service, gradebook_service, grade_schema)
+retention_service = RetentionService(
+    crud_service,
+    token_days=Config.TOKEN_RETENTION_DAYS,
+    login_record_days=Config.LOGIN_RECORD_RETENTION_DAYS
+)
\ No newline at end of file
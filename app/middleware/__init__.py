@@ -1,4 +1,6 @@
+from .cache_response import cache_response
 from .exception_handler import handle_exceptions
+from .limit_request import limit_content_length
 from .logout_required import logout_required
 from .role_required import role_required
-from .validate_request import validate_json_request
\ No newline at end of file
+from .validate_request import validate_json_request, validate_query_request, validate_batch_request
\ No newline at end of file
@@ -0,0 +1,50 @@
+from functools import wraps
+from http import HTTPStatus
+from typing import Callable, Iterable
+
+from flask import Response, request
+from flask_login import current_user
+
+from app.services import ResponseCache
+from app.utils import not_modified_response
+
+
+def cache_response(cache: ResponseCache, namespaces: Callable[..., Iterable[str]]) -> Callable:
+    """
+    Decorator to serve a GET route from the response cache.
+
+    The response is keyed by endpoint, view arguments, query string and role scope:
+    admins share entries, teachers and students get their own because the data
+    they may see depends on their enrollments. Must be applied below `login_required`.
+
+    Args:
+        cache: Response cache to read from and write to
+        namespaces: Called with the view arguments, returns the cache namespaces
+            the response depends on (invalidating any of them drops the entry)
+    """
+    def decorator(func) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = ":".join((
+                request.endpoint,
+                repr(sorted(request.view_args.items())),
+                request.query_string.decode('utf-8'),
+                _role_scope()
+            ))
+            response = cache.get_or_compute(
+                list(namespaces(**request.view_args)),
+                key,
+                lambda: func(*args, **kwargs)
+            )
+            if isinstance(response, Response) and response.status_code == HTTPStatus.OK \
+                    and ('ETag' in response.headers or 'Last-Modified' in response.headers):
+                # a cached response keeps the validators it was built with
+                return not_modified_response(response.headers) or response
+            return response
+        return wrapper
+    return decorator
+
+def _role_scope() -> str:
+    if current_user.is_admin:
+        return current_user.role
+    return f"{current_user.role}:{current_user.id}"
\ No newline at end of file
@@ -4,7 +4,15 @@ from typing import Callable
 
 from marshmallow import ValidationError
 from sqlalchemy.exc import SQLAlchemyError
-from werkzeug.exceptions import BadRequest, Unauthorized, Forbidden, NotFound, Conflict, InternalServerError
+from werkzeug.exceptions import (
+    BadRequest,
+    Unauthorized,
+    Forbidden,
+    NotFound,
+    Conflict,
+    RequestEntityTooLarge,
+    InternalServerError
+)
 
 from app.utils import error_response
 
@@ -19,6 +27,7 @@ def handle_exceptions(func) -> Callable:
     - Forbidden (403): Insufficient permissions
     - NotFound (404): Resource not found
     - Conflict (409): Resource conflict
+    - RequestEntityTooLarge (413): Request body too large
     - ValidationError (422): Schema validation error
     - SQLAlchemyError (500): Internal server error
     """
@@ -37,6 +46,8 @@ def handle_exceptions(func) -> Callable:
             return error_response(err.description, HTTPStatus.NOT_FOUND)
         except Conflict as err:
             return error_response(err.description, HTTPStatus.CONFLICT)
+        except RequestEntityTooLarge as err:
+            return error_response(err.description, HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
         except ValidationError as err:
             return error_response(err.messages, HTTPStatus.UNPROCESSABLE_ENTITY)
         except SQLAlchemyError as err:
@@ -0,0 +1,30 @@
+from functools import wraps
+from typing import Callable
+
+from flask import request
+from werkzeug.exceptions import RequestEntityTooLarge
+
+
+def limit_content_length(max_bytes: int) -> Callable:
+    """
+    Decorator to reject request bodies larger than `max_bytes`.
+
+    Oversized requests are refused from the Content-Length header, before
+    the body is read or parsed. Bodies sent without a length (chunked) are
+    capped while they are read.
+
+    Args:
+        max_bytes: Maximum allowed size of the request body
+
+    Raises:
+        RequestEntityTooLarge: If the request body is larger than `max_bytes`
+    """
+    def decorator(func) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if request.content_length is not None and request.content_length > max_bytes:
+                raise RequestEntityTooLarge(f"Request body must not exceed {max_bytes} bytes")
+            request.max_content_length = max_bytes
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
\ No newline at end of file
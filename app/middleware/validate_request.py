@@ -1,3 +1,5 @@
+import csv
+import io
 from functools import wraps
 from typing import Any, Callable
 
@@ -10,6 +12,8 @@ def validate_json_request(schema: Schema, partial: bool = False) -> Callable:
     """
     Validate JSON request data against a Marshmallow schema.
 
+    The deserialized data is passed to the view as `data`.
+
     Args:
         schema: Marshmallow schema for validation
         partial: Allow partial data validation for PATCH requests
@@ -18,13 +22,64 @@ def validate_json_request(schema: Schema, partial: bool = False) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
             data = _validate_json_structure()
-            _validate_json_schema(data, schema, partial)
-            kwargs['data'] = data
+            kwargs['data'] = _load_json_schema(data, schema, partial)
+
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def validate_query_request(schema: Schema) -> Callable:
+    """
+    Validate query string parameters against a Marshmallow schema.
+
+    The deserialized parameters are passed to the view as `params`.
+
+    Args:
+        schema: Marshmallow schema for validation
+    """
+    def decorator(func) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            kwargs['params'] = schema.load(request.args)
+
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def validate_batch_request(schema: Schema, items_field: str) -> Callable:
+    """
+    Validate a batch request sent either as JSON or as CSV.
+
+    A JSON body is validated like in `validate_json_request`. A `text/csv` body
+    is converted to `{items_field: [row, ...], **query_args}`, each row being a
+    dict keyed by the CSV header, and then validated and deserialized the same way.
+
+    Args:
+        schema: Marshmallow schema for validation
+        items_field: Schema field that receives the CSV rows
+    """
+    def decorator(func) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            if request.mimetype == 'text/csv':
+                data = {**request.args, items_field: _read_csv_rows()}
+            else:
+                data = _validate_json_structure()
+            kwargs['data'] = _load_json_schema(data, schema, partial=False)
 
             return func(*args, **kwargs)
         return wrapper
     return decorator
 
+def _read_csv_rows() -> list[dict]:
+    """Parse a CSV request body into a list of rows."""
+    rows = list(csv.DictReader(io.StringIO(request.get_data(as_text=True))))
+
+    if not rows:
+        raise BadRequest("Empty CSV body")
+
+    return rows
+
 def _validate_json_structure() -> dict:
     """Validate JSON request structure and return data."""
     if not request.is_json:
@@ -37,6 +92,15 @@ def _validate_json_structure() -> dict:
 
     return data
 
-def _validate_json_schema(data: dict, schema: Schema, partial: bool) -> None:
-    """Validate request data against schema."""
-    schema.load(data, partial=partial)
\ No newline at end of file
+def _load_json_schema(data: dict, schema: Schema, partial: bool) -> Any:
+    """
+    Validate and deserialize request data in one pass.
+
+    This is the only `schema.load` of the request body - services get the loaded
+    data and don't deserialize it again. Schemas used here are created with
+    `load_instance=False`, so the data is a dict the service builds models from.
+
+    Raises:
+        ValidationError: If the data doesn't match the schema
+    """
+    return schema.load(data, partial=partial)
\ No newline at end of file
@@ -13,4 +13,6 @@ from .course import Course
 from .lecture import Lecture
 from .exercise import Exercise
 from .student_solution import StudentSolution
-from .grade import Grade
\ No newline at end of file
+from .grade import Grade
+from .gradebook_entry import GradebookEntry
+from .email_outbox import EmailOutbox
\ No newline at end of file
@@ -24,6 +24,10 @@ class StudentCourses(BaseTable):
         primary_key=True
     )
 
+    __table_args__ = (
+        db.UniqueConstraint("student_id", "course_id", name="unique_student_course"),
+    )
+
 
 class TeacherCourses(BaseTable):
     """Association table connecting teachers with their courses."""
@@ -38,4 +42,8 @@ class TeacherCourses(BaseTable):
         db.Integer,
         db.ForeignKey("course.id", ondelete="CASCADE"),
         primary_key=True
+    )
+
+    __table_args__ = (
+        db.UniqueConstraint("teacher_id", "course_id", name="unique_teacher_course"),
     )
\ No newline at end of file
@@ -1,5 +1,8 @@
+from sqlalchemy.sql import func
+
 from app.extensions import db
 from app.models import NameMixin
+from app.models.mixins import relationship_count
 
 
 class Course(NameMixin):
@@ -31,6 +34,26 @@ class Course(NameMixin):
         back_populates="courses"
     )
 
+    # change tracking - bumped by CourseService.touch_course whenever the course,
+    # its lectures or its enrollments change; used for ETag / Last-Modified
+    version = db.Column(
+        db.Integer,
+        nullable=False,
+        default=1,
+        server_default="1"
+    )
+
+    modified_at = db.Column(
+        db.DateTime(timezone=True),
+        nullable=False,
+        server_default=func.current_timestamp()
+    )
+
+    # relationship counts
+    lectures_count = relationship_count()
+    teachers_count = relationship_count()
+    students_count = relationship_count()
+
     __table_args__ = (
         db.UniqueConstraint("name", name="unique_course"),
     )
\ No newline at end of file
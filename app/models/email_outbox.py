@@ -0,0 +1,75 @@
+from sqlalchemy.sql import func
+
+from app.extensions import db
+from app.constants import ModelConstants
+from app.models import BaseTable
+
+
+class EmailOutbox(BaseTable):
+    """
+    Persistent queue of outgoing emails.
+
+    Used by the outbox email delivery backend: emails are stored here inside
+    the request and sent later by `flask email deliver`, which retries failed
+    deliveries with exponential backoff.
+
+    Attributes:
+        recipients: Comma separated primary recipient addresses
+        cc: Comma separated carbon copy addresses
+        bcc: Comma separated blind carbon copy addresses
+        sender: Sender address
+        reply_to: Reply-to address
+        subject: Email subject line
+        body: Email content
+        status: Delivery state (pending/sent/failed)
+        attempts: Number of failed delivery attempts
+        next_attempt_at: Earliest time of the next delivery attempt
+        last_error: Error message of the last failed attempt
+    """
+
+    recipients = db.Column(
+        db.Text,
+        nullable=False
+    )
+
+    cc = db.Column(db.Text)
+
+    bcc = db.Column(db.Text)
+
+    sender = db.Column(db.String(ModelConstants.StringLength.MAX_EMAIL))
+
+    reply_to = db.Column(db.String(ModelConstants.StringLength.MAX_EMAIL))
+
+    subject = db.Column(
+        db.String(ModelConstants.StringLength.MAX_SUBJECT),
+        nullable=False
+    )
+
+    body = db.Column(
+        db.Text,
+        nullable=False
+    )
+
+    status = db.Column(
+        db.Enum(*ModelConstants.EmailStatus.CHOICES),
+        nullable=False,
+        default=ModelConstants.EmailStatus.PENDING
+    )
+
+    attempts = db.Column(
+        db.Integer,
+        nullable=False,
+        default=0
+    )
+
+    next_attempt_at = db.Column(
+        db.DateTime(timezone=True),
+        nullable=False,
+        server_default=func.current_timestamp()
+    )
+
+    last_error = db.Column(db.String(ModelConstants.StringLength.MAX_ERROR))
+
+    __table_args__ = (
+        db.Index("ix_email_outbox_status_next_attempt", "status", "next_attempt_at"),
+    )
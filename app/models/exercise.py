@@ -2,7 +2,7 @@ from datetime import datetime, timedelta
 
 import pytz
 
-from app.constants import GeneralConstants
+from app.constants import GeneralConstants, ModelConstants
 from app.extensions import db
 from app.models import NameMixin
 
@@ -31,9 +31,12 @@ class Exercise(NameMixin):
     )
 
     # self columns
-    content = db.Column(
-        db.Text,
-        nullable=False
+    content = db.deferred(
+        db.Column(
+            db.Text,
+            nullable=False
+        ),
+        group=ModelConstants.DeferredGroup.CONTENT
     )
 
     target_date = db.Column(
@@ -46,7 +49,10 @@ class Exercise(NameMixin):
         default=True
     )
 
-    teacher_solution = db.Column(db.Text)
+    teacher_solution = db.deferred(
+        db.Column(db.Text),
+        group=ModelConstants.DeferredGroup.CONTENT
+    )
 
     # relationship
     lecture = db.relationship(
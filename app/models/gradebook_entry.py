@@ -0,0 +1,57 @@
+from sqlalchemy.sql import func
+
+from app.extensions import db
+from app.models import BaseTable
+
+
+class GradebookEntry(BaseTable):
+    """
+    Materialized gradebook row: a student's grade totals within a course.
+
+    Maintained by GradebookService - refreshed for the affected students whenever
+    their grades change - so a course gradebook is served from one indexed read
+    instead of walking lectures, exercises, solutions and grades.
+
+    Attributes:
+        course_id: The course the totals belong to
+        student_id: The student the totals belong to
+        graded_count: Number of the student's graded exercises in the course
+        total_score: Sum of the student's scores in the course
+        refreshed_at: Last time the totals were recomputed
+    """
+
+    # foreign keys
+    course_id = db.Column(
+        db.Integer,
+        db.ForeignKey("course.id", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    student_id = db.Column(
+        db.Integer,
+        db.ForeignKey("student.id", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    # self columns
+    graded_count = db.Column(
+        db.Integer,
+        nullable=False,
+        default=0
+    )
+
+    total_score = db.Column(
+        db.Integer,
+        nullable=False,
+        default=0
+    )
+
+    refreshed_at = db.Column(
+        db.DateTime(timezone=True),
+        nullable=False,
+        server_default=func.current_timestamp()
+    )
+
+    __table_args__ = (
+        db.UniqueConstraint("course_id", "student_id", name="unique_gradebook_course_student"),
+    )
\ No newline at end of file
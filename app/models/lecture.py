@@ -1,5 +1,7 @@
+from app.constants import ModelConstants
 from app.extensions import db
 from app.models import NameMixin
+from app.models.mixins import relationship_count
 
 
 class Lecture(NameMixin):
@@ -25,13 +27,19 @@ class Lecture(NameMixin):
     )
 
     # self columns
-    content = db.Column(db.Text)
+    content = db.deferred(
+        db.Column(db.Text),
+        group=ModelConstants.DeferredGroup.CONTENT
+    )
 
     # relationships
     course = db.relationship("Course", back_populates="lectures")
     teacher = db.relationship("Teacher", back_populates="lectures")
     exercises = db.relationship("Exercise", back_populates="lecture", cascade="all, delete-orphan")
 
+    # relationship counts
+    exercises_count = relationship_count()
+
     __table_args__ = (
         db.UniqueConstraint("name", "course_id", name="unique_lecture_name_per_course"),
     )
\ No newline at end of file
@@ -34,4 +34,8 @@ class LoginRecord(BaseTable):
 
     user_agent = db.Column(db.String(ModelConstants.StringLength.MAX_USER_AGENT))
 
-    user = db.relationship("User", back_populates="login_records")
\ No newline at end of file
+    user = db.relationship("User", back_populates="login_records")
+
+    __table_args__ = (
+        db.Index("ix_login_record_login_timestamp", "login_timestamp"),
+    )
\ No newline at end of file
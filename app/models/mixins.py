@@ -5,6 +5,16 @@ from app.constants import ModelConstants
 from app.models import BaseTable
 
 
+def relationship_count():
+    """
+    Integer attribute holding the size of a relationship.
+
+    Evaluates to NULL unless the query fills it with a COUNT subquery
+    (see `app.utils.build_loader_options`).
+    """
+    return db.query_expression(db.type_coerce(db.null(), db.Integer))
+
+
 class NameMixin(BaseTable):
     """
     Mixin for models that have a name field.
@@ -24,7 +24,10 @@ class StudentSolution(BaseTable):
     )
 
     # self columns
-    content = db.Column(db.Text)
+    content = db.deferred(
+        db.Column(db.Text),
+        group=ModelConstants.DeferredGroup.CONTENT
+    )
 
     submitted_at = db.Column(
         db.DateTime(timezone=True),
@@ -45,4 +45,9 @@ class Token(BaseTable):
         default=ModelConstants.TokenStatus.ACTIVE
     )
 
-    user = db.relationship("User", back_populates="tokens")
\ No newline at end of file
+    user = db.relationship("User", back_populates="tokens")
+
+    __table_args__ = (
+        db.Index("ix_token_user_status_expiration", "user_id", "status", "expiration"),
+        db.Index("ix_token_expiration", "expiration"),
+    )
\ No newline at end of file
@@ -1,3 +1,5 @@
 from .auth import auth_bp
 from .course import course_bp
-from .lecture import lecture_bp
\ No newline at end of file
+from .lecture import lecture_bp
+from .submission import submission_bp
+from .grading import grading_bp
\ No newline at end of file
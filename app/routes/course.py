@@ -3,17 +3,30 @@ from http import HTTPStatus
 from flask import Blueprint, Response
 from flask_login import login_required, current_user
 
-from app.constants import AuthConstants
+from app.constants import AuthConstants, GeneralConstants
 from app.factories import (
     course_service,
     course_write_schema,
     course_read_schema,
     course_read_list_schema,
     course_admin_schema,
-    course_admin_list_schema
+    course_admin_list_schema,
+    pagination_schema,
+    enrollment_service,
+    enrollment_schema,
+    gradebook_service,
+    response_cache
 )
-from app.middleware import handle_exceptions, validate_json_request, role_required
-from app.utils import success_response
+from app.middleware import (
+    cache_response,
+    handle_exceptions,
+    validate_json_request,
+    validate_query_request,
+    validate_batch_request,
+    role_required
+)
+from app.services import ResponseCache
+from app.utils import as_utc, success_response, stream_response, page_meta
 
 
 course_bp = Blueprint('course', __name__, url_prefix='/course')
@@ -22,13 +35,31 @@ course_bp = Blueprint('course', __name__, url_prefix='/course')
 @course_bp.get('/')
 @handle_exceptions
 @login_required
-def get_courses() -> Response:
-    courses = course_service.get_accessible_courses()
+@cache_response(response_cache, lambda: [GeneralConstants.Cache.COURSES_NAMESPACE])
+@validate_query_request(pagination_schema)
+def get_courses(params: dict) -> Response:
+    schema = course_read_list_schema if current_user.is_student else course_admin_list_schema
+
+    if params['stream']:
+        return stream_response(
+            course_service.stream_accessible_courses(schema, after_id=params.get('cursor')),
+            schema=schema,
+            message="Courses retrieved successfully"
+        )
+
+    courses = course_service.get_accessible_courses(
+        schema,
+        after_id=params.get('cursor'),
+        limit=params['limit']
+    )
+    _, upcoming = course_service.exercise_deadlines(*courses)
 
     return success_response(
         message="Courses retrieved successfully",
         data=courses,
-        schema=course_read_list_schema if current_user.is_student else course_admin_list_schema
+        schema=schema,
+        meta=page_meta(courses, params['limit']),
+        expires=upcoming[0] if upcoming else None
     )
 
 
@@ -51,13 +82,20 @@ def create_course(data: dict) -> Response:
 @course_bp.get('/<string:course_name>')
 @handle_exceptions
 @login_required
+@cache_response(response_cache, lambda course_name: ResponseCache.course_namespaces(course_name))
 def get_course(course_name: str) -> Response:
-    course = course_service.get_course_by_name(course_name)
+    schema = course_read_schema if current_user.is_student else course_admin_schema
+    course = course_service.get_course_by_name(course_name, schema)
+    # teacher solutions appear when a deadline passes, without a version bump
+    passed, upcoming = course_service.exercise_deadlines(course)
 
     return success_response(
         "Course details retrieved successfully",
         data=course,
-        schema=course_read_schema if current_user.is_student else course_admin_schema
+        schema=schema,
+        etag=f"course-{course.id}-v{course.version}-d{len(passed)}-{type(schema).__name__}",
+        last_modified=max([as_utc(course.modified_at), *passed]),
+        expires=upcoming[0] if upcoming else None
     )
 
 
@@ -85,4 +123,31 @@ def delete_course(course_name: str) -> Response:
 
     return success_response(
         status_code=HTTPStatus.NO_CONTENT
+    )
+
+
+@course_bp.post('/<string:course_name>/enrollments')
+@handle_exceptions
+@login_required
+@role_required(AuthConstants.Role.ADMIN)
+@validate_batch_request(enrollment_schema, items_field='users')
+def enroll_users(course_name: str, data: dict) -> Response:
+    report = enrollment_service.enroll(course_name, data)
+
+    return success_response(
+        f"{report['enrolled']} {data['role']}(s) enrolled in course '{report['course']}'",
+        data=report
+    )
+
+
+@course_bp.get('/<string:course_name>/gradebook')
+@handle_exceptions
+@login_required
+@role_required(AuthConstants.Role.ADMIN, AuthConstants.Role.TEACHER)
+def get_gradebook(course_name: str) -> Response:
+    gradebook = gradebook_service.get_gradebook(course_name)
+
+    return success_response(
+        "Gradebook retrieved successfully",
+        data=gradebook
     )
\ No newline at end of file
@@ -0,0 +1,28 @@
+from flask import Blueprint, Response
+from flask_login import login_required
+
+from app.constants import AuthConstants
+from app.factories import grade_batch_schema, grading_service
+from app.middleware import handle_exceptions, role_required, validate_batch_request
+from app.utils import success_response
+
+
+grading_bp = Blueprint(
+    'grading',
+    __name__,
+    url_prefix='/course/<string:course_name>/lecture/<string:lecture_name>/exercise/<string:exercise_name>/grades'
+)
+
+
+@grading_bp.put('/')
+@handle_exceptions
+@login_required
+@role_required(AuthConstants.Role.TEACHER)
+@validate_batch_request(grade_batch_schema, items_field='grades')
+def grade_solutions(course_name: str, lecture_name: str, exercise_name: str, data: dict) -> Response:
+    result = grading_service.grade_solutions(course_name, lecture_name, exercise_name, data['grades'])
+
+    return success_response(
+        f"{result['graded']} solution(s) graded successfully",
+        data=result
+    )
\ No newline at end of file
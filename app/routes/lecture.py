@@ -4,9 +4,9 @@ from flask import Blueprint, Response
 from flask_login import login_required
 
 from app.constants import AuthConstants
-from app.factories import lecture_schema, lecture_service
-from app.middleware import handle_exceptions, role_required, validate_json_request
-from app.utils import success_response
+from app.factories import lecture_schema, lecture_bulk_schema, lecture_bulk_delete_schema, lecture_service
+from app.middleware import handle_exceptions, role_required, validate_json_request, validate_batch_request
+from app.utils import error_response, success_response
 
 
 lecture_bp = Blueprint('lecture', __name__, url_prefix='/course/<string:course_name>/lecture')
@@ -52,4 +52,51 @@ def delete_lecture(course_name: str, lecture_name: str) -> Response:
 
     return success_response(
         status_code=HTTPStatus.NO_CONTENT
+    )
+
+
+@lecture_bp.post('/bulk')
+@handle_exceptions
+@login_required
+@role_required(AuthConstants.Role.ADMIN, AuthConstants.Role.TEACHER)
+@validate_batch_request(lecture_bulk_schema, items_field='lectures')
+def create_lectures(course_name: str, data: dict) -> Response:
+    lectures, errors = lecture_service.create_lectures(course_name, data['lectures'])
+    if not lectures:
+        return error_response("No lectures were created", errors=errors)
+
+    return success_response(
+        f"{len(lectures)} lecture(s) created successfully",
+        data={'lectures': [lecture.name for lecture in lectures], 'errors': errors},
+        status_code=HTTPStatus.CREATED
+    )
+
+
+@lecture_bp.put('/bulk')
+@handle_exceptions
+@login_required
+@role_required(AuthConstants.Role.ADMIN, AuthConstants.Role.TEACHER)
+@validate_batch_request(lecture_bulk_schema, items_field='lectures')
+def update_lectures(course_name: str, data: dict) -> Response:
+    lectures, errors = lecture_service.update_lectures(course_name, data['lectures'])
+    if not lectures:
+        return error_response("No lectures were updated", errors=errors)
+
+    return success_response(
+        f"{len(lectures)} lecture(s) updated successfully",
+        data={'lectures': [lecture.name for lecture in lectures], 'errors': errors}
+    )
+
+
+@lecture_bp.delete('/bulk')
+@handle_exceptions
+@login_required
+@role_required(AuthConstants.Role.ADMIN, AuthConstants.Role.TEACHER)
+@validate_json_request(lecture_bulk_delete_schema)
+def delete_lectures(course_name: str, data: dict) -> Response:
+    deleted, errors = lecture_service.delete_lectures(course_name, data['names'])
+
+    return success_response(
+        f"{deleted} lecture(s) deleted successfully",
+        data={'deleted': deleted, 'errors': errors}
     )
\ No newline at end of file
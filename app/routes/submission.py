@@ -0,0 +1,29 @@
+from flask import Blueprint, Response
+from flask_login import login_required
+
+from app.constants import AuthConstants, GeneralConstants
+from app.factories import submission_schema, submission_service
+from app.middleware import handle_exceptions, role_required, limit_content_length, validate_json_request
+from app.utils import success_response
+
+
+submission_bp = Blueprint(
+    'submission',
+    __name__,
+    url_prefix='/course/<string:course_name>/lecture/<string:lecture_name>/exercise/<string:exercise_name>/submission'
+)
+
+
+@submission_bp.put('/')
+@handle_exceptions
+@login_required
+@role_required(AuthConstants.Role.STUDENT)
+@limit_content_length(GeneralConstants.Submission.MAX_REQUEST_BYTES)
+@validate_json_request(submission_schema)
+def submit_solution(course_name: str, lecture_name: str, exercise_name: str, data: dict) -> Response:
+    submission = submission_service.submit_solution(course_name, lecture_name, exercise_name, data)
+
+    return success_response(
+        "Solution submitted successfully",
+        data=submission
+    )
\ No newline at end of file
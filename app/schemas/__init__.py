@@ -1 +1,2 @@
-from .requests import *
\ No newline at end of file
+from .requests import *
+from .resources import *
\ No newline at end of file
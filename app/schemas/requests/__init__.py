@@ -1,10 +1,12 @@
 from .base import *
 from .auth import *
 from .course import *
+from .enrollment import *
 from .exercise import *
 from .grade import *
 from .lecture import *
 from .login_record import *
+from .pagination import *
 from .token import *
 from .student import *
 from .student_solution import *
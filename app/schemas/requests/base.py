@@ -1,9 +1,143 @@
-from marshmallow import Schema, fields, validate
+from typing import Any, Callable
+
+from marshmallow import Schema, fields, validate, missing, utils
+from marshmallow.decorators import POST_DUMP, PRE_DUMP
 
 from app.constants import ModelConstants, ValidationConstants
 from app.utils import format_date, format_time
 
 
+class RelationshipCount(fields.Field):
+    """
+    Dump-only count of a model relationship.
+
+    Reads the model attribute of the same name, which is populated with a
+    SQL COUNT subquery when the object is loaded through `build_loader_options`.
+    Falls back to counting the loaded relationship otherwise.
+
+    Args:
+        count_of: Name of the relationship to count
+    """
+
+    def __init__(self, count_of: str, **kwargs) -> None:
+        super().__init__(dump_only=True, **kwargs)
+        self.count_of = count_of
+
+    def _serialize(self, value, attr, obj, **kwargs) -> int:
+        if value is None:
+            return len(getattr(obj, self.count_of))
+        return value
+
+
+class CompiledDumpMixin:
+    """
+    Schema mixin that dumps through a precompiled plan.
+
+    On the first dump, the accessor and serializer of every dump field are resolved
+    once for the schema instance: plain attribute reads for simple fields, and
+    compiled plans for nested schemas. Later dumps skip marshmallow's per-field
+    `serialize` / `get_value` dispatch. Fields without a fast path (Method, Function,
+    custom fields, ...) are serialized by marshmallow as usual, and schemas with
+    dump hooks are dumped by marshmallow entirely.
+    """
+
+    def dump(self, obj: Any, *, many: bool | None = None) -> Any:
+        if _has_dump_hooks(self):
+            return super().dump(obj, many=many)
+
+        dumper = self.__dict__.get('_compiled_dumper')
+        if dumper is None:
+            dumper = self._compiled_dumper = compile_dumper(self)
+
+        many = self.many if many is None else bool(many)
+        if many and obj is not None:
+            return [dumper(item) for item in obj]
+        return dumper(obj)
+
+
+def compile_dumper(schema: Schema) -> Callable[[Any], dict]:
+    """Build a function that dumps one object the way `schema.dump(obj, many=False)` does."""
+    steps = [
+        (field.data_key if field.data_key is not None else name, _compile_field(schema, name, field))
+        for name, field in schema.dump_fields.items()
+    ]
+
+    def dump(obj: Any) -> dict:
+        result = {}
+        for key, serialize in steps:
+            value = serialize(obj)
+            if value is not missing:
+                result[key] = value
+        return result
+
+    return dump
+
+def _compile_field(schema: Schema, name: str, field: fields.Field) -> Callable[[Any], Any]:
+    """Return the serializer of one field, specialized for the field type when possible."""
+    def fallback(obj: Any) -> Any:
+        return field.serialize(name, obj, accessor=schema.get_attribute)
+
+    if type(field).serialize is fields.Field.serialize:
+        # Function/Method fields inspect their callable's signature on every call
+        if type(field)._serialize is fields.Function._serialize and field.serialize_func is not None:
+            if len(utils.get_func_args(field.serialize_func)) == 1:
+                return field.serialize_func
+        if type(field)._serialize is fields.Method._serialize and field._serialize_method is not None:
+            return field._serialize_method
+
+    attribute = field.attribute or name
+    if (
+            '.' in attribute
+            or field.dump_default is not missing
+            or type(schema).get_attribute is not Schema.get_attribute
+            or type(field).get_value is not fields.Field.get_value
+            or type(field).serialize is not fields.Field.serialize
+    ):
+        return fallback
+
+    convert = _fast_converter(field)
+    if convert is None:
+        return fallback
+
+    def serialize(obj: Any) -> Any:
+        value = obj.get(attribute, missing) if isinstance(obj, dict) else getattr(obj, attribute, missing)
+        if value is missing:
+            return missing
+        return None if value is None else convert(value)
+
+    return serialize
+
+def _fast_converter(field: fields.Field) -> Callable[[Any], Any] | None:
+    """Converter reproducing the field's `_serialize` for a non-None value, or None if there is no fast path."""
+    field_type = type(field)
+
+    if field_type is fields.Raw:
+        return lambda value: value
+    if field_type._serialize is fields.String._serialize:
+        return lambda value: value if type(value) is str else str(value)
+    if field_type is fields.Integer and not field.as_string:
+        return lambda value: value if type(value) is int else int(value)
+    if field_type._serialize is fields.DateTime._serialize:
+        date_format = field.format or field.DEFAULT_FORMAT
+        return field.SERIALIZATION_FUNCS.get(date_format) or (lambda value: value.strftime(date_format))
+    if field_type is fields.Boolean and field.truthy == fields.Boolean.truthy and field.falsy == fields.Boolean.falsy:
+        return lambda value: value if type(value) is bool else field._serialize(value, None, None)
+    if field_type is fields.Inferred:
+        return lambda value: value if type(value) in (str, int, bool, float) else field._serialize(value, None, None)
+    if field_type is fields.Nested and isinstance(field.nested, (str, type, Schema)):
+        nested_schema = field.schema
+        if _has_dump_hooks(nested_schema):
+            return None
+        nested_dump = compile_dumper(nested_schema)
+        if nested_schema.many or field.many:
+            return lambda value: [nested_dump(item) for item in value]
+        return nested_dump
+    return None
+
+def _has_dump_hooks(schema: Schema) -> bool:
+    return bool(schema._hooks[PRE_DUMP] or schema._hooks[POST_DUMP])
+
+
 class BaseSchema(Schema):
     """Base schema with common fields."""
 
@@ -30,6 +164,8 @@ class NameSchema(BaseSchema):
 class PersonSchema(BaseSchema):
     """Base schema for person-related models (Student, Teacher)."""
 
+    full_name = fields.Str(dump_only=True)
+
     first_name = fields.Str(
         required=True,
         validate=[
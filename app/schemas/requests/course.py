@@ -2,7 +2,7 @@ from marshmallow import fields
 
 from app.extensions import ma
 from app.models import Course
-from app.schemas import NameSchema
+from .base import NameSchema, RelationshipCount, CompiledDumpMixin
 
 
 __all__ = [
@@ -23,7 +23,7 @@ class BaseCourseSchema(NameSchema, ma.SQLAlchemyAutoSchema):
     class Meta:
         model = Course
         load_instance = True
-        exclude = ('id', 'created_at', 'date', 'time')
+        exclude = ('id', 'created_at', 'date', 'time', 'version', 'modified_at')
 
 
 class CourseWriteSchema(BaseCourseSchema):
@@ -33,16 +33,22 @@ class CourseWriteSchema(BaseCourseSchema):
     Used to validate input data when creating or modifying courses.
     For partial updates, use with `partial=True` parameter.
     """
-    pass
 
+    class Meta(BaseCourseSchema.Meta):
+        exclude = BaseCourseSchema.Meta.exclude + ('lectures_count', 'teachers_count', 'students_count')
 
-class CourseReadSchema(BaseCourseSchema):
+
+class CourseReadSchema(CompiledDumpMixin, BaseCourseSchema):
     """
     Schema for course data retrieval with related lectures and teachers.
 
     Includes nested relationships and computed counts for general course views.
     All relationship fields are read-only.
     """
+
+    class Meta(BaseCourseSchema.Meta):
+        exclude = BaseCourseSchema.Meta.exclude + ('students_count',)
+
     lectures = fields.Nested(
         'LectureSchema',
         many=True,
@@ -56,15 +62,9 @@ class CourseReadSchema(BaseCourseSchema):
         only=('full_name',)
     )
 
-    lectures_count = fields.Function(
-        lambda obj: len(obj.lectures),
-        dump_only=True
-    )
+    lectures_count = RelationshipCount('lectures')
 
-    teachers_count = fields.Function(
-        lambda obj: len(obj.teachers),
-        dump_only=True
-    )
+    teachers_count = RelationshipCount('teachers')
 
 
 class CourseAdminSchema(CourseReadSchema):
@@ -74,6 +74,10 @@ class CourseAdminSchema(CourseReadSchema):
     Adds student data to the standard course view for privileged users.
     Includes list of enrolled students and their count.
     """
+
+    class Meta(BaseCourseSchema.Meta):
+        pass
+
     students = fields.Nested(
         'StudentSchema',
         many=True,
@@ -81,7 +85,4 @@ class CourseAdminSchema(CourseReadSchema):
         only=('full_name',)
     )
 
-    students_count = fields.Function(
-        lambda obj: len(obj.students),
-        dump_only=True
-    )
\ No newline at end of file
+    students_count = RelationshipCount('students')
\ No newline at end of file
@@ -0,0 +1,43 @@
+from marshmallow import Schema, fields, validate, EXCLUDE
+
+from app.constants import AuthConstants, ValidationConstants
+
+
+__all__ = [
+    'EnrollmentSchema'
+]
+
+
+class EnrollmentUserSchema(Schema):
+    """A single user to enroll, identified by the email of their student/teacher profile."""
+
+    class Meta:
+        unknown = EXCLUDE  # CSV exports often carry extra columns
+
+    email = fields.Email(
+        required=True,
+        validate=validate.Regexp(
+            ValidationConstants.Email.PATTERN,
+            error=ValidationConstants.Email.ERROR_MESSAGES['format']
+        )
+    )
+
+
+class EnrollmentSchema(Schema):
+    """
+    Schema for bulk enrollment of students or teachers into a course.
+
+    Accepts a JSON body, or a CSV body with an `email` column and
+    the role passed as a query parameter (see `validate_batch_request`).
+    """
+
+    role = fields.Str(
+        required=True,
+        validate=validate.OneOf([AuthConstants.Role.STUDENT, AuthConstants.Role.TEACHER])
+    )
+
+    users = fields.List(
+        fields.Nested(EnrollmentUserSchema),
+        required=True,
+        validate=validate.Length(min=1, error="users cannot be empty")
+    )
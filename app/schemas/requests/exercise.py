@@ -5,7 +5,8 @@ from marshmallow import fields, validate
 
 from app.extensions import ma
 from app.models import Exercise
-from app.schemas import NameSchema
+from app.utils import as_utc
+from .base import NameSchema
 
 
 class ExerciseSchema(NameSchema, ma.SQLAlchemyAutoSchema):
@@ -50,5 +51,5 @@ class ExerciseSchema(NameSchema, ma.SQLAlchemyAutoSchema):
 
     def get_teacher_solution(self, obj):
         current_time = datetime.now(pytz.utc)
-        if current_time >= obj.target_date:
+        if obj.target_date and current_time >= as_utc(obj.target_date):
             return obj.teacher_solution
\ No newline at end of file
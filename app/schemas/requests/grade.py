@@ -1,4 +1,4 @@
-from marshmallow import fields, validate
+from marshmallow import Schema, fields, validate
 
 from app.extensions import ma
 from app.constants import GeneralConstants, ValidationConstants, ModelConstants
@@ -18,7 +18,6 @@ class GradeSchema(ma.SQLAlchemyAutoSchema):
     class Meta:
         model = Grade
         load_instance = True
-        exclude = ('date', 'time')
 
     teacher_id = fields.Int(
         required=True,
@@ -55,4 +54,19 @@ class GradeSchema(ma.SQLAlchemyAutoSchema):
         'TeacherSchema',
         only=('first_name', 'last_name'),
         dump_only=True
+    )
+
+
+class GradeBatchSchema(Schema):
+    """
+    Envelope for batch grading requests.
+
+    Each item is validated against GradeSchema by the service,
+    so a single invalid grade does not reject the whole batch.
+    """
+
+    grades = fields.List(
+        fields.Dict(),
+        required=True,
+        validate=validate.Length(min=1, error="grades cannot be empty")
     )
\ No newline at end of file
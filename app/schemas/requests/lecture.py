@@ -1,11 +1,12 @@
-from marshmallow import fields, validate
+from marshmallow import Schema, ValidationError, fields, validate, validates
 
+from app.constants import ValidationConstants
 from app.extensions import ma
 from app.models import Lecture
-from app.schemas import NameSchema
+from .base import NameSchema, RelationshipCount, CompiledDumpMixin
 
 
-class LectureSchema(NameSchema, ma.SQLAlchemyAutoSchema):
+class LectureSchema(CompiledDumpMixin, NameSchema, ma.SQLAlchemyAutoSchema):
     """
     Schema for Lecture model with content validation and relationships.
 
@@ -38,7 +39,50 @@ class LectureSchema(NameSchema, ma.SQLAlchemyAutoSchema):
         dump_only=True
     )
 
-    exercises_count = fields.Function(
-        lambda obj: len(obj.exercises),
-        dump_only=True
+    exercises_count = RelationshipCount('exercises')
+
+    @validates('name')
+    def validate_name_not_reserved(self, value: str) -> None:
+        if value in ValidationConstants.Name.RESERVED_LECTURE_NAMES:
+            raise ValidationError(ValidationConstants.Name.ERROR_MESSAGES['reserved'].format(name=value))
+
+
+class LectureCreateSchema(LectureSchema):
+    """
+    Schema LectureService loads new lectures with.
+
+    Adds the foreign keys the service sets from the route's course and the
+    current teacher. Client payloads are validated with LectureSchema, which
+    rejects these keys, so a lecture cannot be created in or moved to another course.
+    """
+
+    class Meta(LectureSchema.Meta):
+        pass
+
+    course_id = fields.Int(load_only=True)
+    teacher_id = fields.Int(load_only=True)
+
+
+class LectureBulkSchema(Schema):
+    """
+    Envelope for bulk lecture create/update requests.
+
+    Each item is validated against LectureSchema by the service,
+    so a single invalid lecture does not reject the whole batch.
+    """
+
+    lectures = fields.List(
+        fields.Dict(),
+        required=True,
+        validate=validate.Length(min=1, error="lectures cannot be empty")
+    )
+
+
+class LectureBulkDeleteSchema(Schema):
+    """Schema for bulk lecture deletion by name."""
+
+    names = fields.List(
+        fields.Str(),
+        required=True,
+        validate=validate.Length(min=1, error="names cannot be empty")
     )
\ No newline at end of file
@@ -0,0 +1,36 @@
+from marshmallow import Schema, fields, validate
+
+from app.constants import GeneralConstants
+
+
+__all__ = [
+    'PaginationSchema'
+]
+
+
+class PaginationSchema(Schema):
+    """
+    Schema for list endpoint query parameters.
+
+    cursor: id of the last item of the previous page (keyset pagination)
+    limit: page size, bounded by GeneralConstants.Pagination.MAX_PAGE_SIZE
+    stream: stream the whole list item by item instead of returning one page
+    """
+
+    cursor = fields.Int(
+        validate=validate.Range(
+            min=1,
+            error="Cursor must be positive"
+        )
+    )
+
+    limit = fields.Int(
+        validate=validate.Range(
+            min=1,
+            max=GeneralConstants.Pagination.MAX_PAGE_SIZE,
+            error=f"Limit must be between 1 and {GeneralConstants.Pagination.MAX_PAGE_SIZE}"
+        ),
+        missing=GeneralConstants.Pagination.DEFAULT_PAGE_SIZE
+    )
+
+    stream = fields.Bool(missing=False)
@@ -2,7 +2,7 @@ from marshmallow import fields
 
 from app.extensions import ma
 from app.models import Student
-from app.schemas import PersonSchema
+from .base import PersonSchema
 
 
 class StudentSchema(PersonSchema, ma.SQLAlchemyAutoSchema):
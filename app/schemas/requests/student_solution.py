@@ -1,7 +1,7 @@
 from marshmallow import fields, validate
 
 from app.extensions import ma
-from app.constants import GeneralConstants
+from app.constants import GeneralConstants, ModelConstants
 from app.models import StudentSolution
 
 
@@ -19,7 +19,6 @@ class StudentSolutionSchema(ma.SQLAlchemyAutoSchema):
     class Meta:
         model= StudentSolution
         load_instance = True
-        exclude = ('date', 'time')
 
     student_id = fields.Int(
         required=True,
@@ -37,6 +36,10 @@ class StudentSolutionSchema(ma.SQLAlchemyAutoSchema):
             validate.Length(
                 min=1,
                 error="content cannot be empty"
+            ),
+            validate.Length(
+                max=ModelConstants.StringLength.MAX_SOLUTION_CONTENT,
+                error="content must not exceed {max} characters"
             )
         ]
     )
@@ -1,8 +1,9 @@
 from app import ma
 from app.models import User
+from app.schemas import CompiledDumpMixin
 
 
-class UserPublicSchema(ma.Schema):
+class UserPublicSchema(CompiledDumpMixin, ma.Schema):
     class Meta:
         model = User
         fields = ('id', 'email', 'role')
\ No newline at end of file
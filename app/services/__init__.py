@@ -1,9 +1,19 @@
 from .db import DatabaseService
 from .crud import CRUDService
-from .login_record import LoginRecordService
+from .cache import CacheBackend, LRUCacheBackend, RedisCacheBackend, ResponseCache
+from .principal import Principal, PrincipalService
+from .login_record import LoginRecordBuffer, LoginRecordService
 from .token import TokenService
+from .smtp_pool import SMTPConnectionPool
+from .email_queue import EmailQueue, SyncEmailQueue, ThreadPoolEmailQueue, OutboxEmailQueue
 from .email import EmailService
 from .user import UserService
 from .auth import AuthService
 from .course import CourseService
-from .lecture import LectureService
\ No newline at end of file
+from .gradebook import GradebookService
+from .lecture import LectureService
+from .enrollment import EnrollmentService
+from .exercise import ExerciseService
+from .submission import SubmissionService
+from .grading import GradingService
+from .retention import RetentionService
\ No newline at end of file
@@ -154,6 +154,7 @@ class AuthService:
         Args:
             data: Dict with 'current_password' and 'new_password'
         """
-        if not verify_password(current_user.password, data['current_password']):
+        user = current_user.user
+        if not verify_password(user.password, data['current_password']):
             raise Unauthorized("Current password is incorrect")
-        self._user_service.update_user_password(current_user, data['new_password'])
\ No newline at end of file
+        self._user_service.update_user_password(user, data['new_password'])
\ No newline at end of file
@@ -0,0 +1,188 @@
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime
+from http import HTTPStatus
+from typing import Any, Callable, Iterable, Optional
+
+import pytz
+from flask import Response
+
+from app.constants import GeneralConstants
+from app.utils import json_response
+
+
+class CacheBackend(ABC):
+    """
+    Storage used by ResponseCache.
+
+    Besides plain expiring entries, a backend keeps counters that are
+    never evicted - ResponseCache uses them as namespace generations.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Return the value stored under `key`, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl: int) -> None:
+        """Store `value` under `key` for `ttl` seconds."""
+
+    @abstractmethod
+    def get_counters(self, keys: list[str]) -> list[int]:
+        """Return the current value of each counter (0 if it was never incremented)."""
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """Increment a counter and return its new value."""
+
+
+class LRUCacheBackend(CacheBackend):
+    """
+    In-process cache with a bounded number of entries and per-entry expiry.
+
+    Each worker process has its own copy, so an invalidation only reaches the
+    process that made the write - other workers serve their entry until it
+    expires. Use RedisCacheBackend when running several workers.
+    """
+
+    def __init__(self, max_entries: int = GeneralConstants.Cache.MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def get_counters(self, keys: list[str]) -> list[int]:
+        with self._lock:
+            return [self._counters.get(key, 0) for key in keys]
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache shared by all worker processes, stored in Redis.
+
+    Works with any client exposing the redis-py `get`/`set`/`mget`/`incr`
+    API, so a local stand-in (e.g. fakeredis) can be passed in tests.
+    """
+
+    def __init__(self, client: Any) -> None:
+        self._client = client
+
+    @classmethod
+    def from_url(cls, url: str) -> 'RedisCacheBackend':
+        import redis  # optional dependency, only needed for this backend
+
+        return cls(redis.Redis.from_url(url))
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._client.get(key)
+        return value.decode('utf-8') if isinstance(value, bytes) else value
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        self._client.set(key, value, ex=ttl)
+
+    def get_counters(self, keys: list[str]) -> list[int]:
+        return [int(value or 0) for value in self._client.mget(keys)]
+
+    def incr(self, key: str) -> int:
+        return self._client.incr(key)
+
+
+class ResponseCache:
+    """
+    Caches successful JSON responses of read-heavy routes.
+
+    Entries are grouped into namespaces (e.g. all course lists, or one course).
+    Each namespace has a generation counter that is part of the entry keys, so
+    invalidating a namespace is a single increment - the old entries are never
+    read again and simply age out.
+    """
+
+    _GENERATION_PREFIX = "generation:"
+    _UNCACHED_HEADERS = frozenset({'Content-Type', 'Content-Length'})
+
+    def __init__(self, backend: CacheBackend, ttl: int = GeneralConstants.Cache.TTL_SECONDS) -> None:
+        self._backend = backend
+        self._ttl = ttl
+
+    def get_or_compute(self, namespaces: list[str], key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached response for `key`, or compute and cache it.
+
+        Args:
+            namespaces: Namespaces the response depends on
+            key: Identifies the response within its namespaces
+            compute: Produces the response - a JSON `Response` as returned by `success_response`.
+                Only 200 responses are cached, as their encoded body plus headers, so a hit
+                is served without encoding the body again. A response with an Expires
+                header is not cached past it.
+        """
+        versioned_key = f"{self.version(namespaces)}|{key}"
+
+        cached = self._backend.get(versioned_key)
+        if cached is not None:
+            headers, body = cached.split("\n", 1)
+            return json_response(body, HTTPStatus.OK, json.loads(headers))
+
+        response = compute()
+        if isinstance(response, Response) and response.status_code == HTTPStatus.OK and response.is_json \
+                and not response.is_streamed:
+            ttl = self._entry_ttl(response)
+            if ttl > 0:
+                headers = {
+                    name: value for name, value in response.headers.items()
+                    if name not in self._UNCACHED_HEADERS
+                }
+                self._backend.set(versioned_key, f"{json.dumps(headers)}\n{response.get_data(as_text=True)}", ttl)
+        return response
+
+    def _entry_ttl(self, response: Response) -> int:
+        if response.expires is None:
+            return self._ttl
+        return min(self._ttl, int((response.expires - datetime.now(pytz.utc)).total_seconds()))
+
+    def version(self, namespaces: list[str]) -> str:
+        """Current version of a set of namespaces - changes whenever one of them is invalidated."""
+        generations = self._backend.get_counters([self._GENERATION_PREFIX + namespace for namespace in namespaces])
+        return ",".join(f"{namespace}:{generation}" for namespace, generation in zip(namespaces, generations))
+
+    def invalidate(self, *namespaces: str) -> None:
+        for namespace in namespaces:
+            self._backend.incr(self._GENERATION_PREFIX + namespace)
+
+    def invalidate_course(self, *course_names: Optional[str]) -> None:
+        """Invalidate the course lists and the given courses' details."""
+        self.invalidate(
+            GeneralConstants.Cache.COURSES_NAMESPACE,
+            *self.course_namespaces(*course_names)
+        )
+
+    @staticmethod
+    def course_namespaces(*course_names: Optional[str]) -> list[str]:
+        return [GeneralConstants.Cache.COURSE_NAMESPACE.format(name=name) for name in course_names if name]
\ No newline at end of file
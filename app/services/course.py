@@ -1,48 +1,94 @@
-from typing import List
+from bisect import bisect_right
+from datetime import datetime
+from typing import Iterator, List, Optional, Sequence
 
+import pytz
 from flask_login import current_user
+from marshmallow import Schema
+from sqlalchemy.orm import Load
 from werkzeug.exceptions import Forbidden, Conflict, NotFound
 
-from app.models import Course
-from app.schemas import CourseWriteSchema
-from app.services import CRUDService
+from app.constants import GeneralConstants
+from app.extensions import db
+from app.models import Course, Student, Teacher
+from app.services import CRUDService, PrincipalService, ResponseCache
+from app.utils import as_utc, build_loader_options
 
 
 class CourseService:
     def __init__(
             self,
             crud_service: CRUDService,
-            course_write_schema: CourseWriteSchema
+            principal_service: PrincipalService,
+            response_cache: ResponseCache
     ) -> None:
         self._crud_service = crud_service
-        self._course_write_schema = course_write_schema
+        self._principal_service = principal_service
+        self._response_cache = response_cache
 
 
     # get courses service
-    def get_accessible_courses(self) -> List[Course]:
+    def get_accessible_courses(
+            self,
+            schema: Optional[Schema] = None,
+            after_id: Optional[int] = None,
+            limit: int = GeneralConstants.Pagination.DEFAULT_PAGE_SIZE
+    ) -> List[Course]:
         """
-        Get courses based on user role.
+        Get one page of courses based on user role.
+
+        Args:
+            schema: Schema that will dump the result. Every relationship it nests
+                is eager-loaded, so the dump runs a fixed number of queries
+                regardless of how many courses are returned.
+            after_id: Cursor - id of the last course of the previous page
+            limit: Maximum number of courses to return
 
         Returns:
-            List of courses according to user's role and permissions:
+            List of courses, ordered by id, according to user's role and permissions:
             - Admin: All courses
             - Teacher: Courses they teach
             - Student: Courses they are enrolled in
         """
-        if current_user.is_admin:
-            return self._fetch_all_courses()
-        if current_user.is_teacher:
-            return self._fetch_teacher_courses()
-        return self._fetch_student_courses()
+        return self._crud_service.find_page(
+            Course,
+            *self._accessible_courses_filters(),
+            after_id=after_id,
+            limit=limit,
+            options=self._loader_options(schema)
+        )
+
+    def stream_accessible_courses(
+            self,
+            schema: Optional[Schema] = None,
+            after_id: Optional[int] = None
+    ) -> Iterator[Course]:
+        """
+        Lazily iterate over all courses accessible to the user.
 
-    def _fetch_all_courses(self) -> List[Course]:
-        return self._crud_service.find_all(Course)
+        Courses are fetched in fixed-size batches, so memory usage stays flat
+        no matter how many courses the user can access.
 
-    def _fetch_teacher_courses(self) -> List[Course]:
-        return current_user.teacher.courses
+        Args:
+            schema: Schema that will dump the result (see `get_accessible_courses`)
+            after_id: Cursor - start after the course with this id
+        """
+        return self._crud_service.iter_all(
+            Course,
+            *self._accessible_courses_filters(),
+            after_id=after_id,
+            options=self._loader_options(schema)
+        )
+
+    def _accessible_courses_filters(self) -> tuple:
+        if current_user.is_admin:
+            return ()
+        if current_user.is_teacher:
+            return (Course.teachers.any(Teacher.id == current_user.teacher_id),)
+        return (Course.students.any(Student.id == current_user.student_id),)
 
-    def _fetch_student_courses(self) -> List[Course]:
-        return current_user.student.courses
+    def _loader_options(self, schema: Optional[Schema]) -> List[Load]:
+        return build_loader_options(Course, schema) if schema else []
 
 
     # create course service
@@ -51,7 +97,7 @@ class CourseService:
         Create a new course.
 
         Args:
-            data: Dict with 'name'
+            data: Loaded course data, with 'name'
 
         Returns:
             The newly created course.
@@ -60,16 +106,20 @@ class CourseService:
             Conflict: If course with same name already exists
         """
         self._verify_course_name_available(data['name'])
-        return self._crud_service.create(data, self._course_write_schema)
+        course = self._crud_service.add(Course(**data))
+        self._response_cache.invalidate_course(course.name)
+        return course
 
 
     # get course service
-    def get_course_by_name(self, course_name: str) -> Course:
+    def get_course_by_name(self, course_name: str, schema: Optional[Schema] = None) -> Course:
         """
         Get course by name with appropriate access control.
 
         Args:
             course_name: The unique name of the course.
+            schema: Schema that will dump the course. Every relationship it nests
+                is eager-loaded, so the dump runs a fixed number of queries.
 
         Returns:
             Course object with appropriate level of detail
@@ -78,10 +128,29 @@ class CourseService:
             NotFound: If course doesn't exist.
             Forbidden: If user doesn't have access to the course.
         """
-        course = self._get_course_by_name_or_404(course_name)
+        course = self._get_course_by_name_or_404(course_name, options=self._loader_options(schema))
         self._verify_course_access(course)
         return course
 
+    @staticmethod
+    def exercise_deadlines(*courses: Course) -> tuple[list[datetime], list[datetime]]:
+        """
+        Split the exercise deadlines of courses into passed and upcoming ones, both sorted.
+
+        A passing deadline reveals the exercise's teacher solution, so it changes the
+        course's representation without a write or a version bump. Reads the loaded
+        lectures and exercises - pass courses fetched with the dumping schema.
+        """
+        deadlines = sorted(
+            as_utc(exercise.target_date)
+            for course in courses
+            for lecture in course.lectures
+            for exercise in lecture.exercises
+            if exercise.target_date
+        )
+        passed = bisect_right(deadlines, datetime.now(pytz.utc))
+        return deadlines[:passed], deadlines[passed:]
+
     def _verify_course_access(self, course: Course) -> None:
         if not self._has_course_access(course):
             raise Forbidden("You don't have access to this course")
@@ -89,9 +158,7 @@ class CourseService:
     def _has_course_access(self, course: Course) -> bool:
         if current_user.is_admin:
             return True
-        if current_user.is_teacher:
-            return course in current_user.teacher.courses
-        return course in current_user.student.courses
+        return course.id in current_user.course_ids
 
 
     # update course service
@@ -113,7 +180,9 @@ class CourseService:
         course = self._get_course_by_name_or_404(course_name)
         if 'name' in data and course.name != data['name']:
             self._verify_course_name_available(data['name'])
+            self.touch_course(course)
             self._crud_service.update(course, **data)
+            self._response_cache.invalidate_course(course_name, course.name)
         return course
 
 
@@ -135,11 +204,28 @@ class CourseService:
         """
         course = self._get_course_by_name_or_404(course_name)
         self._crud_service.delete(course)
+        self._principal_service.invalidate_all()
+        self._response_cache.invalidate_course(course_name)
 
 
-    def _get_course_by_name_or_404(self, course_name: str) -> Course:
+    def touch_course(self, course: Course) -> None:
+        """
+        Record that a course's data changed (itself, its lectures or its enrollments).
+
+        Bumps the version and modification time used for ETag / Last-Modified.
+        Does not commit - call it before the commit of the change it records.
+        """
+        self._crud_service.update_by_filters(
+            Course,
+            Course.id == course.id,
+            version=Course.version + 1,
+            modified_at=db.func.now()
+        )
+
+    def _get_course_by_name_or_404(self, course_name: str, options: Sequence[Load] = ()) -> Course:
         return self._crud_service.find_one_by_fields_or_raise(
             model=Course,
+            options=options,
             name=course_name,
             exception=NotFound,
             error_msg=f"Course '{course_name}' not found"
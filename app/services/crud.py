@@ -1,10 +1,15 @@
-from typing import Type, TypeVar, Optional
+from typing import Callable, Type, TypeVar, Optional, Sequence, Iterator
 
 from marshmallow import Schema
+from sqlalchemy import Row, Select
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm import Load
 from werkzeug.exceptions import NotFound, Conflict
 
+from app.constants import GeneralConstants
 from app.extensions import db
 from app.services import DatabaseService
+from app.utils import load_each
 
 T = TypeVar('T')
 
@@ -13,28 +18,54 @@ class CRUDService:
     """
     Base service for CRUD operations.
     Provides generic functionality for reading, creating, updating and deleting records.
+
+    Read methods go to the read replica when one is configured (see `RoutingSession`
+    for when they stay on the primary); writes always go to the primary.
+    A read that decides a later write must run inside `DatabaseService.primary()`
+    or `transaction()`; `validate_no_record_by_fields` always reads the primary.
     """
     def __init__(self, db_service: DatabaseService) -> None:
         self._db_service = db_service
 
     # Read operations
-    def find_all(self, model: Type[T]) -> list[T]:
-        return model.query.all()
+    def find_all(self, model: Type[T], options: Sequence[Load] = ()) -> list[T]:
+        with self._db_service.read_replica():
+            return model.query.options(*options).all()
 
-    def find_one_by_fields(self, model: Type[T], **filters) -> Optional[T]:
-        return model.query.filter_by(**filters).first()
+    def find_one_by_fields(self, model: Type[T], options: Sequence[Load] = (), **filters) -> Optional[T]:
+        with self._db_service.read_replica():
+            return model.query.filter_by(**filters).options(*options).first()
 
     def find_many_by_fields(self, model: Type[T], **filters) -> list[T]:
-        return model.query.filter_by(**filters).all()
+        with self._db_service.read_replica():
+            return model.query.filter_by(**filters).all()
+
+    def find_values(self, column, *filters) -> list:
+        with self._db_service.read_replica():
+            return db.session.scalars(db.select(column).where(*filters)).all()
+
+    def find_rows(self, columns: Sequence, *filters) -> list[tuple]:
+        with self._db_service.read_replica():
+            return db.session.execute(db.select(*columns).where(*filters)).all()
+
+    def find_rows_by_query(self, statement: Select) -> list[Row]:
+        """Run a hand-built SELECT (joins, aggregates) and return its rows."""
+        with self._db_service.read_replica():
+            return db.session.execute(statement).all()
+
+    def exists_by_fields(self, model: Type[T], **filters) -> bool:
+        with self._db_service.read_replica():
+            return db.session.query(model.query.filter_by(**filters).exists()).scalar()
 
     def find_one_by_fields_or_raise(
             self,
             model: Type[T],
             exception: Type[Exception] = NotFound,
             error_msg: str = "Record not found",
+            options: Sequence[Load] = (),
             **filters
     ) -> T:
-        item = self.find_one_by_fields(model, **filters)
+        item = self.find_one_by_fields(model, options=options, **filters)
         if not item:
             raise exception(error_msg)
         return item
@@ -46,19 +77,187 @@ class CRUDService:
             error_msg: str = "Record already exists",
             **filters
     ) -> None:
-        item = self.find_one_by_fields(model, **filters)
+        with self._db_service.primary():
+            item = self.find_one_by_fields(model, **filters)
         if item:
             raise exception(error_msg)
 
     def find_one_by_advanced_filters(self, model: Type[T], *filters) -> Optional[T]:
-        return model.query.filter(*filters).first()
+        with self._db_service.read_replica():
+            return model.query.filter(*filters).first()
+
+    def find_many_by_advanced_filters(
+            self,
+            model: Type[T],
+            *filters,
+            options: Sequence[Load] = ()
+    ) -> list[T]:
+        with self._db_service.read_replica():
+            return model.query.filter(*filters).options(*options).all()
+
+    def find_page(
+            self,
+            model: Type[T],
+            *filters,
+            after_id: Optional[int] = None,
+            limit: int = GeneralConstants.Pagination.DEFAULT_PAGE_SIZE,
+            options: Sequence[Load] = (),
+            skip_locked: bool = False
+    ) -> list[T]:
+        """
+        Fetch one page of records using keyset pagination on the primary key.
+
+        Args:
+            model: Model class to query
+            filters: SQLAlchemy filter expressions
+            after_id: Cursor - only records with a greater id are returned
+            limit: Maximum number of records in the page
+            options: Loader options applied to the query
+            skip_locked: Lock the returned rows with SELECT ... FOR UPDATE SKIP LOCKED, so
+                concurrent workers get different rows. Call it inside a transaction.
+
+        Returns:
+            Up to `limit` records ordered by id
+        """
+        query = model.query.filter(*filters)
+        if after_id is not None:
+            query = query.filter(model.id > after_id)
+        if skip_locked:
+            query = query.with_for_update(skip_locked=True)
+        with self._db_service.read_replica():
+            return query.order_by(model.id).limit(limit).options(*options).all()
+
+    def iter_all(
+            self,
+            model: Type[T],
+            *filters,
+            after_id: Optional[int] = None,
+            batch_size: int = GeneralConstants.Pagination.STREAM_BATCH_SIZE,
+            options: Sequence[Load] = ()
+    ) -> Iterator[T]:
+        """
+        Iterate over all matching records, fetching them page by page.
+
+        Only one batch is held in memory at a time, so the cost of
+        consuming the iterator does not grow with the table size.
+        """
+        while True:
+            page = self.find_page(model, *filters, after_id=after_id, limit=batch_size, options=options)
+            yield from page
+            if len(page) < batch_size:
+                return
+            after_id = page[-1].id
 
     # Create operations
     def create(self, data: dict, schema: Schema) -> T:
         new_item = schema.load(data)
-        db.session.add(new_item)
+        return self.add(new_item)
+
+    def add(self, obj: T) -> T:
+        db.session.add(obj)
+        self._db_service.commit()
+        return obj
+
+    def add_all(self, objs: list[T]) -> list[T]:
+        db.session.add_all(objs)
         self._db_service.commit()
-        return new_item
+        return objs
+
+    def create_many(
+            self,
+            items: list[dict],
+            schema: Schema,
+            chunk_size: int = GeneralConstants.Batch.CHUNK_SIZE,
+            on_write: Optional[Callable[[], None]] = None
+    ) -> tuple[list[T], dict[int, dict]]:
+        """
+        Validate and create many records in a single transaction.
+
+        Invalid items are reported and skipped, the valid ones are still created.
+        Records are written with executemany INSERTs instead of one INSERT per
+        object, so the returned records are not attached to the session and do
+        not carry database-generated values (ids, defaults).
+
+        Args:
+            items: Raw data, one dict per record
+            schema: Schema loading one record; each item is loaded once
+            chunk_size: Number of records flushed to the database at a time
+            on_write: Called inside the transaction after at least one record was written,
+                for related changes that must commit together with the records
+
+        Returns:
+            Tuple of (created records, validation errors keyed by the item's index in `items`)
+        """
+        loaded, errors = load_each(schema, items)
+        if not loaded:
+            return [], errors
+        new_items = list(loaded.values())
+
+        with self._db_service.transaction():
+            for chunk in self._chunks(new_items, chunk_size):
+                db.session.bulk_save_objects(chunk)
+            if on_write:
+                on_write()
+
+        return new_items, errors
+
+    def insert_rows(self, model: Type[T], rows: list[dict], ignore_duplicates: bool = False) -> None:
+        """
+        Insert plain row dicts with a single executemany INSERT, bypassing the ORM unit of work.
+
+        Does not commit - call it inside `DatabaseService.transaction()`.
+
+        Args:
+            model: Model class whose table receives the rows
+            rows: Column values, one dict per row
+            ignore_duplicates: Skip rows that violate a unique constraint
+                (INSERT IGNORE on MySQL, INSERT OR IGNORE on SQLite)
+        """
+        if not rows:
+            return
+
+        statement = db.insert(model)
+        if ignore_duplicates:
+            statement = statement.prefix_with('IGNORE', dialect='mysql').prefix_with('OR IGNORE', dialect='sqlite')
+        db.session.execute(statement, rows)
+
+    def upsert(
+            self,
+            model: Type[T],
+            values: dict | list[dict],
+            conflict_columns: Sequence[str],
+            update_columns: Sequence[str]
+    ) -> None:
+        """
+        Insert rows, updating the existing row instead when a row violates a unique key.
+
+        Runs as a single atomic statement (INSERT ... ON DUPLICATE KEY UPDATE on MySQL,
+        INSERT ... ON CONFLICT DO UPDATE on PostgreSQL/SQLite), so concurrent writers
+        never race between a read and a write. Does not commit.
+
+        Args:
+            model: Model class whose table receives the rows
+            values: Column values of one row, or a list of rows
+            conflict_columns: Columns of the unique key that detects an existing row
+                (MySQL matches any unique key)
+            update_columns: Columns overwritten with the new values on conflict
+        """
+        dialect = db.session.get_bind(mapper=model).dialect.name
+
+        if dialect == 'mysql':
+            statement = mysql.insert(model).values(values)
+            statement = statement.on_duplicate_key_update(
+                {column: statement.inserted[column] for column in update_columns}
+            )
+        else:
+            insert = postgresql.insert if dialect == 'postgresql' else sqlite.insert
+            statement = insert(model).values(values)
+            statement = statement.on_conflict_do_update(
+                index_elements=list(conflict_columns),
+                set_={column: statement.excluded[column] for column in update_columns}
+            )
+
+        db.session.execute(statement)
 
     # Update operations
     def update(self, obj: T, **filters) -> None:
@@ -67,7 +266,118 @@ class CRUDService:
                 setattr(obj, key, value)
         self._db_service.commit()
 
+    def update_many(
+            self,
+            items: list[tuple[T, dict]],
+            schema: Schema,
+            chunk_size: int = GeneralConstants.Batch.CHUNK_SIZE,
+            on_write: Optional[Callable[[], None]] = None
+    ) -> tuple[list[T], dict[int, dict]]:
+        """
+        Validate and apply partial updates to many records in a single transaction.
+
+        Args:
+            items: (record, fields to update) pairs
+            schema: Schema loading the updates (with `partial=True`) into dicts; each update is loaded once
+            chunk_size: Number of records flushed to the database at a time
+            on_write: Called inside the transaction after at least one record was updated
+
+        Returns:
+            Tuple of (updated records, validation errors keyed by the item's index in `items`)
+        """
+        loaded, errors = load_each(schema, [data for _, data in items], partial=True)
+        valid_items = [(items[index][0], data) for index, data in loaded.items()]
+        if not valid_items:
+            return [], errors
+
+        with self._db_service.transaction():
+            for chunk in self._chunks(valid_items, chunk_size):
+                for obj, data in chunk:
+                    for key, value in data.items():
+                        # checked on the class, so deferred columns are not loaded just to be overwritten
+                        if hasattr(type(obj), key):
+                            setattr(obj, key, value)
+                db.session.flush()
+            if on_write:
+                on_write()
+
+        return [obj for obj, _ in valid_items], errors
+
+    def update_by_filters(self, model: Type[T], *filters, **values) -> int:
+        """
+        Update all matching records with one set-based UPDATE statement. Does not commit.
+
+        Returns:
+            Number of updated records
+        """
+        return db.session.execute(
+            db.update(model).where(*filters).values(**values),
+            execution_options={'synchronize_session': False}
+        ).rowcount
+
     # Delete operations
     def delete(self, obj: T) -> None:
         db.session.delete(obj)
-        self._db_service.commit()
\ No newline at end of file
+        self._db_service.commit()
+
+    def delete_many(
+            self,
+            objs: list[T],
+            chunk_size: int = GeneralConstants.Batch.CHUNK_SIZE,
+            on_write: Optional[Callable[[], None]] = None
+    ) -> None:
+        """
+        Delete many records in a single transaction.
+
+        Records go through the ORM, so relationship cascades still apply.
+        `on_write` is called inside the transaction after the records were deleted, if there were any.
+        """
+        if not objs:
+            return
+
+        with self._db_service.transaction():
+            for chunk in self._chunks(objs, chunk_size):
+                for obj in chunk:
+                    db.session.delete(obj)
+                db.session.flush()
+            if on_write:
+                on_write()
+
+    def delete_by_filters(self, model: Type[T], *filters) -> int:
+        """
+        Delete all matching records with one set-based DELETE statement. Does not commit.
+
+        Returns:
+            Number of deleted records
+        """
+        return db.session.execute(
+            db.delete(model).where(*filters),
+            execution_options={'synchronize_session': False}
+        ).rowcount
+
+    def delete_in_batches(self, model: Type[T], *filters, batch_size: int) -> int:
+        """
+        Delete all matching records, `batch_size` rows per transaction.
+
+        Keeps each transaction (and the locks it holds) small on large tables.
+
+        Returns:
+            Number of deleted records
+        """
+        deleted = 0
+        while True:
+            with self._db_service.primary():
+                ids = db.session.scalars(
+                    db.select(model.id).where(*filters).order_by(model.id).limit(batch_size)
+                ).all()
+            if not ids:
+                return deleted
+
+            db.session.execute(db.delete(model).where(model.id.in_(ids)))
+            self._db_service.commit()
+            deleted += len(ids)
+
+    @staticmethod
+    def _chunks(items: list, chunk_size: int) -> Iterator[list]:
+        for start in range(0, len(items), chunk_size):
+            yield items[start:start + chunk_size]
\ No newline at end of file
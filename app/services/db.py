@@ -4,7 +4,7 @@ from app.extensions import db
 
 
 class DatabaseService:
-    """Manages database transactions."""
+    """Manages database transactions and which database (primary / read replica) queries go to."""
 
     def commit(self) -> None:
         try:
@@ -18,9 +18,29 @@ class DatabaseService:
 
     @contextmanager
     def transaction(self):
-        try:
+        """Run a unit of work on the primary - reads inside it never go to the replica."""
+        with db.session().primary_only():
+            try:
+                yield
+                self.commit()
+            except Exception as err:
+                self.rollback()
+                raise err
+
+    @contextmanager
+    def primary(self):
+        """
+        Keep the reads inside the block on the primary.
+
+        Use it around any read whose result decides what gets written (uniqueness checks,
+        token state, the rows a job is about to process) - a lagging replica would make
+        the write act on stale data.
+        """
+        with db.session().primary_only():
             yield
-            self.commit()
-        except Exception as err:
-            self.rollback()
-            raise err
\ No newline at end of file
+
+    @contextmanager
+    def read_replica(self):
+        """Send the reads inside the block to the read replica, when one is configured and safe to use."""
+        with db.session().using_replica():
+            yield
\ No newline at end of file
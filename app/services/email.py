@@ -2,13 +2,21 @@ from typing import Optional, List
 
 from flask_mail import Message
 
-from app.extensions import mail
 from app.constants import GeneralConstants
+from app.services.email_queue import EmailQueue
 from config import Config
 
 
 class EmailService:
-    """Service for handling all email communications."""
+    """
+    Service for handling all email communications.
+
+    Messages are handed to an EmailQueue, which decides when and how
+    they are delivered (inline, from a thread pool or via the outbox table).
+    """
+
+    def __init__(self, email_queue: EmailQueue) -> None:
+        self._email_queue = email_queue
 
     def send_email(
             self,
@@ -21,7 +29,7 @@ class EmailService:
             reply_to: Optional[str] = None
     ) -> None:
         """
-        Send an email using Flask-Mail.
+        Queue an email for delivery using Flask-Mail.
 
         Args:
             subject: Email subject line
@@ -42,7 +50,40 @@ class EmailService:
             bcc=bcc,
             reply_to=reply_to
         )
-        mail.send(msg)
+        self._email_queue.enqueue(msg)
+
+    def send_bulk(
+            self,
+            subject: str,
+            body: str,
+            recipients: List[str],
+            sender: Optional[str] = None,
+            reply_to: Optional[str] = None
+    ) -> None:
+        """
+        Queue the same email for many recipients, one message each.
+
+        The batch is delivered over a single pooled SMTP connection,
+        so announcing to a whole course costs one handshake instead of one per student.
+
+        Args:
+            subject: Email subject line
+            body: Email content
+            recipients: Recipient email addresses
+            sender: Override default sender address
+            reply_to: Reply-to email address
+        """
+        messages = [
+            Message(
+                subject=subject,
+                recipients=[recipient],
+                body=body,
+                sender=sender or Config.MAIL_DEFAULT_SENDER,
+                reply_to=reply_to
+            )
+            for recipient in recipients
+        ]
+        self._email_queue.enqueue_many(messages)
 
     def send_password_reset_token(self, email: str, token: str) -> None:
         """
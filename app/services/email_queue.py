@@ -0,0 +1,232 @@
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from smtplib import SMTPDataError, SMTPException, SMTPRecipientsRefused, SMTPSenderRefused
+from typing import Iterable
+
+import pytz
+from flask import Flask, current_app
+from flask_mail import Message
+
+from app.constants import GeneralConstants, ModelConstants
+from app.models import EmailOutbox
+from app.services import CRUDService, DatabaseService
+from app.services.smtp_pool import SMTPConnectionPool
+
+
+class EmailQueue(ABC):
+    """
+    Delivery backend used by EmailService.
+
+    Decouples building an email from handing it to the SMTP server,
+    so requests do not have to wait for the SMTP round trip.
+    """
+
+    @abstractmethod
+    def enqueue(self, message: Message) -> None:
+        """Schedule a message for delivery."""
+
+    def enqueue_many(self, messages: Iterable[Message]) -> None:
+        """Schedule a batch of messages for delivery."""
+        for message in messages:
+            self.enqueue(message)
+
+
+class SyncEmailQueue(EmailQueue):
+    """Deliver messages immediately, in the calling thread."""
+
+    def __init__(self, smtp_pool: SMTPConnectionPool) -> None:
+        self._smtp_pool = smtp_pool
+
+    def enqueue(self, message: Message) -> None:
+        self._smtp_pool.send(message)
+
+    def enqueue_many(self, messages: Iterable[Message]) -> None:
+        self._smtp_pool.send_many(messages)
+
+
+class ThreadPoolEmailQueue(EmailQueue):
+    """
+    Deliver messages from an in-process thread pool.
+
+    A batch is sent over a single pooled connection. A message the server
+    rejects (e.g. a refused recipient) is logged and skipped; connection
+    failures are retried with exponential backoff, resuming from the first
+    unsent message.
+    Messages still queued when the process exits are lost - use
+    OutboxEmailQueue when delivery must survive restarts.
+    """
+
+    def __init__(
+            self,
+            smtp_pool: SMTPConnectionPool,
+            max_workers: int = GeneralConstants.Email.QUEUE_WORKERS,
+            max_retries: int = GeneralConstants.Email.MAX_RETRIES,
+            retry_backoff: float = GeneralConstants.Email.RETRY_BACKOFF_SECONDS
+    ) -> None:
+        self._smtp_pool = smtp_pool
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='email')
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
+
+    def enqueue(self, message: Message) -> None:
+        self.enqueue_many([message])
+
+    def enqueue_many(self, messages: Iterable[Message]) -> None:
+        app = current_app._get_current_object()
+        self._executor.submit(self._deliver, app, deque(messages))
+
+    def _deliver(self, app: Flask, pending: deque[Message]) -> None:
+        with app.app_context():
+            for attempt in range(self._max_retries + 1):
+                try:
+                    with self._smtp_pool.connection() as connection:
+                        while pending:
+                            try:
+                                connection.send(pending[0])
+                            except (SMTPRecipientsRefused, SMTPSenderRefused, SMTPDataError) as err:
+                                # the server rejected this message - retrying will not help
+                                app.logger.error("Email to %s rejected: %s", pending[0].recipients, err)
+                            pending.popleft()
+                    return
+                except (SMTPException, OSError) as err:
+                    if attempt == self._max_retries:
+                        app.logger.error("Delivery of %d email(s) failed: %s", len(pending), err)
+                        return
+                    time.sleep(self._retry_backoff * 2 ** attempt)
+
+
+class OutboxEmailQueue(EmailQueue):
+    """
+    Persist messages to the email_outbox table for delivery by a separate worker.
+
+    `deliver_pending` sends due messages in batches (see `flask email deliver`),
+    reusing pooled SMTP connections across the batch.
+    A batch is claimed on the primary first (SELECT ... FOR UPDATE SKIP LOCKED, then
+    `next_attempt_at` is pushed `claim_seconds` ahead and committed), so concurrent
+    workers never pick the same rows and no transaction stays open while SMTP runs.
+    A worker that dies mid-batch leaves its rows due again once the claim expires.
+    A failed message is rescheduled with exponential backoff and marked as
+    failed once it runs out of retries.
+    """
+
+    def __init__(
+            self,
+            db_service: DatabaseService,
+            crud_service: CRUDService,
+            smtp_pool: SMTPConnectionPool,
+            max_retries: int = GeneralConstants.Email.MAX_RETRIES,
+            retry_backoff: float = GeneralConstants.Email.RETRY_BACKOFF_SECONDS,
+            claim_seconds: float = GeneralConstants.Email.OUTBOX_CLAIM_SECONDS
+    ) -> None:
+        self._db_service = db_service
+        self._crud_service = crud_service
+        self._smtp_pool = smtp_pool
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
+        self._claim_seconds = claim_seconds
+
+    def enqueue(self, message: Message) -> None:
+        self._crud_service.add(self._build_entry(message))
+
+    def enqueue_many(self, messages: Iterable[Message]) -> None:
+        self._crud_service.add_all([self._build_entry(message) for message in messages])
+
+    def deliver_pending(self, batch_size: int = GeneralConstants.Email.OUTBOX_BATCH_SIZE) -> int:
+        """
+        Send one batch of due messages.
+
+        Returns:
+            Number of messages processed (sent or rescheduled)
+        """
+        claimed = self._claim_due(batch_size)
+
+        sent_ids, errors = [], {}
+        for entry_id, attempts, message in claimed:
+            try:
+                self._smtp_pool.send(message)
+                sent_ids.append(entry_id)
+            except (SMTPException, OSError) as err:
+                errors[entry_id] = (attempts + 1, str(err))
+
+        self._record_results(sent_ids, errors)
+        return len(claimed)
+
+    def _claim_due(self, batch_size: int) -> list[tuple[int, int, Message]]:
+        """Lock up to `batch_size` due rows, lease them to this worker and commit; returns (id, attempts, message)."""
+        now = datetime.now(pytz.utc)
+        with self._db_service.transaction():
+            entries = self._crud_service.find_page(
+                EmailOutbox,
+                EmailOutbox.status == ModelConstants.EmailStatus.PENDING,
+                EmailOutbox.next_attempt_at <= now,
+                limit=batch_size,
+                skip_locked=True
+            )
+            if entries:
+                self._crud_service.update_by_filters(
+                    EmailOutbox,
+                    EmailOutbox.id.in_([entry.id for entry in entries]),
+                    next_attempt_at=now + timedelta(seconds=self._claim_seconds)
+                )
+            claimed = [(entry.id, entry.attempts, self._build_message(entry)) for entry in entries]
+        return claimed
+
+    def _record_results(self, sent_ids: list[int], errors: dict[int, tuple[int, str]]) -> None:
+        if not sent_ids and not errors:
+            return
+
+        now = datetime.now(pytz.utc)
+        with self._db_service.transaction():
+            if sent_ids:
+                self._crud_service.update_by_filters(
+                    EmailOutbox,
+                    EmailOutbox.id.in_(sent_ids),
+                    status=ModelConstants.EmailStatus.SENT
+                )
+            for entry_id, (attempts, error) in errors.items():
+                self._crud_service.update_by_filters(
+                    EmailOutbox,
+                    EmailOutbox.id == entry_id,
+                    **self._failure_values(attempts, error, now)
+                )
+
+    def _failure_values(self, attempts: int, error: str, now: datetime) -> dict:
+        values = {'attempts': attempts, 'last_error': error[:ModelConstants.StringLength.MAX_ERROR]}
+        if attempts > self._max_retries:
+            values['status'] = ModelConstants.EmailStatus.FAILED
+        else:
+            values['next_attempt_at'] = now + timedelta(seconds=self._retry_backoff * 2 ** attempts)
+        return values
+
+    def _build_entry(self, message: Message) -> EmailOutbox:
+        return EmailOutbox(
+            recipients=self._join_addresses(message.recipients),
+            cc=self._join_addresses(message.cc),
+            bcc=self._join_addresses(message.bcc),
+            sender=message.sender,
+            reply_to=message.reply_to,
+            subject=message.subject,
+            body=message.body
+        )
+
+    def _build_message(self, entry: EmailOutbox) -> Message:
+        return Message(
+            subject=entry.subject,
+            recipients=self._split_addresses(entry.recipients),
+            body=entry.body,
+            sender=entry.sender,
+            cc=self._split_addresses(entry.cc),
+            bcc=self._split_addresses(entry.bcc),
+            reply_to=entry.reply_to
+        )
+
+    @staticmethod
+    def _join_addresses(addresses: list | None) -> str | None:
+        return ",".join(addresses) if addresses else None
+
+    @staticmethod
+    def _split_addresses(addresses: str | None) -> list:
+        return addresses.split(",") if addresses else []
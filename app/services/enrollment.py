@@ -0,0 +1,116 @@
+import time
+from typing import Iterator
+
+from app.constants import AuthConstants, GeneralConstants
+from app.models import Student, Teacher, StudentCourses, TeacherCourses
+from app.services import DatabaseService, CRUDService, CourseService, PrincipalService, ResponseCache
+
+
+class EnrollmentService:
+    """
+    Enrolls students and teachers into a course in bulk.
+
+    Each chunk of emails costs a fixed number of queries - one to resolve the
+    profiles, one set-based lookup of the existing enrollments, and one
+    executemany INSERT - so large CSV/JSON batches scale with the number of
+    chunks rather than the number of rows.
+    """
+
+    _ROLE_MODELS = {
+        AuthConstants.Role.STUDENT: (Student, StudentCourses, 'student_id'),
+        AuthConstants.Role.TEACHER: (Teacher, TeacherCourses, 'teacher_id')
+    }
+
+    def __init__(
+            self,
+            db_service: DatabaseService,
+            crud_service: CRUDService,
+            course_service: CourseService,
+            principal_service: PrincipalService,
+            response_cache: ResponseCache,
+            chunk_size: int = GeneralConstants.Batch.CHUNK_SIZE
+    ) -> None:
+        self._db_service = db_service
+        self._crud_service = crud_service
+        self._course_service = course_service
+        self._principal_service = principal_service
+        self._response_cache = response_cache
+        self._chunk_size = chunk_size
+
+    def enroll(self, course_name: str, data: dict) -> dict:
+        """
+        Enroll a batch of users into a course.
+
+        Emails that are already enrolled are skipped, so the same batch
+        can be safely re-submitted. All chunks run in one transaction.
+
+        Args:
+            course_name: Name of the course
+            data: Dict with 'role' ('student' or 'teacher') and 'users' (list of dicts with 'email')
+
+        Returns:
+            Dict with the enrollment counts, the emails without a matching profile
+            and the throughput of the operation
+
+        Raises:
+            NotFound: If course doesn't exist
+        """
+        started_at = time.perf_counter()
+        course = self._course_service.get_course_by_name(course_name)
+        person_model, association_model, person_key = self._ROLE_MODELS[data['role']]
+        emails = list(dict.fromkeys(user['email'] for user in data['users']))
+
+        enrolled_user_ids = []
+        already_enrolled = 0
+        not_found = []
+
+        with self._db_service.transaction():
+            for chunk in self._chunks(emails):
+                profiles = self._find_profiles(person_model, chunk)
+                not_found.extend(email for email in chunk if email not in profiles)
+
+                existing_ids = set(self._crud_service.find_values(
+                    getattr(association_model, person_key),
+                    association_model.course_id == course.id,
+                    getattr(association_model, person_key).in_([person_id for person_id, _ in profiles.values()])
+                ))
+                already_enrolled += len(existing_ids)
+
+                new_profiles = [profile for profile in profiles.values() if profile[0] not in existing_ids]
+                self._crud_service.insert_rows(
+                    association_model,
+                    [{person_key: person_id, 'course_id': course.id} for person_id, _ in new_profiles],
+                    ignore_duplicates=True
+                )
+                enrolled_user_ids.extend(user_id for _, user_id in new_profiles)
+
+            if enrolled_user_ids:
+                self._course_service.touch_course(course)
+
+        for user_id in enrolled_user_ids:
+            self._principal_service.invalidate(user_id)
+        self._response_cache.invalidate_course(course.name)
+
+        elapsed = time.perf_counter() - started_at
+        return {
+            'course': course.name,
+            'role': data['role'],
+            'requested': len(emails),
+            'enrolled': len(enrolled_user_ids),
+            'already_enrolled': already_enrolled,
+            'not_found': not_found,
+            'elapsed_seconds': round(elapsed, 3),
+            'rows_per_second': round(len(emails) / elapsed) if elapsed else None
+        }
+
+    def _find_profiles(self, person_model, emails: list[str]) -> dict[str, tuple[int, int]]:
+        """Map each email to the (profile id, user id) of its student/teacher profile."""
+        rows = self._crud_service.find_rows(
+            (person_model.email, person_model.id, person_model.user_id),
+            person_model.email.in_(emails)
+        )
+        return {email: (person_id, user_id) for email, person_id, user_id in rows}
+
+    def _chunks(self, items: list) -> Iterator[list]:
+        for start in range(0, len(items), self._chunk_size):
+            yield items[start:start + self._chunk_size]
@@ -0,0 +1,43 @@
+from flask_login import current_user
+from sqlalchemy.engine import Row
+from werkzeug.exceptions import Forbidden, NotFound
+
+from app.models import Course, Lecture, Exercise
+from app.services import CRUDService
+
+
+class ExerciseService:
+    """Resolves exercises for the write paths that act on them (submissions, grading)."""
+
+    def __init__(self, crud_service: CRUDService) -> None:
+        self._crud_service = crud_service
+
+    def get_accessible_exercise(self, course_name: str, lecture_name: str, exercise_name: str) -> Row:
+        """
+        Resolve an exercise by its course, lecture and exercise names with a single query.
+
+        Access is checked against the course ids cached on the current principal,
+        so no further query is needed.
+
+        Returns:
+            Row with the exercise's `id`, `target_date` and `course_id`
+
+        Raises:
+            NotFound: If the exercise doesn't exist
+            Forbidden: If the user doesn't teach / isn't enrolled in the course
+        """
+        rows = self._crud_service.find_rows(
+            (Exercise.id, Exercise.target_date, Lecture.course_id),
+            Exercise.lecture_id == Lecture.id,
+            Lecture.course_id == Course.id,
+            Course.name == course_name,
+            Lecture.name == lecture_name,
+            Exercise.name == exercise_name
+        )
+        if not rows:
+            raise NotFound(f"Exercise '{exercise_name}' not found in lecture '{lecture_name}'")
+
+        exercise = rows[0]
+        if not current_user.is_admin and exercise.course_id not in current_user.course_ids:
+            raise Forbidden("You don't have access to this course")
+        return exercise
\ No newline at end of file
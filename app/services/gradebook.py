@@ -0,0 +1,197 @@
+from datetime import datetime
+from typing import Iterable, Optional
+
+import pytz
+from sqlalchemy import Row, Select
+
+from app.extensions import db
+from app.models import Course, Lecture, Exercise, Student, StudentCourses, StudentSolution, Grade, GradebookEntry
+from app.services import DatabaseService, CRUDService, CourseService
+
+
+class GradebookService:
+    """
+    Maintains and serves the materialized course gradebook (GradebookEntry).
+
+    Writes that change grades refresh only the affected students' rows, with one
+    aggregate query and one upsert, so the gradebook read never has to walk
+    Course -> Lecture -> Exercise -> StudentSolution -> Grade.
+    """
+
+    def __init__(
+            self,
+            db_service: DatabaseService,
+            crud_service: CRUDService,
+            course_service: CourseService
+    ) -> None:
+        self._db_service = db_service
+        self._crud_service = crud_service
+        self._course_service = course_service
+
+
+    # Read gradebook service
+    def get_gradebook(self, course_name: str) -> dict:
+        """
+        Get the gradebook of a course.
+
+        Args:
+            course_name: The name of the course
+
+        Returns:
+            Dict with the course-wide averages and completion rate, and per-student totals
+            for every enrolled student. Scores are averaged over graded exercises, completion
+            is the share of the course's exercises that have been graded.
+
+        Raises:
+            NotFound: If course doesn't exist
+            Forbidden: If user doesn't have access to the course
+        """
+        course = self._course_service.get_course_by_name(course_name)
+        rows = self._crud_service.find_rows_by_query(self._gradebook_query(course.id))
+
+        exercises_count = rows[0].exercises_count if rows else 0
+        students = [self._student_totals(row, exercises_count) for row in rows]
+        graded = sum(student['graded_count'] for student in students)
+
+        return {
+            'course': course.name,
+            'exercises_count': exercises_count,
+            'students_count': len(students),
+            'average_score': self._ratio(sum(student['total_score'] for student in students), graded),
+            'completion_rate': self._ratio(graded, exercises_count * len(students)),
+            'students': students
+        }
+
+    def _gradebook_query(self, course_id: int) -> Select:
+        """Enrolled students joined with their gradebook entries through the unique course/student index."""
+        exercises_count = (
+            db.select(db.func.count(Exercise.id))
+            .join(Lecture, Lecture.id == Exercise.lecture_id)
+            .where(Lecture.course_id == course_id)
+            .scalar_subquery()
+        )
+
+        return (
+            db.select(
+                Student.id,
+                Student.first_name,
+                Student.last_name,
+                db.func.coalesce(GradebookEntry.graded_count, 0).label('graded_count'),
+                db.func.coalesce(GradebookEntry.total_score, 0).label('total_score'),
+                exercises_count.label('exercises_count')
+            )
+            .select_from(StudentCourses)
+            .join(Student, Student.id == StudentCourses.student_id)
+            .outerjoin(
+                GradebookEntry,
+                db.and_(
+                    GradebookEntry.course_id == StudentCourses.course_id,
+                    GradebookEntry.student_id == StudentCourses.student_id
+                )
+            )
+            .where(StudentCourses.course_id == course_id)
+            .order_by(Student.last_name, Student.first_name)
+        )
+
+    def _student_totals(self, row: Row, exercises_count: int) -> dict:
+        return {
+            'student_id': row.id,
+            'first_name': row.first_name,
+            'last_name': row.last_name,
+            'graded_count': row.graded_count,
+            'total_score': row.total_score,
+            'average_score': self._ratio(row.total_score, row.graded_count),
+            'completion_rate': self._ratio(row.graded_count, exercises_count)
+        }
+
+    @staticmethod
+    def _ratio(numerator: int, denominator: int) -> Optional[float]:
+        return round(numerator / denominator, 2) if denominator else None
+
+
+    # Refresh gradebook service
+    def refresh_students(self, course_id: int, student_ids: Iterable[int]) -> None:
+        """
+        Recompute the gradebook entries of some students of a course. Does not commit.
+
+        Called inside the transaction that changed their grades, so the
+        gradebook is updated atomically with them.
+        """
+        student_ids = set(student_ids)
+        if not student_ids:
+            return
+
+        totals = self._compute_totals(course_id, StudentSolution.student_id.in_(student_ids))
+        for student_id in student_ids - totals.keys():
+            totals[student_id] = (0, 0)
+        self._upsert_entries(course_id, totals)
+
+    def refresh_course(self, course_id: int) -> None:
+        """Recompute every gradebook entry of a course in its own transaction (see `refresh_course_entries`)."""
+        with self._db_service.transaction():
+            self.refresh_course_entries(course_id)
+
+    def refresh_course_entries(self, course_id: int) -> None:
+        """
+        Recompute every gradebook entry of a course, e.g. after exercises were deleted. Does not commit.
+
+        Called inside the transaction that deleted them, so a failed refresh
+        rolls the deletion back instead of leaving a stale gradebook.
+        """
+        totals = self._compute_totals(course_id)
+        self._crud_service.delete_by_filters(
+            GradebookEntry,
+            GradebookEntry.course_id == course_id,
+            GradebookEntry.student_id.notin_(totals.keys())
+        )
+        self._upsert_entries(course_id, totals)
+
+    def refresh_all(self) -> int:
+        """
+        Rebuild the gradebook of every course.
+
+        Returns:
+            Number of refreshed courses
+        """
+        with self._db_service.primary():
+            course_ids = self._crud_service.find_values(Course.id)
+        for course_id in course_ids:
+            self.refresh_course(course_id)
+        return len(course_ids)
+
+    def _compute_totals(self, course_id: int, *filters) -> dict[int, tuple[int, int]]:
+        """Map student id -> (graded count, total score) of the course, aggregated in the database."""
+        rows = self._crud_service.find_rows_by_query(
+            db.select(
+                StudentSolution.student_id,
+                db.func.count(Grade.id),
+                db.func.coalesce(db.func.sum(Grade.score), 0)
+            )
+            .join(Grade, Grade.solution_id == StudentSolution.id)
+            .join(Exercise, Exercise.id == StudentSolution.exercise_id)
+            .join(Lecture, Lecture.id == Exercise.lecture_id)
+            .where(Lecture.course_id == course_id, *filters)
+            .group_by(StudentSolution.student_id)
+        )
+        return {student_id: (graded_count, int(total_score)) for student_id, graded_count, total_score in rows}
+
+    def _upsert_entries(self, course_id: int, totals: dict[int, tuple[int, int]]) -> None:
+        if not totals:
+            return
+
+        refreshed_at = datetime.now(pytz.utc)
+        self._crud_service.upsert(
+            GradebookEntry,
+            [
+                {
+                    'course_id': course_id,
+                    'student_id': student_id,
+                    'graded_count': graded_count,
+                    'total_score': total_score,
+                    'refreshed_at': refreshed_at
+                }
+                for student_id, (graded_count, total_score) in totals.items()
+            ],
+            conflict_columns=('course_id', 'student_id'),
+            update_columns=('graded_count', 'total_score', 'refreshed_at')
+        )
\ No newline at end of file
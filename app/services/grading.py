@@ -0,0 +1,121 @@
+from flask_login import current_user
+
+from app.constants import GeneralConstants
+from app.models import Grade, StudentSolution
+from app.schemas import GradeSchema
+from app.services import DatabaseService, CRUDService, ExerciseService, GradebookService
+from app.utils import load_each
+
+
+class GradingService:
+    """
+    Grades an exercise's submissions in bulk.
+
+    A batch costs a fixed number of statements regardless of its size: one query to
+    check the solutions belong to the exercise, one multi-row upsert per chunk of
+    grades, one set-based UPDATE of the solutions' status, and the refresh of the
+    graded students' gradebook entries.
+    """
+
+    def __init__(
+            self,
+            db_service: DatabaseService,
+            crud_service: CRUDService,
+            exercise_service: ExerciseService,
+            gradebook_service: GradebookService,
+            grade_schema: GradeSchema,
+            chunk_size: int = GeneralConstants.Batch.CHUNK_SIZE
+    ) -> None:
+        self._db_service = db_service
+        self._crud_service = crud_service
+        self._exercise_service = exercise_service
+        self._gradebook_service = gradebook_service
+        self._grade_schema = grade_schema
+        self._chunk_size = chunk_size
+
+    def grade_solutions(self, course_name: str, lecture_name: str, exercise_name: str, items: list[dict]) -> dict:
+        """
+        Grade (or regrade) many solutions of an exercise in a single transaction.
+
+        Args:
+            course_name: The name of the course
+            lecture_name: The name of the lecture within the course
+            exercise_name: The name of the exercise within the lecture
+            items: Dicts with 'solution_id', 'score' and optional 'feedback'
+
+        Returns:
+            Dict with the number of graded solutions and the errors keyed by the item's index in `items`.
+            Invalid items are reported and skipped, the rest are graded.
+
+        Raises:
+            NotFound: If the exercise doesn't exist
+            Forbidden: If the teacher doesn't teach the course
+        """
+        exercise = self._exercise_service.get_accessible_exercise(course_name, lecture_name, exercise_name)
+
+        grades = [{**item, 'teacher_id': current_user.teacher_id} for item in items]
+        rows, errors = self._load_rows(grades)
+        solution_students = self._find_solution_students(exercise.id, rows)
+        errors.update(self._find_foreign_solutions(solution_students, rows))
+
+        valid_rows = [row for index, row in rows.items() if index not in errors]
+        if valid_rows:
+            with self._db_service.transaction():
+                for start in range(0, len(valid_rows), self._chunk_size):
+                    self._crud_service.upsert(
+                        Grade,
+                        valid_rows[start:start + self._chunk_size],
+                        conflict_columns=('solution_id',),
+                        update_columns=('teacher_id', 'score', 'feedback')
+                    )
+                self._crud_service.update_by_filters(
+                    StudentSolution,
+                    StudentSolution.id.in_([row['solution_id'] for row in valid_rows]),
+                    status=GeneralConstants.Status.GRADED
+                )
+                self._gradebook_service.refresh_students(
+                    exercise.course_id,
+                    {solution_students[row['solution_id']] for row in valid_rows}
+                )
+
+        return {
+            'graded': len(valid_rows),
+            'errors': errors
+        }
+
+    def _load_rows(self, grades: list[dict]) -> tuple[dict[int, dict], dict[int, dict]]:
+        """Load the grades into typed row dicts, keyed by the item's index; invalid grades are returned as errors."""
+        loaded, errors = load_each(self._grade_schema, grades)
+        rows = {
+            index: {
+                'solution_id': grade['solution_id'],
+                'teacher_id': grade['teacher_id'],
+                'score': grade['score'],
+                'feedback': grade.get('feedback')
+            }
+            for index, grade in loaded.items()
+        }
+        return rows, errors
+
+    def _find_solution_students(self, exercise_id: int, rows: dict[int, dict]) -> dict[int, int]:
+        """Map each solution id of the batch that belongs to this exercise to its student id."""
+        return dict(self._crud_service.find_rows(
+            (StudentSolution.id, StudentSolution.student_id),
+            StudentSolution.exercise_id == exercise_id,
+            StudentSolution.id.in_([row['solution_id'] for row in rows.values()])
+        ))
+
+    @staticmethod
+    def _find_foreign_solutions(solution_students: dict[int, int], rows: dict[int, dict]) -> dict[int, dict]:
+        """Report rows whose solution isn't a submission of this exercise, or repeats an earlier row."""
+
+        errors = {}
+        seen = set()
+        for index, row in rows.items():
+            solution_id = row['solution_id']
+            if solution_id not in solution_students:
+                errors[index] = {'solution_id': [f"Solution {solution_id} is not a submission of this exercise"]}
+            elif solution_id in seen:
+                errors[index] = {'solution_id': [f"Solution {solution_id} is graded more than once in this batch"]}
+            seen.add(solution_id)
+        return errors
\ No newline at end of file
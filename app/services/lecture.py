@@ -1,9 +1,12 @@
+from typing import Optional, Sequence
+
 from flask_login import current_user
+from sqlalchemy.orm import Load, selectinload
 from werkzeug.exceptions import Conflict, NotFound
 
-from app.models import Course
-from app.schemas import LectureSchema
-from app.services import CRUDService, CourseService
+from app.models import Course, Lecture, Exercise, StudentSolution
+from app.schemas import LectureCreateSchema, LectureSchema
+from app.services import CRUDService, CourseService, GradebookService, ResponseCache
 
 
 class LectureService:
@@ -11,11 +14,17 @@ class LectureService:
             self,
             crud_service: CRUDService,
             course_service: CourseService,
-            lecture_schema: LectureSchema
+            gradebook_service: GradebookService,
+            response_cache: ResponseCache,
+            lecture_schema: LectureSchema,
+            lecture_create_schema: LectureCreateSchema
     ) -> None:
         self._crud_service = crud_service
         self._course_service = course_service
+        self._gradebook_service = gradebook_service
+        self._response_cache = response_cache
         self._lecture_schema = lecture_schema
+        self._lecture_create_schema = lecture_create_schema
 
 
     # Create lecture service
@@ -25,7 +34,7 @@ class LectureService:
 
         Args:
             course_name: The name of the course to add the lecture to
-            data: Dict with lecture details (name, content, etc.)
+            data: Loaded lecture details (name, content, etc.)
 
         Returns:
             The newly created lecture
@@ -38,13 +47,17 @@ class LectureService:
         course = self._course_service.get_course_by_name(course_name)
         self._verify_lecture_name_available(course, data['name'])
         lecture_data = self._prepare_lecture_data(data, course)
-        return self._crud_service.create(lecture_data, self._lecture_schema)
+        self._course_service.touch_course(course)
+        lecture = self._crud_service.add(Lecture(**lecture_data))
+        self._response_cache.invalidate_course(course.name)
+        return lecture
 
     def _prepare_lecture_data(self, data: dict, course: Course) -> dict:
-        lecture_data = data.copy()
+        # the course comes from the URL and the teacher from the session, never from the payload
+        lecture_data = {key: value for key, value in data.items() if key not in ('course_id', 'teacher_id')}
         lecture_data['course_id'] = course.id
         if current_user.is_teacher:
-            lecture_data['teacher_id'] = current_user.teacher.id
+            lecture_data['teacher_id'] = current_user.teacher_id
         return lecture_data
 
 
@@ -70,7 +83,9 @@ class LectureService:
         lecture = self._get_lecture_by_name_or_404(course, lecture_name)
         if 'name' in data and lecture.name != data['name']:
             self._verify_lecture_name_available(course, data['name'])
+        self._course_service.touch_course(course)
         self._crud_service.update(lecture, **data)
+        self._response_cache.invalidate_course(course.name)
         return lecture
 
 
@@ -89,22 +104,179 @@ class LectureService:
         """
         course = self._course_service.get_course_by_name(course_name)
         lecture = self._get_lecture_by_name_or_404(course, lecture_name)
-        self._crud_service.delete(lecture)
+        self._crud_service.delete_many([lecture], on_write=lambda: self._after_lectures_deleted(course))
+        self._response_cache.invalidate_course(course.name)
+
+
+    # Bulk lecture services
+    def create_lectures(self, course_name: str, items: list[dict]) -> tuple[list[Lecture], dict[int, dict]]:
+        """
+        Create many lectures for a course in a single transaction.
+
+        Args:
+            course_name: The name of the course to add the lectures to
+            items: Lecture details, one dict per lecture
+
+        Returns:
+            Tuple of (created lectures, errors keyed by the item's index in `items`).
+            Invalid items and names that already exist are reported, the rest are created.
+
+        Raises:
+            NotFound: If course doesn't exist
+            Forbidden: If user (teacher) doesn't have access to the course
+        """
+        course = self._course_service.get_course_by_name(course_name)
+        errors = self._find_name_conflicts(course, items)
+        indexes = [index for index in range(len(items)) if index not in errors]
+
+        lectures, validation_errors = self._crud_service.create_many(
+            [self._prepare_lecture_data(items[index], course) for index in indexes],
+            self._lecture_create_schema,
+            on_write=lambda: self._course_service.touch_course(course)
+        )
+        errors.update({indexes[index]: error for index, error in validation_errors.items()})
+        if lectures:
+            self._response_cache.invalidate_course(course.name)
+        return lectures, errors
+
+    def update_lectures(self, course_name: str, items: list[dict]) -> tuple[list[Lecture], dict[int, dict]]:
+        """
+        Update many lectures of a course in a single transaction.
+
+        Lectures are matched by 'name', the remaining fields of each item are updated.
+        Renaming is not supported in bulk - use `update_lecture` instead.
+
+        Args:
+            course_name: The name of the course the lectures belong to
+            items: Dicts with 'name' and the fields to update
+
+        Returns:
+            Tuple of (updated lectures, errors keyed by the item's index in `items`)
+
+        Raises:
+            NotFound: If course doesn't exist
+            Forbidden: If user (teacher) doesn't have access to the course
+        """
+        course = self._course_service.get_course_by_name(course_name)
+        lectures = self._get_lectures_by_names(course, [item.get('name') for item in items])
+
+        errors = {}
+        pairs = []
+        indexes = []
+        for index, item in enumerate(items):
+            lecture = lectures.get(item.get('name'))
+            if not lecture:
+                errors[index] = {'name': [f"Lecture with name '{item.get('name')}' not found in this course"]}
+                continue
+            pairs.append((lecture, {key: value for key, value in item.items() if key != 'name'}))
+            indexes.append(index)
+
+        updated, validation_errors = self._crud_service.update_many(
+            pairs,
+            self._lecture_schema,
+            on_write=lambda: self._course_service.touch_course(course)
+        )
+        errors.update({indexes[index]: error for index, error in validation_errors.items()})
+        if updated:
+            self._response_cache.invalidate_course(course.name)
+        return updated, errors
+
+    def delete_lectures(self, course_name: str, names: list[str]) -> tuple[int, dict[int, dict]]:
+        """
+        Delete many lectures of a course in a single transaction.
+
+        Args:
+            course_name: The name of the course the lectures belong to
+            names: Names of the lectures to delete
+
+        Returns:
+            Tuple of (number of deleted lectures, errors keyed by the name's index in `names`)
+
+        Raises:
+            NotFound: If course doesn't exist
+            Forbidden: If user (teacher) doesn't have access to the course
+        """
+        course = self._course_service.get_course_by_name(course_name)
+        lectures = self._get_lectures_by_names(course, names, options=[self._delete_cascade_loader()])
+        errors = {
+            index: {'name': [f"Lecture with name '{name}' not found in this course"]}
+            for index, name in enumerate(names)
+            if name not in lectures
+        }
+
+        self._crud_service.delete_many(
+            list(lectures.values()),
+            on_write=lambda: self._after_lectures_deleted(course)
+        )
+        if lectures:
+            self._response_cache.invalidate_course(course.name)
+        return len(lectures), errors
+
+    def _after_lectures_deleted(self, course: Course) -> None:
+        """Course version and gradebook changes committed in the same transaction as the deletion."""
+        self._course_service.touch_course(course)
+        self._gradebook_service.refresh_course_entries(course.id)
+
+    def _find_name_conflicts(self, course: Course, items: list[dict]) -> dict[int, dict]:
+        """Report items whose name already exists in the course or repeats an earlier item of the batch."""
+        names = [item.get('name') if isinstance(item.get('name'), str) else None for item in items]
+        taken = set(self._get_lectures_by_names(course, names))
+
+        errors = {}
+        for index, name in enumerate(names):
+            if name is None:
+                continue
+            if name in taken:
+                errors[index] = {'name': [f"Lecture with name '{name}' already exists in this course"]}
+            taken.add(name)
+        return errors
+
+    @staticmethod
+    def _delete_cascade_loader() -> Load:
+        """Eager-load the rows the ORM delete cascade walks, instead of loading them per lecture."""
+        return (
+            selectinload(Lecture.exercises)
+            .selectinload(Exercise.student_solutions)
+            .selectinload(StudentSolution.grade)
+        )
+
+    def _get_lectures_by_names(
+            self,
+            course: Course,
+            names: list,
+            options: Sequence[Load] = ()
+    ) -> dict[str, Lecture]:
+        names = [name for name in names if isinstance(name, str)]
+        if not names:
+            return {}
+
+        lectures = self._crud_service.find_many_by_advanced_filters(
+            Lecture,
+            Lecture.course_id == course.id,
+            Lecture.name.in_(names),
+            options=options
+        )
+        return {lecture.name: lecture for lecture in lectures}
 
 
-    def _get_lecture_by_name(self, course: Course, lecture_name: str):
-        return next(
-            (lecture for lecture in course.lectures if lecture.name == lecture_name),
-            None
+    def _get_lecture_by_name(self, course: Course, lecture_name: str) -> Optional[Lecture]:
+        return self._crud_service.find_one_by_fields(
+            model=Lecture,
+            course_id=course.id,
+            name=lecture_name
         )
 
-    def _get_lecture_by_name_or_404(self, course: Course, lecture_name: str):
+    def _get_lecture_by_name_or_404(self, course: Course, lecture_name: str) -> Lecture:
         lecture = self._get_lecture_by_name(course, lecture_name)
         if not lecture:
             raise NotFound(f"Lecture with name '{lecture_name}' not found in this course")
         return lecture
 
     def _verify_lecture_name_available(self, course: Course, lecture_name: str) -> None:
-        existing_lecture = self._get_lecture_by_name(course, lecture_name)
-        if existing_lecture:
-            raise Conflict(f"Lecture with name '{lecture_name}' already exists in this course")
\ No newline at end of file
+        self._crud_service.validate_no_record_by_fields(
+            model=Lecture,
+            exception=Conflict,
+            error_msg=f"Lecture with name '{lecture_name}' already exists in this course",
+            course_id=course.id,
+            name=lecture_name
+        )
\ No newline at end of file
@@ -1,8 +1,88 @@
-from flask import request
+import atexit
+import threading
+from datetime import datetime
 
+import pytz
+from flask import Flask, request
+from marshmallow import ValidationError
+
+from app.constants import GeneralConstants
+from app.extensions import db
 from app.models import User, LoginRecord
 from app.schemas import LoginRecordSchema
-from app.services import CRUDService
+
+
+class LoginRecordBuffer:
+    """
+    Collects login records in memory and writes them with a single bulk INSERT.
+
+    A background thread flushes the buffer every `flush_interval` seconds, and
+    sooner when `add` signals that `max_size` rows are waiting; the buffer is also
+    flushed when the process exits. Requests never flush inline. Flushes use their
+    own connection and transaction, independent of the request's session.
+
+    Rows of a failed flush are put back and retried by the next flush. At most
+    `max_retained` rows are kept while the database is unavailable; beyond that
+    the oldest are dropped.
+    """
+
+    def __init__(
+            self,
+            max_size: int = GeneralConstants.LoginRecord.BUFFER_SIZE,
+            flush_interval: float = GeneralConstants.LoginRecord.FLUSH_INTERVAL_SECONDS,
+            max_retained: int = GeneralConstants.LoginRecord.MAX_RETAINED
+    ) -> None:
+        self._max_size = max_size
+        self._flush_interval = flush_interval
+        self._max_retained = max_retained
+        self._rows: list[dict] = []
+        self._retried = 0
+        self._lock = threading.Lock()
+        self._full = threading.Event()
+        self._app: Flask | None = None
+
+    def init_app(self, app: Flask) -> None:
+        self._app = app
+        threading.Thread(target=self._flush_periodically, name='login-record-flush', daemon=True).start()
+        atexit.register(self.flush)
+
+    def add(self, row: dict) -> None:
+        with self._lock:
+            self._rows.append(row)
+            # rows put back by a failed flush do not count, so an outage is not retried on every login
+            is_full = len(self._rows) - self._retried >= self._max_size
+        if is_full:
+            self._full.set()
+
+    def flush(self) -> None:
+        with self._lock:
+            rows, self._rows = self._rows, []
+            self._retried = 0
+        if not rows:
+            return
+
+        with self._app.app_context():
+            try:
+                with db.engine.begin() as connection:
+                    connection.execute(db.insert(LoginRecord), rows)
+            except Exception:
+                self._app.logger.exception("Failed to write %d login record(s), will retry", len(rows))
+                self._retain(rows)
+
+    def _retain(self, rows: list[dict]) -> None:
+        with self._lock:
+            self._rows = rows + self._rows
+            dropped = max(len(self._rows) - self._max_retained, 0)
+            del self._rows[:dropped]
+            self._retried = max(len(rows) - dropped, 0)
+        if dropped:
+            self._app.logger.error("Dropped %d login record(s) - retry buffer is full", dropped)
+
+    def _flush_periodically(self) -> None:
+        while True:
+            self._full.wait(self._flush_interval)
+            self._full.clear()
+            self.flush()
 
 
 class LoginRecordService:
@@ -12,17 +92,33 @@ class LoginRecordService:
     """
     def __init__(
             self,
-            crud_service: CRUDService,
+            login_record_buffer: LoginRecordBuffer,
             create_login_record_schema: LoginRecordSchema
     ) -> None:
-        self._crud_service = crud_service
+        self._login_record_buffer = login_record_buffer
         self._create_login_record_schema = create_login_record_schema
 
-    def create_login_record(self, user: User) -> LoginRecord:
-        """Create new login record with client info."""
+    def create_login_record(self, user: User) -> None:
+        """
+        Record a login with client info.
+
+        The record is buffered and written in bulk later,
+        so the login request does not wait for an audit-table commit.
+
+        Raises:
+            ValidationError: If the client info is invalid
+        """
         login_record_data = {
             'user_id': user.id,
             'ip_address': request.remote_addr,
             'user_agent': request.user_agent.string
         }
-        return self._crud_service.create(login_record_data, self._create_login_record_schema)
\ No newline at end of file
+
+        errors = self._create_login_record_schema.validate(login_record_data)
+        if errors:
+            raise ValidationError(errors)
+
+        self._login_record_buffer.add({
+            **login_record_data,
+            'login_timestamp': datetime.now(pytz.utc)
+        })
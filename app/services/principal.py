@@ -0,0 +1,146 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from flask_login import UserMixin
+from sqlalchemy.orm import joinedload
+
+from app.constants import AuthConstants, GeneralConstants
+from app.extensions import db
+from app.models import User, StudentCourses, TeacherCourses
+from app.services import CRUDService
+
+
+class Principal(UserMixin):
+    """
+    Snapshot of an authenticated user, used as Flask-Login's `current_user`.
+
+    Holds everything the common authorization checks need (role, teacher/student
+    profile ids and accessible course ids), so those checks run without touching
+    the database. Any other attribute (email, password, relationships, ...) is
+    read from the `User` row, which is loaded on first access.
+    """
+
+    def __init__(
+            self,
+            id: int,
+            role: str,
+            teacher_id: Optional[int],
+            student_id: Optional[int],
+            course_ids: frozenset[int]
+    ) -> None:
+        self.id = id
+        self.role = role
+        self.teacher_id = teacher_id
+        self.student_id = student_id
+        self.course_ids = course_ids
+
+    @property
+    def user(self) -> User:
+        """The underlying User row, from the current session's identity map when already loaded."""
+        return db.session.get(User, self.id)
+
+    @property
+    def is_admin(self) -> bool:
+        return self.role == AuthConstants.Role.ADMIN
+
+    @property
+    def is_teacher(self) -> bool:
+        return self.role == AuthConstants.Role.TEACHER
+
+    @property
+    def is_student(self) -> bool:
+        return self.role == AuthConstants.Role.STUDENT
+
+    def __getattr__(self, name: str):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.user, name)
+
+
+class PrincipalService:
+    """
+    Loads and caches the Principal of authenticated users.
+
+    Principals are cached in-process for `ttl` seconds, so an authenticated
+    request usually resolves its user without a database round trip. The cache
+    holds at most `max_entries` principals and evicts the least recently used.
+    Services that change a user's role, password or enrollments must call
+    `invalidate` (or `invalidate_all`) so the change is visible immediately.
+
+    Invalidation only reaches the current process: other worker processes keep
+    serving their cached role and `course_ids` for up to `ttl` seconds
+    (`PRINCIPAL_CACHE_TTL`).
+    """
+
+    def __init__(
+            self,
+            crud_service: CRUDService,
+            ttl: float = GeneralConstants.Time.PRINCIPAL_CACHE_TTL_SECONDS,
+            max_entries: int = GeneralConstants.Principal.CACHE_MAX_ENTRIES
+    ) -> None:
+        self._crud_service = crud_service
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._cache: OrderedDict[int, tuple[Principal, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, user_id: int) -> Optional[Principal]:
+        with self._lock:
+            cached = self._cache.get(user_id)
+            if cached and cached[1] > time.monotonic():
+                self._cache.move_to_end(user_id)
+                return cached[0]
+
+        principal = self._build_principal(user_id)
+        with self._lock:
+            if principal:
+                self._cache[user_id] = (principal, time.monotonic() + self._ttl)
+                self._cache.move_to_end(user_id)
+                while len(self._cache) > self._max_entries:
+                    self._cache.popitem(last=False)
+            else:
+                self._cache.pop(user_id, None)
+        return principal
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._cache.pop(user_id, None)
+
+    def invalidate_all(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def _build_principal(self, user_id: int) -> Optional[Principal]:
+        user = self._crud_service.find_one_by_fields(
+            model=User,
+            options=(joinedload(User.teacher), joinedload(User.student)),
+            id=user_id
+        )
+        if not user:
+            return None
+
+        teacher_id = user.teacher.id if user.teacher else None
+        student_id = user.student.id if user.student else None
+
+        return Principal(
+            id=user.id,
+            role=user.role,
+            teacher_id=teacher_id,
+            student_id=student_id,
+            course_ids=self._find_course_ids(teacher_id, student_id)
+        )
+
+    def _find_course_ids(self, teacher_id: Optional[int], student_id: Optional[int]) -> frozenset[int]:
+        if teacher_id:
+            return frozenset(self._crud_service.find_values(
+                TeacherCourses.course_id,
+                TeacherCourses.teacher_id == teacher_id
+            ))
+        if student_id:
+            return frozenset(self._crud_service.find_values(
+                StudentCourses.course_id,
+                StudentCourses.student_id == student_id
+            ))
+        return frozenset()
@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta
+
+import pytz
+
+from app.constants import GeneralConstants
+from app.models import Token, LoginRecord
+from app.services import CRUDService
+
+
+class RetentionService:
+    """
+    Prunes append-only tables that are never cleaned up by the application.
+
+    - Tokens: deleted once they have been expired for `token_days` days
+    - Login records: deleted once they are older than `login_record_days` days
+
+    Deletes run in bounded batches, so a purge never holds long locks on the tables.
+    """
+
+    def __init__(
+            self,
+            crud_service: CRUDService,
+            token_days: int = GeneralConstants.Retention.TOKEN_DAYS,
+            login_record_days: int = GeneralConstants.Retention.LOGIN_RECORD_DAYS,
+            batch_size: int = GeneralConstants.Retention.BATCH_SIZE
+    ) -> None:
+        self._crud_service = crud_service
+        self._token_days = token_days
+        self._login_record_days = login_record_days
+        self._batch_size = batch_size
+
+    def purge(self) -> dict:
+        """
+        Run all retention rules.
+
+        Returns:
+            Dict with the number of deleted rows per table
+        """
+        return {
+            'token': self.purge_expired_tokens(),
+            'login_record': self.purge_login_records()
+        }
+
+    def purge_expired_tokens(self) -> int:
+        return self._crud_service.delete_in_batches(
+            Token,
+            Token.expiration < self._cutoff(self._token_days),
+            batch_size=self._batch_size
+        )
+
+    def purge_login_records(self) -> int:
+        return self._crud_service.delete_in_batches(
+            LoginRecord,
+            LoginRecord.login_timestamp < self._cutoff(self._login_record_days),
+            batch_size=self._batch_size
+        )
+
+    @staticmethod
+    def _cutoff(days: int) -> datetime:
+        return datetime.now(pytz.utc) - timedelta(days=days)
@@ -0,0 +1,99 @@
+import time
+from collections import deque
+from contextlib import contextmanager
+from queue import Empty, Full, LifoQueue
+from smtplib import SMTPException, SMTPServerDisconnected
+from typing import Iterable, Iterator
+
+from flask_mail import Connection, Message
+
+from app.constants import GeneralConstants
+from app.extensions import mail
+
+
+class SMTPConnectionPool:
+    """
+    Keeps authenticated SMTP connections open between sends.
+
+    Opening a connection costs a TCP + TLS handshake and a login, which dominates
+    the cost of sending a single message. Connections are returned to the pool
+    after use and reused until they have been idle for `idle_timeout` seconds.
+    A connection that fails while sending is closed instead of being returned.
+    `send` / `send_many` retry once, on a new connection, when the server has
+    dropped the connection (e.g. it closed a pooled connection that sat idle).
+
+    Must be used inside an application context.
+    """
+
+    def __init__(
+            self,
+            max_size: int = GeneralConstants.Email.QUEUE_WORKERS,
+            idle_timeout: float = GeneralConstants.Email.SMTP_IDLE_TIMEOUT_SECONDS
+    ) -> None:
+        self._idle_connections: LifoQueue[tuple[Connection, float]] = LifoQueue(maxsize=max_size)
+        self._idle_timeout = idle_timeout
+
+    @contextmanager
+    def connection(self, fresh: bool = False) -> Iterator[Connection]:
+        """A pooled connection, or a newly opened one with `fresh`."""
+        connection = self._open() if fresh else self._checkout()
+        try:
+            yield connection
+        except (SMTPException, OSError):
+            self._close(connection)
+            raise
+        self._checkin(connection)
+
+    def send(self, message: Message) -> None:
+        self.send_many([message])
+
+    def send_many(self, messages: Iterable[Message]) -> None:
+        pending = deque(messages)
+        try:
+            self._send_pending(pending)
+        except SMTPServerDisconnected:
+            # the broken connection was closed - resume from the first unsent message on a new one
+            self._send_pending(pending, fresh=True)
+
+    def _send_pending(self, pending: deque[Message], fresh: bool = False) -> None:
+        with self.connection(fresh) as connection:
+            while pending:
+                connection.send(pending[0])
+                pending.popleft()
+
+    def close_all(self) -> None:
+        while True:
+            try:
+                connection, _ = self._idle_connections.get_nowait()
+            except Empty:
+                return
+            self._close(connection)
+
+    def _checkout(self) -> Connection:
+        while True:
+            try:
+                connection, released_at = self._idle_connections.get_nowait()
+            except Empty:
+                return self._open()
+            if time.monotonic() - released_at < self._idle_timeout:
+                return connection
+            self._close(connection)
+
+    def _checkin(self, connection: Connection) -> None:
+        try:
+            self._idle_connections.put_nowait((connection, time.monotonic()))
+        except Full:
+            self._close(connection)
+
+    def _open(self) -> Connection:
+        connection = mail.connect()
+        connection.host = None if connection.mail.suppress else connection.configure_host()
+        return connection
+
+    def _close(self, connection: Connection) -> None:
+        if connection.host is None:
+            return
+        try:
+            connection.host.quit()
+        except (SMTPException, OSError):
+            connection.host.close()
@@ -0,0 +1,99 @@
+from datetime import datetime
+
+import pytz
+from flask_login import current_user
+from sqlalchemy.engine import Row
+from werkzeug.exceptions import Forbidden
+
+from app.constants import GeneralConstants
+from app.extensions import db
+from app.models import Grade, StudentSolution
+from app.services import DatabaseService, CRUDService, ExerciseService, GradebookService
+from app.utils import as_utc
+
+
+class SubmissionService:
+    """
+    Handles students' exercise submissions.
+
+    Built for the burst around an exercise deadline, when every student submits at once:
+    a submission costs one lookup query, one upsert statement and one DELETE of the
+    solution's grade, and never reads the existing solution, so concurrent
+    (re)submissions cannot race each other.
+    """
+
+    def __init__(
+            self,
+            db_service: DatabaseService,
+            crud_service: CRUDService,
+            exercise_service: ExerciseService,
+            gradebook_service: GradebookService
+    ) -> None:
+        self._db_service = db_service
+        self._crud_service = crud_service
+        self._exercise_service = exercise_service
+        self._gradebook_service = gradebook_service
+
+    def submit_solution(self, course_name: str, lecture_name: str, exercise_name: str, data: dict) -> dict:
+        """
+        Submit (or resubmit) the current student's solution to an exercise.
+
+        A resubmission replaces the previous content and sets the status back to
+        submitted, so an already graded solution is flagged for grading again. Its grade
+        graded the old content, so it is deleted and the student's gradebook entry
+        recomputed in the same transaction.
+
+        Args:
+            course_name: The name of the course
+            lecture_name: The name of the lecture within the course
+            exercise_name: The name of the exercise within the lecture
+            data: Dict with 'content'
+
+        Returns:
+            Dict with the exercise name, submission status and submission time
+
+        Raises:
+            NotFound: If the exercise doesn't exist
+            Forbidden: If the student isn't enrolled in the course, or the deadline has passed
+        """
+        exercise = self._exercise_service.get_accessible_exercise(course_name, lecture_name, exercise_name)
+        self._verify_deadline_not_passed(exercise)
+
+        submitted_at = datetime.now(pytz.utc)
+        with self._db_service.transaction():
+            self._crud_service.upsert(
+                StudentSolution,
+                {
+                    'student_id': current_user.student_id,
+                    'exercise_id': exercise.id,
+                    'content': data['content'],
+                    'submitted_at': submitted_at,
+                    'status': GeneralConstants.Status.SUBMITTED
+                },
+                conflict_columns=('student_id', 'exercise_id'),
+                update_columns=('content', 'submitted_at', 'status')
+            )
+            if self._delete_grade(exercise.id):
+                self._gradebook_service.refresh_students(exercise.course_id, {current_user.student_id})
+
+        return {
+            'exercise': exercise_name,
+            'status': GeneralConstants.Status.SUBMITTED,
+            'submitted_at': submitted_at.strftime("%d-%m-%Y %H:%M:%S")
+        }
+
+    def _delete_grade(self, exercise_id: int) -> int:
+        """Delete the current student's grade for the exercise, if any; returns the number of deleted grades."""
+        return self._crud_service.delete_by_filters(
+            Grade,
+            Grade.solution_id.in_(
+                db.select(StudentSolution.id).where(
+                    StudentSolution.student_id == current_user.student_id,
+                    StudentSolution.exercise_id == exercise_id
+                )
+            )
+        )
+
+    def _verify_deadline_not_passed(self, exercise: Row) -> None:
+        if exercise.target_date and datetime.now(pytz.utc) > as_utc(exercise.target_date):
+            raise Forbidden("The submission deadline for this exercise has passed")
\ No newline at end of file
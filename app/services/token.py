@@ -4,11 +4,11 @@ from typing import Optional
 import pytz
 from werkzeug.exceptions import Unauthorized
 
-from app.constants import ModelConstants, ValidationConstants
+from app.constants import AuthConstants, ModelConstants, ValidationConstants
 from app.models import User, Token
 from app.schemas import TokenSchema
-from app.services import CRUDService
-from app.utils import generate_token, hash_password, verify_password
+from app.services import CRUDService, DatabaseService
+from app.utils import generate_token, hash_token, verify_password
 
 
 class TokenService:
@@ -23,9 +23,11 @@ class TokenService:
 
     def __init__(
             self,
+            db_service: DatabaseService,
             crud_service: CRUDService,
             token_schema: TokenSchema
     ):
+        self._db_service = db_service
         self._crud_service = crud_service
         self._token_schema = token_schema
 
@@ -48,14 +50,15 @@ class TokenService:
         return raw_token
 
     def _invalidate_existing_token(self, user: User) -> None:
-        existing_token = self._find_active_token(user)
+        with self._db_service.primary():
+            existing_token = self._find_active_token(user)
         if existing_token:
             self._update_token_status(existing_token, ModelConstants.TokenStatus.INVALIDATED)
 
     def _prepare_token_data(self, user: User, token: str) -> dict:
         return {
             'user_id': user.id,
-            'token': hash_password(token)
+            'token': hash_token(token)
         }
 
     def mark_token_as_used(self, user: User, raw_token: str) -> None:
@@ -68,18 +71,32 @@ class TokenService:
         Raises:
             Unauthorized: If token validation fails (invalid, expired, or already used)
         """
-        active_token = self._find_active_token(user)
-        if not active_token or not verify_password(active_token.token, raw_token):
+        active_token = (
+            self._find_active_token(user, Token.token == hash_token(raw_token))
+            or self._find_legacy_active_token(user, raw_token)
+        )
+        if not active_token:
             raise Unauthorized(ValidationConstants.ResetPassword.ERROR_MESSAGES['general_error'])
         self._update_token_status(active_token, ModelConstants.TokenStatus.USED)
 
-    def _find_active_token(self, user: User) -> Optional[Token]:
+    def _find_active_token(self, user: User, *filters) -> Optional[Token]:
         return self._crud_service.find_one_by_advanced_filters(
             Token,
             Token.user_id == user.id,
             Token.status == ModelConstants.TokenStatus.ACTIVE,
-            Token.expiration > datetime.now(pytz.utc)
+            Token.expiration > datetime.now(pytz.utc),
+            *filters
+        )
+
+    def _find_legacy_active_token(self, user: User, raw_token: str) -> Optional[Token]:
+        """Find and verify an active token stored with bcrypt before HMAC hashing was introduced."""
+        legacy_token = self._find_active_token(
+            user,
+            Token.token.startswith(AuthConstants.TokenHash.LEGACY_BCRYPT_PREFIX)
         )
+        if legacy_token and verify_password(legacy_token.token, raw_token):
+            return legacy_token
+        return None
 
     def _update_token_status(self, token: Token, status: str) -> None:
         self._crud_service.update(token, status=status)
\ No newline at end of file
@@ -3,7 +3,7 @@ from typing import Optional, Type, List
 from flask_login import current_user
 
 from app.models import User, LoginRecord
-from app.services import CRUDService
+from app.services import CRUDService, PrincipalService
 from app.utils import hash_password
 
 
@@ -20,8 +20,9 @@ class UserService:
     adding business logic and validation specific to user management.
     """
 
-    def __init__(self, crud_service: CRUDService) -> None:
+    def __init__(self, crud_service: CRUDService, principal_service: PrincipalService) -> None:
         self._crud_service = crud_service
+        self._principal_service = principal_service
 
     def find_by_email(self, email: str) -> Optional[User]:
         return self._crud_service.find_one_by_fields(
@@ -53,4 +54,5 @@ class UserService:
         self._crud_service.update(
             user,
             password=hash_password(password)
-        )
\ No newline at end of file
+        )
+        self._principal_service.invalidate(user.id)
\ No newline at end of file
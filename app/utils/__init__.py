@@ -1,4 +1,17 @@
-from .dates import format_date, format_time
+from .dates import as_utc, format_date, format_time
 from .naming import camelcase_to_snakecase
-from .response import error_response, success_response
-from .security import generate_token, hash_password, verify_password
\ No newline at end of file
+from .response import (
+    error_response,
+    success_response,
+    json_response,
+    stream_response,
+    page_meta,
+    validator_headers,
+    not_modified_response
+)
+from .compression import response_compressor
+from .db_pool import InstrumentedQueuePool, pool_metrics
+from .json_provider import create_json_provider, encode_json
+from .security import generate_token, hash_password, verify_password, hash_token, password_hasher
+from .query import build_loader_options, count_expression
+from .validation import load_each
@@ -0,0 +1,101 @@
+import gzip
+import zlib
+from typing import Iterable, Iterator, Optional
+
+from flask import Flask, Response, request
+
+from app.constants import GeneralConstants
+
+
+class ResponseCompressor:
+    """
+    Compresses responses in an after-request hook.
+
+    The encoding is negotiated from Accept-Encoding, preferring brotli (when the
+    `brotli` package is installed) over gzip at equal quality. Buffered responses
+    are compressed only from `COMPRESS_MIN_SIZE` bytes, below which the framing
+    costs more than it saves. Streamed responses (see `stream_response`) have no
+    known size and are compressed chunk by chunk as they are sent.
+    """
+
+    def __init__(self) -> None:
+        self._min_size = GeneralConstants.Compression.MIN_SIZE
+        self._gzip_level = GeneralConstants.Compression.GZIP_LEVEL
+        self._brotli_quality = GeneralConstants.Compression.BROTLI_QUALITY
+        self._brotli = None
+
+    def init_app(self, app: Flask) -> None:
+        if not app.config.get('COMPRESS_ENABLED', True):
+            return
+        self._min_size = app.config.get('COMPRESS_MIN_SIZE', self._min_size)
+        self._gzip_level = app.config.get('COMPRESS_GZIP_LEVEL', self._gzip_level)
+        self._brotli_quality = app.config.get('COMPRESS_BROTLI_QUALITY', self._brotli_quality)
+        try:
+            import brotli
+            self._brotli = brotli
+        except ImportError:
+            self._brotli = None
+        app.after_request(self.compress)
+
+    def compress(self, response: Response) -> Response:
+        if not self._is_compressible(response):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        encoding = self._negotiate()
+        if encoding is None:
+            return response
+
+        if response.is_streamed:
+            response.response = self._compress_stream(response.iter_encoded(), encoding)
+            response.headers.pop('Content-Length', None)
+        else:
+            data = response.get_data()
+            if len(data) < self._min_size:
+                return response
+            response.set_data(self._compress_data(data, encoding))
+
+        response.headers['Content-Encoding'] = encoding
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            # the compressed body is a different byte sequence of the same representation
+            response.set_etag(etag, weak=True)
+        return response
+
+    def _is_compressible(self, response: Response) -> bool:
+        return (
+            request.method != 'HEAD'
+            and 200 <= response.status_code < 300
+            and response.status_code != 204
+            and not response.direct_passthrough
+            and 'Content-Encoding' not in response.headers
+            and response.mimetype in GeneralConstants.Compression.MIMETYPES
+        )
+
+    def _negotiate(self) -> Optional[str]:
+        encodings = [GeneralConstants.Compression.Encoding.GZIP]
+        if self._brotli is not None:
+            encodings.insert(0, GeneralConstants.Compression.Encoding.BROTLI)
+        return request.accept_encodings.best_match(encodings)
+
+    def _compress_data(self, data: bytes, encoding: str) -> bytes:
+        if encoding == GeneralConstants.Compression.Encoding.BROTLI:
+            return self._brotli.compress(data, quality=self._brotli_quality)
+        return gzip.compress(data, compresslevel=self._gzip_level, mtime=0)
+
+    def _compress_stream(self, chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+        if encoding == GeneralConstants.Compression.Encoding.BROTLI:
+            compressor = self._brotli.Compressor(quality=self._brotli_quality)
+            process, finish = compressor.process, compressor.finish
+        else:
+            compressor = zlib.compressobj(self._gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            process, finish = compressor.compress, compressor.flush
+
+        for chunk in chunks:
+            compressed = process(chunk)
+            if compressed:
+                yield compressed
+        yield finish()
+
+
+response_compressor = ResponseCompressor()
\ No newline at end of file
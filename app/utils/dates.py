@@ -1,6 +1,8 @@
 from datetime import date, datetime, time
 from typing import Union
 
+import pytz
+
 
 def format_date(dt_obj: Union[date, datetime]) -> str:
     """
@@ -32,4 +34,16 @@ def format_time(dt_obj: Union[datetime, time]) -> str:
         >>> format_time(datetime(2020, 5, 13, 17, 53, 26))
         '17:53:26'
     """
-    return f'{dt_obj:%H:%M:%S}'
\ No newline at end of file
+    return f'{dt_obj:%H:%M:%S}'
+
+def as_utc(dt_obj: datetime) -> datetime:
+    """
+    Make a datetime read from the database timezone-aware.
+
+    MySQL DATETIME columns come back naive; the application stores UTC.
+
+    Examples:
+        >>> as_utc(datetime(2020, 5, 13, 17, 53, 26))
+        datetime.datetime(2020, 5, 13, 17, 53, 26, tzinfo=<UTC>)
+    """
+    return dt_obj if dt_obj.tzinfo else dt_obj.replace(tzinfo=pytz.utc)
\ No newline at end of file
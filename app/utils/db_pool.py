@@ -0,0 +1,165 @@
+import logging
+import threading
+import time
+from typing import Any
+
+from flask import Flask, current_app, has_app_context
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool
+
+from app.extensions import db
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that measures how long checkouts wait for a connection.
+
+    Counters live on the pool itself, so every engine (bind) has its own. Slow
+    checkouts (over `DB_POOL_SLOW_CHECKOUT_MS`) and overflow connections opened
+    beyond the pool size are logged, so pools can be sized per worker.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.overflow_events = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        overflow = self.overflow()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            self._record_wait(time.perf_counter() - started)
+        if self.overflow() > max(overflow, 0):
+            self._record_overflow()
+        return record
+
+    def recreate(self) -> 'InstrumentedQueuePool':
+        # pools are recreated on disconnect storms / engine.dispose() - keep the counters
+        pool = super().recreate()
+        pool.checkouts = self.checkouts
+        pool.overflow_events = self.overflow_events
+        pool.timeouts = self.timeouts
+        pool.wait_seconds_total = self.wait_seconds_total
+        pool.wait_seconds_max = self.wait_seconds_max
+        return pool
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                'size': self.size(),
+                'in_use': self.checkedout(),
+                'idle': self.checkedin(),
+                'overflow': max(self.overflow(), 0),
+                'checkouts': self.checkouts,
+                'overflow_events': self.overflow_events,
+                'timeouts': self.timeouts,
+                'wait_ms_avg': round(self.wait_seconds_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                'wait_ms_max': round(self.wait_seconds_max * 1000, 3)
+            }
+
+    def _record_wait(self, waited: float) -> None:
+        with self._stats_lock:
+            self.checkouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        if has_app_context() and waited * 1000 >= current_app.config.get('DB_POOL_SLOW_CHECKOUT_MS', 100):
+            current_app.logger.warning(
+                "Waited %.1f ms for a database connection (in use: %d, overflow: %d)",
+                waited * 1000, self.checkedout(), max(self.overflow(), 0)
+            )
+
+    def _record_overflow(self) -> None:
+        with self._stats_lock:
+            self.overflow_events += 1
+        if has_app_context():
+            _log_metrics(
+                current_app,
+                "Opened overflow database connection %d/%d (pool size %d)",
+                self.overflow(), self._max_overflow, self.size()
+            )
+
+
+def _log_metrics(app: Flask, message: str, *args: Any) -> None:
+    """Log a pool metrics line at the level `PoolMetrics.init_app` set the metrics logger to."""
+    logger = app.logger.getChild(PoolMetrics.LOGGER_NAME)
+    logger.log(logger.level, message, *args)
+
+
+class PoolMetrics:
+    """
+    Configures the SQLAlchemy connection pool and exposes its metrics.
+
+    `init_app` must run before `db.init_app`: it keeps only the engine options
+    the configured database supports (SQLite manages its own single-file pool,
+    the timeouts in `connect_args` are PyMySQL's) and swaps in InstrumentedQueuePool.
+
+    Every `DB_POOL_METRICS_LOG_INTERVAL` seconds a background thread logs the
+    `snapshot()` of each worker process's pools (0 disables it). Metrics lines go
+    to the `<app>.db_pool` logger at `DB_POOL_METRICS_LOG_LEVEL`, and that logger is
+    set to the same level - the app logger is effectively WARNING outside debug mode.
+    """
+
+    LOGGER_NAME = 'db_pool'
+
+    def __init__(self) -> None:
+        self._app: Flask | None = None
+
+    def init_app(self, app: Flask) -> None:
+        app.logger.getChild(self.LOGGER_NAME).setLevel(app.config.get('DB_POOL_METRICS_LOG_LEVEL', 'INFO'))
+
+        url = make_url(app.config['SQLALCHEMY_DATABASE_URI'])
+        options = dict(app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}))
+
+        if url.get_backend_name() == 'sqlite':
+            app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+                key: value for key, value in options.items() if key in ('pool_pre_ping', 'pool_recycle')
+            }
+            return
+
+        if url.get_backend_name() != 'mysql':
+            options.pop('connect_args', None)
+        options.setdefault('poolclass', InstrumentedQueuePool)
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+
+        self._app = app
+        interval = app.config.get('DB_POOL_METRICS_LOG_INTERVAL', 0)
+        if interval:
+            threading.Thread(
+                target=self._log_periodically,
+                args=(interval,),
+                name='db-pool-metrics',
+                daemon=True
+            ).start()
+
+    def snapshot(self) -> dict[str, dict]:
+        """Current pool metrics of each bind, keyed by bind name ('default' for the primary); needs an app context."""
+        return {
+            bind or 'default': engine.pool.stats()
+            for bind, engine in db.engines.items()
+            if isinstance(engine.pool, InstrumentedQueuePool)
+        }
+
+    def log_snapshot(self) -> None:
+        """Log the metrics of each pool; needs an app context."""
+        for bind, stats in self.snapshot().items():
+            _log_metrics(current_app, "Database pool %s: %s", bind, stats)
+
+    def _log_periodically(self, interval: float) -> None:
+        while True:
+            time.sleep(interval)
+            with self._app.app_context():
+                self.log_snapshot()
+
+
+pool_metrics = PoolMetrics()
\ No newline at end of file
@@ -0,0 +1,103 @@
+from typing import Any
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+
+class StdlibJSONProvider(DefaultJSONProvider):
+    """Flask's default provider, extended with `dumps_bytes` used by `success_response`."""
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        return self.dumps(obj).encode('utf-8')
+
+
+class OrjsonProvider(StdlibJSONProvider):
+    """
+    JSON provider encoding with orjson.
+
+    Produces the same documents as Flask's default provider: keys sorted, non-string
+    keys stringified, and dates/decimals/uuids handed to Flask's `default`. Non-ASCII
+    text is written as UTF-8 rather than escaped. Calls with extra `json.dumps`
+    arguments (e.g. `indent`) fall back to the stdlib encoder.
+    """
+
+    def __init__(self, app: Flask) -> None:
+        import orjson
+
+        super().__init__(app)
+        self._orjson = orjson
+        self._options = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | (orjson.OPT_SORT_KEYS if self.sort_keys else 0)
+        )
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj).decode('utf-8')
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, default=self.default, option=self._options)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return self._orjson.loads(s)
+
+
+class UjsonProvider(StdlibJSONProvider):
+    """JSON provider encoding with ujson, with the same output conventions as OrjsonProvider."""
+
+    def __init__(self, app: Flask) -> None:
+        import ujson
+
+        super().__init__(app)
+        self._ujson = ujson
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return self._ujson.dumps(
+            obj,
+            default=self.default,
+            sort_keys=self.sort_keys,
+            ensure_ascii=False,
+            escape_forward_slashes=False
+        )
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return self._ujson.loads(s)
+
+
+_PROVIDERS = {
+    'orjson': OrjsonProvider,
+    'ujson': UjsonProvider,
+    'stdlib': StdlibJSONProvider
+}
+
+
+def create_json_provider(app: Flask, name: str) -> StdlibJSONProvider:
+    """
+    Create the configured JSON provider, falling back to the next available encoder.
+
+    Preference order is the configured one, then orjson, ujson and the stdlib,
+    so a missing optional package never prevents the app from starting.
+    """
+    preferred = [name] + [provider for provider in _PROVIDERS if provider != name]
+    for provider_name in preferred:
+        try:
+            return _PROVIDERS[provider_name](app)
+        except (ImportError, KeyError):
+            continue
+    return StdlibJSONProvider(app)
+
+
+def encode_json(provider: Any, obj: Any) -> bytes:
+    """Encode `obj` to bytes with the app's JSON provider, whichever it is."""
+    if isinstance(provider, StdlibJSONProvider):
+        return provider.dumps_bytes(obj)
+    return provider.dumps(obj).encode('utf-8')
\ No newline at end of file
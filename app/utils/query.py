@@ -0,0 +1,89 @@
+from marshmallow import Schema, fields
+from sqlalchemy import ScalarSelect, inspect, select, func
+from sqlalchemy.orm import Load, joinedload, selectinload, undefer, with_expression
+
+
+def build_loader_options(model: type, schema: Schema) -> list[Load]:
+    """
+    Build eager-loading options for every relationship a schema will dump.
+
+    Walks the schema's nested fields and maps each one onto the matching
+    relationship of the model, recursing into the nested schema. Collections
+    use `selectinload` (one extra query per relationship, regardless of row count)
+    and scalar relationships use `joinedload`. Relationship count fields
+    (fields with a `count_of` attribute) are filled by a correlated COUNT
+    subquery, so the counted collection is never loaded. Deferred columns
+    are undeferred only when the schema dumps them.
+
+    Args:
+        model: SQLAlchemy model class the schema serializes
+        schema: Marshmallow schema instance that will dump the query result
+
+    Returns:
+        List of loader options to pass to `Query.options()`
+
+    Examples:
+        >>> build_loader_options(Course, CourseAdminSchema(many=True))
+        [selectinload(Course.lectures).options(selectinload(Lecture.exercises)), ...]
+    """
+    mapper = inspect(model)
+    relationships = mapper.relationships
+    options = []
+
+    for field in schema.dump_fields.values():
+        column = mapper.column_attrs.get(field.attribute or field.name)
+        if column is not None and column.deferred:
+            options.append(undefer(getattr(model, column.key)))
+            continue
+
+        count_of = getattr(field, 'count_of', None)
+        if count_of:
+            options.append(with_expression(
+                getattr(model, field.attribute or field.name),
+                count_expression(model, count_of)
+            ))
+            continue
+
+        if not isinstance(field, fields.Nested):
+            continue
+
+        relationship = relationships.get(field.attribute or field.name)
+        if relationship is None:
+            continue
+
+        loader = selectinload if relationship.uselist else joinedload
+        option = loader(getattr(model, relationship.key))
+
+        nested_options = build_loader_options(relationship.mapper.class_, field.schema)
+        if nested_options:
+            option = option.options(*nested_options)
+
+        options.append(option)
+
+    return options
+
+
+def count_expression(model: type, relationship_name: str) -> ScalarSelect:
+    """
+    Build a correlated `SELECT COUNT(*)` subquery for a model relationship.
+
+    Counts rows of the association table for many-to-many relationships
+    and rows of the related table otherwise.
+
+    Args:
+        model: SQLAlchemy model class owning the relationship
+        relationship_name: Name of the relationship to count
+
+    Returns:
+        Scalar subquery usable as a column expression in queries on `model`
+    """
+    relationship = inspect(model).relationships[relationship_name]
+    table = relationship.secondary if relationship.secondary is not None else relationship.mapper.local_table
+
+    return (
+        select(func.count())
+        .select_from(table)
+        .where(relationship.primaryjoin)
+        .correlate_except(table)
+        .scalar_subquery()
+    )
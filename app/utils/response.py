@@ -1,14 +1,44 @@
+import json
+from datetime import datetime
 from http import HTTPStatus
-from typing import Any
+from typing import Any, Iterable, Iterator, Mapping, Optional
+
+from flask import Response, current_app, request, stream_with_context
+from werkzeug.http import http_date, is_resource_modified, quote_etag
+
+from app.utils.json_provider import encode_json
 
 
 def success_response(
         message: str = "Operation completed successfully",
         data: Any | None = None,
         schema: Any | None = None,
-        status_code: HTTPStatus = HTTPStatus.OK
-) -> tuple[dict, HTTPStatus]:
-    """Create successful API response."""
+        status_code: HTTPStatus = HTTPStatus.OK,
+        meta: dict | None = None,
+        etag: str | None = None,
+        last_modified: datetime | None = None,
+        expires: datetime | None = None
+) -> Response:
+    """
+    Create successful API response.
+
+    The body is encoded once, to bytes, by the app's JSON provider (orjson when
+    available, see `json_provider`), and returned as a ready `Response` so Flask
+    does not serialize it again.
+
+    With `etag` and/or `last_modified` the response carries validators, and a
+    request whose If-None-Match / If-Modified-Since still matches them gets an
+    empty 304 instead - without dumping `data`.
+
+    `expires` is when the body changes without a write (e.g. an exercise deadline
+    passing). It is sent as Expires, and the response cache drops the entry then.
+    """
+    headers = validator_headers(etag, last_modified, expires)
+    if headers:
+        not_modified = not_modified_response(headers)
+        if not_modified:
+            return not_modified
+
     response_data = {
         'success': True,
         'message': message
@@ -17,17 +47,103 @@ def success_response(
     if data:
         response_data['data'] = schema.dump(data) if schema else data
 
-    return response_data, status_code
+    if meta:
+        response_data['meta'] = meta
+
+    return json_response(encode_json(current_app.json, response_data), status_code, headers)
+
+
+def json_response(body: bytes | str, status_code: HTTPStatus = HTTPStatus.OK, headers: dict | None = None) -> Response:
+    """Wrap an already encoded JSON body in a response."""
+    return Response(body, status=status_code, headers=headers, mimetype='application/json')
+
+
+def validator_headers(
+        etag: str | None = None,
+        last_modified: datetime | None = None,
+        expires: datetime | None = None
+) -> dict:
+    """
+    Build the conditional GET headers of a resource.
+
+    Responses are per user, so shared caches must not store them, and clients
+    must revalidate before reusing them.
+    """
+    headers = {}
+    if etag:
+        headers['ETag'] = quote_etag(etag)
+    if last_modified:
+        headers['Last-Modified'] = http_date(last_modified)
+    if expires:
+        headers['Expires'] = http_date(expires)
+    if headers:
+        headers['Cache-Control'] = 'private, no-cache'
+    return headers
+
+
+def not_modified_response(headers: Mapping[str, str]) -> Optional[Response]:
+    """Return a 304 response if the request's validators still match `headers`, otherwise None."""
+    modified = is_resource_modified(
+        request.environ,
+        etag=headers.get('ETag', '').strip('"') or None,
+        last_modified=headers.get('Last-Modified')
+    )
+    if modified:
+        return None
+    return Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+
+def stream_response(
+        items: Iterable,
+        schema: Any,
+        message: str = "Operation completed successfully",
+        status_code: HTTPStatus = HTTPStatus.OK
+) -> Response:
+    """
+    Create successful API response that streams a list of items.
+
+    The body has the same shape as `success_response`, but the `data` array
+    is encoded and sent one item at a time while `items` is consumed, so the
+    full list is never held in memory.
+    """
+    def generate() -> Iterator[str]:
+        yield f'{{"success": true, "message": {json.dumps(message)}, "data": ['
+        for index, item in enumerate(items):
+            yield ("," if index else "") + current_app.json.dumps(schema.dump(item, many=False))
+        yield ']}'
+
+    return Response(
+        stream_with_context(generate()),
+        status=status_code,
+        mimetype='application/json'
+    )
+
+
+def page_meta(items: list, limit: int) -> dict:
+    """
+    Build keyset pagination metadata for a page of records.
+
+    `next_cursor` is the id to pass as `cursor` for the next page,
+    or None when this is the last page.
+    """
+    return {
+        'next_cursor': items[-1].id if len(items) == limit else None,
+        'limit': limit
+    }
 
 
 def error_response(
         message: str = "Operation failed",
-        status_code: HTTPStatus = HTTPStatus.BAD_REQUEST
+        status_code: HTTPStatus = HTTPStatus.BAD_REQUEST,
+        errors: dict | None = None
 ) -> tuple[dict, HTTPStatus]:
-    """Create error API response."""
+    """Create error API response, optionally with per-item `errors` of a batch request."""
     response_data = {
         'success': False,
         'message': message
     }
 
-    return response_data, status_code
\ No newline at end of file
+    if errors:
+        response_data['errors'] = errors
+
+    return response_data, status_code
@@ -1,14 +1,78 @@
+import hashlib
+import hmac
+import multiprocessing
 import secrets
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from flask import Flask, current_app
 
 from app.constants import ModelConstants
 from app.extensions import bcrypt
 
 
-def hash_password(password: str) -> str:
+class PasswordHasher:
+    """
+    Runs bcrypt hashing and verification for the password helpers.
+
+    With `PASSWORD_HASH_WORKERS` > 0 the work is submitted to a bounded process pool,
+    so a burst of logins queues up behind a fixed number of hashing processes instead
+    of taking every CPU core the web workers need. With 0 (the default), or if the pool
+    breaks, hashing runs synchronously in the calling thread.
+    """
+
+    def __init__(self) -> None:
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def init_app(self, app: Flask) -> None:
+        workers = app.config.get('PASSWORD_HASH_WORKERS', 0)
+        if workers:
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+
+    def hash(self, password: str) -> str:
+        return self._run(_hash_password, password)
+
+    def verify(self, hashed_password: str, plain_password: str) -> bool:
+        return self._run(_verify_password, hashed_password, plain_password)
+
+    def _run(self, func: Callable, *args) -> Any:
+        if self._executor is None:
+            return func(*args)
+        try:
+            return self._executor.submit(func, *args).result()
+        except BrokenProcessPool:
+            self._executor = None
+            return func(*args)
+
+
+password_hasher = PasswordHasher()
+
+
+def _hash_password(password: str) -> str:
     return bcrypt.generate_password_hash(password).decode('utf-8')
 
-def verify_password(hashed_password: str, plain_password: str) -> bool:
+def _verify_password(hashed_password: str, plain_password: str) -> bool:
     return bcrypt.check_password_hash(hashed_password, plain_password)
 
+def hash_password(password: str) -> str:
+    return password_hasher.hash(password)
+
+def verify_password(hashed_password: str, plain_password: str) -> bool:
+    return password_hasher.verify(hashed_password, plain_password)
+
+def hash_token(token: str) -> str:
+    """
+    Hash a high-entropy token with HMAC-SHA256 keyed by the app's SECRET_KEY.
+
+    Unlike passwords, random tokens need no slow hash, and the deterministic
+    digest can be looked up directly through an index.
+    """
+    key = current_app.config['SECRET_KEY'].encode('utf-8')
+    return hmac.new(key, token.encode('utf-8'), hashlib.sha256).hexdigest()
+
 def generate_token(entropy_bytes: int = ModelConstants.StringLength.TOKEN_ENTROPY_BYTES) -> str:
-    return secrets.token_urlsafe(entropy_bytes)
\ No newline at end of file
+    return secrets.token_urlsafe(entropy_bytes)
@@ -0,0 +1,29 @@
+from typing import Any
+
+from marshmallow import Schema, ValidationError
+
+
+def load_each(schema: Schema, items: list[dict], partial: bool = False) -> tuple[dict[int, Any], dict[int, dict]]:
+    """
+    Deserialize the items of a batch, so an invalid item doesn't reject the others.
+
+    There is no separate `schema.validate` pass: a valid batch is loaded once with
+    `many=True`. Only when some items are invalid are the valid ones loaded again,
+    since marshmallow skips the post-load step (building model instances) of a failed load.
+
+    Args:
+        schema: Schema loading a single item
+        items: Raw data, one dict per item
+        partial: Allow missing required fields (partial updates)
+
+    Returns:
+        Tuple of (loaded items, validation errors), both keyed by the item's index in `items`
+    """
+    try:
+        return dict(enumerate(schema.load(items, many=True, partial=partial))), {}
+    except ValidationError as err:
+        errors = err.messages
+
+    indexes = [index for index in range(len(items)) if index not in errors]
+    loaded = schema.load([items[index] for index in indexes], many=True, partial=partial) if indexes else []
+    return dict(zip(indexes, loaded)), errors
\ No newline at end of file
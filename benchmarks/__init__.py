@@ -0,0 +1,74 @@
+"""
+Micro-benchmarks of the hot paths, run against an in-memory SQLite database.
+
+Run one with `python -m benchmarks.<name>` from the repository root. The numbers
+are only comparable between runs on the same machine.
+"""
+import os
+import time
+from typing import Callable
+
+os.environ.setdefault('SECRET_KEY', 'benchmark-secret-key')
+os.environ.pop('DATABASE_REPLICA_URL', None)
+
+from flask import Flask
+
+
+def create_benchmark_app(database_url: str = 'sqlite://') -> Flask:
+    """The application with its tables created, inside a pushed app context. Call it before importing `app`."""
+    os.environ['DATABASE_URL'] = database_url
+    from app import create_app
+    from app.extensions import db
+    from app.models import StudentCourses, TeacherCourses
+
+    app = create_app()
+    # SQLite cannot autoincrement a column of a composite primary key
+    for table in (StudentCourses.__table__, TeacherCourses.__table__):
+        table.c.id.autoincrement = False
+        table.c.id.primary_key = False
+        table.c.id.nullable = True
+
+    app.app_context().push()
+    db.create_all()
+    return app
+
+
+def seed_courses(count: int, lectures: int = 5, exercises: int = 3, students: int = 20) -> list:
+    """Create `count` courses sharing one teacher and `students` students, with lectures and exercises."""
+    from app.constants import AuthConstants
+    from app.extensions import db
+    from app.models import Course, Exercise, Lecture, Student, Teacher, User
+
+    teacher = Teacher(
+        user=User(email='teacher@example.com', password='x', role=AuthConstants.Role.TEACHER),
+        first_name='Tea', last_name='Cher', email='teacher@example.com', phone='0500000000'
+    )
+    people = [
+        Student(
+            user=User(email=f'student{index}@example.com', password='x', role=AuthConstants.Role.STUDENT),
+            first_name='Stu', last_name=f'Dent{index}', email=f'student{index}@example.com', phone=f'05{index:08d}'
+        )
+        for index in range(students)
+    ]
+    courses = []
+    for index in range(count):
+        course = Course(name=f'course{index}', teachers=[teacher], students=people)
+        for lecture_index in range(lectures):
+            lecture = Lecture(name=f'lecture{lecture_index}', content='x' * 500, teacher=teacher)
+            lecture.exercises = [Exercise(name=f'exercise{i}', content='y' * 200) for i in range(exercises)]
+            course.lectures.append(lecture)
+        courses.append(course)
+    db.session.add_all(courses)
+    db.session.commit()
+    return courses
+
+
+def best_of(func: Callable[[], object], number: int, repeat: int = 5) -> float:
+    """Best wall time of `repeat` runs of `number` calls, in seconds per call."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / number
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""
+JSON providers on the course list: encoding alone, and the whole GET /course/ request.
+
+    python -m benchmarks.json_encoding [--courses 1000]
+"""
+import argparse
+import gzip
+
+from benchmarks import best_of, create_benchmark_app, seed_courses
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--courses', type=int, default=1000)
+    args = parser.parse_args()
+
+    app = create_benchmark_app()
+    from app.constants import GeneralConstants
+    from app.extensions import db
+    from app.factories import response_cache
+    from app.models import Course, User
+    from app.schemas import CourseAdminSchema
+    from app.utils import build_loader_options, create_json_provider, encode_json
+
+    seed_courses(args.courses, lectures=3, exercises=2, students=5)
+    admin = User(email='admin@example.com', password='x', role='admin')
+    db.session.add(admin)
+    db.session.commit()
+
+    schema = CourseAdminSchema(many=True)
+    courses = db.session.scalars(db.select(Course).options(*build_loader_options(Course, schema))).unique().all()
+    document = {'success': True, 'message': "Courses retrieved", 'data': schema.dump(courses)}
+    providers = {name: create_json_provider(app, name) for name in ('stdlib', 'orjson', 'ujson')}
+    providers = {name: provider for name, provider in providers.items() if type(provider).__name__.lower().startswith(name)}
+    assert len({repr(app.json.loads(encode_json(provider, document))) for provider in providers.values()}) == 1
+
+    print(f"Encoding the CourseAdminSchema dump of {len(courses)} courses (ms):")
+    for name, provider in providers.items():
+        print(f"  {name:<8} {best_of(lambda: encode_json(provider, document), 10) * 1000:>8.1f}")
+
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['_user_id'] = str(admin.id)
+    url = f'/course/?limit={GeneralConstants.Pagination.MAX_PAGE_SIZE}'
+
+    def get_courses(headers: dict | None = None):
+        response_cache.invalidate_course()  # measure the full request, not a cache hit
+        response = client.get(url, headers=headers or {'Accept-Encoding': 'identity'})
+        assert response.status_code == 200, response.status_code
+        return response
+
+    print(f"GET {url} as admin, uncached, {GeneralConstants.Pagination.MAX_PAGE_SIZE} courses (ms, bytes):")
+    bodies = set()
+    for name, provider in providers.items():
+        app.json = provider
+        body = get_courses().get_data()
+        bodies.add(repr(app.json.loads(body)))
+        compressed = get_courses({'Accept-Encoding': 'gzip'}).get_data()
+        assert gzip.decompress(compressed) == body
+        print(
+            f"  {name:<8} {best_of(get_courses, 5) * 1000:>8.1f} ms   "
+            f"{len(body):>9,} bytes, {len(compressed):>7,} gzipped"
+        )
+    assert len(bodies) == 1
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""
+Dump rate of the compiled read schemas, and the cost of loading request bodies.
+
+    python -m benchmarks.schemas
+"""
+from contextlib import contextmanager
+from typing import Iterator
+
+from marshmallow import Schema
+
+from benchmarks import best_of, create_benchmark_app, seed_courses
+
+
+@contextmanager
+def marshmallow_dumps() -> Iterator[None]:
+    """Dump every schema, nested ones included, through marshmallow instead of the compiled plan."""
+    from app.schemas.requests.base import CompiledDumpMixin
+
+    compiled = CompiledDumpMixin.dump
+    CompiledDumpMixin.dump = lambda self, obj, *, many=None: Schema.dump(self, obj, many=many)
+    try:
+        yield
+    finally:
+        CompiledDumpMixin.dump = compiled
+
+
+def main() -> None:
+    create_benchmark_app()
+    from app.extensions import db
+    from app.models import Course, Lecture, User
+    from app.schemas import (
+        CourseAdminSchema, CourseReadSchema, CourseWriteSchema, LectureCreateSchema, LectureSchema, UserPublicSchema
+    )
+    from app.utils import build_loader_options, load_each
+
+    seed_courses(50)
+
+    print("Dumps per second, marshmallow -> compiled (objects preloaded, output identical):")
+    for schema, model in (
+            (CourseReadSchema(), Course),
+            (CourseAdminSchema(), Course),
+            (LectureSchema(), Lecture),
+            (UserPublicSchema(), User)
+    ):
+        objs = db.session.scalars(db.select(model).options(*build_loader_options(model, schema))).unique().all()
+        with marshmallow_dumps():
+            expected = [schema.dump(obj) for obj in objs]
+            before = best_of(lambda: [schema.dump(obj) for obj in objs], 20) / len(objs)
+        assert [schema.dump(obj) for obj in objs] == expected
+        after = best_of(lambda: [schema.dump(obj) for obj in objs], 20) / len(objs)
+        print(f"  {type(schema).__name__:<18} {1 / before:>10,.0f} -> {1 / after:>10,.0f}")
+
+    print("Request body, schema.validate + service schema.load -> one schema.load (microseconds):")
+    lecture, course = {'name': 'Lecture name', 'content': 'x' * 2000}, {'name': 'Course name'}
+    lecture_instance, lecture_create, lecture_dict = LectureSchema(), LectureCreateSchema(), LectureSchema(load_instance=False)
+    course_instance, course_dict = CourseWriteSchema(), CourseWriteSchema(load_instance=False)
+
+    def lecture_before():
+        lecture_instance.validate(lecture)
+        lecture_create.load({**lecture, 'course_id': 1})
+
+    def course_before():
+        course_instance.validate(course)
+        course_instance.load(course)
+
+    for label, before, after in (
+            ('POST lecture', lecture_before, lambda: Lecture(**lecture_dict.load(lecture), course_id=1)),
+            ('POST course', course_before, lambda: Course(**course_dict.load(course)))
+    ):
+        print(f"  {label:<18} {best_of(before, 2000) * 1e6:>10.1f} -> {best_of(after, 2000) * 1e6:>10.1f}")
+
+    print("Bulk create of 1000 lectures, validate(many) + load(many) -> load_each (milliseconds):")
+    valid = [{'name': f'Lecture {index}', 'content': 'x' * 200, 'course_id': 1} for index in range(1000)]
+    mixed = [dict(item, content='') if index % 10 == 0 else item for index, item in enumerate(valid)]
+
+    def bulk_before(items):
+        errors = lecture_create.validate(items, many=True)
+        lecture_create.load([item for index, item in enumerate(items) if index not in errors], many=True)
+
+    for label, items in (('all valid', valid), ('10% invalid', mixed)):
+        before = best_of(lambda: bulk_before(items), 5)
+        after = best_of(lambda: load_each(lecture_create, items), 5)
+        print(f"  {label:<18} {before * 1e3:>10.1f} -> {after * 1e3:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""
+SMTP delivery rate: a new connection per message vs the pooled connections.
+
+    python -m benchmarks.smtp [--messages 500] [--handshake-ms 0 20]
+
+Sends to a local stand-in SMTP server (plain SMTP, no TLS). `--handshake-ms` delays
+the server greeting to stand in for the TCP + TLS handshake and login of a real
+SMTP_SSL server, which is what the pool saves.
+"""
+import argparse
+import socketserver
+import threading
+import time
+
+from benchmarks import create_benchmark_app
+
+
+class StandInSMTPHandler(socketserver.StreamRequestHandler):
+    """Accepts every message; `server.handshake` delays the greeting, `server.drop` closes after one message."""
+
+    def handle(self) -> None:
+        time.sleep(self.server.handshake)
+        self._reply(b'220 stand-in ESMTP')
+        while line := self.rfile.readline():
+            command = line[:4].upper()
+            if command == b'DATA':
+                self._reply(b'354 End data with <CR><LF>.<CR><LF>')
+                while self.rfile.readline() not in (b'.\r\n', b''):
+                    pass
+                self.server.received += 1
+                self._reply(b'250 OK')
+                if self.server.drop:
+                    return
+            elif command == b'QUIT':
+                self._reply(b'221 Bye')
+                return
+            elif command == b'EHLO':
+                self._reply(b'250 stand-in')
+            else:
+                self._reply(b'250 OK')
+
+    def _reply(self, line: bytes) -> None:
+        self.wfile.write(line + b'\r\n')
+
+
+class StandInSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, handshake: float) -> None:
+        super().__init__(('127.0.0.1', 0), StandInSMTPHandler)
+        self.handshake = handshake
+        self.drop = False
+        self.received = 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--messages', type=int, default=500)
+    parser.add_argument('--handshake-ms', type=float, nargs='+', default=[0, 20])
+    args = parser.parse_args()
+
+    app = create_benchmark_app()
+    from flask_mail import Message
+
+    from app.extensions import mail
+    from app.services import SMTPConnectionPool
+
+    messages = [
+        Message(subject=f'Exercise {index}', recipients=[f'student{index}@example.com'], body='x' * 500, sender='a@example.com')
+        for index in range(args.messages)
+    ]
+
+    for handshake_ms in args.handshake_ms:
+        server = StandInSMTPServer(handshake_ms / 1000)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        app.config.update(
+            MAIL_SERVER='127.0.0.1', MAIL_PORT=server.server_address[1], MAIL_USE_SSL=False,
+            MAIL_USE_TLS=False, MAIL_USERNAME=None, MAIL_PASSWORD=None, MAIL_SUPPRESS_SEND=False
+        )
+        mail.init_app(app)
+
+        def connection_per_message():
+            for message in messages:
+                with mail.connect() as connection:
+                    connection.send(message)
+
+        pool = SMTPConnectionPool(max_size=1)
+
+        def pooled_send():
+            for message in messages:
+                pool.send(message)
+
+        print(f"{args.messages} messages, {handshake_ms:g} ms handshake - messages/second:")
+        for label, send in (
+                ('connection per message', connection_per_message),
+                ('pool.send per message', pooled_send),
+                ('pool.send_many batch', lambda: pool.send_many(messages))
+        ):
+            started = time.perf_counter()
+            send()
+            print(f"  {label:<24} {args.messages / (time.perf_counter() - started):>10,.0f}")
+
+        # the server now drops every connection after one message, like an idle timeout
+        server.drop, received = True, server.received
+        started = time.perf_counter()
+        pooled_send()
+        print(
+            f"  {'pool, server drops':<24} {args.messages / (time.perf_counter() - started):>10,.0f}"
+            f"   ({server.received - received}/{args.messages} delivered, retrying dropped connections)"
+        )
+        pool.close_all()
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,86 @@
+"""
+Deadline burst: every student of a course submits, is graded, then resubmits at once.
+
+    python -m benchmarks.submissions [--students 2000] [--workers 16]
+
+Runs against a temporary SQLite file in WAL mode, so concurrent writers queue on its
+single write lock - a MySQL server handles more writers, but the statements per
+submission (and whether they race) are the same.
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks import create_benchmark_app, seed_courses
+
+PATH = '/course/course0/lecture/lecture0/exercise/exercise0'
+
+
+def submit_all(clients: list, workers: int, content: str) -> None:
+    def submit(client) -> tuple[float, int]:
+        started = time.perf_counter()
+        status = client.put(f'{PATH}/submission/', json={'content': content}).status_code
+        return time.perf_counter() - started, status
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(submit, clients))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency * 1000 for latency, _ in results)
+    failed = sum(1 for _, status in results if status != 200)
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"  {content:<12} {len(clients) / elapsed:>8,.0f} submissions/s   "
+        f"p50 {quantiles[49]:>6.1f} ms   p95 {quantiles[94]:>6.1f} ms   p99 {quantiles[98]:>6.1f} ms   "
+        f"failed {failed}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--students', type=int, default=2000)
+    parser.add_argument('--workers', type=int, default=16)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    app = create_benchmark_app(f"sqlite:///{os.path.join(directory, 'benchmark.db')}")
+    from sqlalchemy import event, func
+
+    from app.extensions import db
+    from app.models import Grade, GradebookEntry, Student, StudentSolution, User
+
+    event.listen(db.engine, 'connect', lambda connection, _: connection.execute('PRAGMA journal_mode=WAL'))
+    db.engine.dispose()
+    seed_courses(1, lectures=1, exercises=1, students=args.students)
+
+    def client_of(user_id: int):
+        client = app.test_client()
+        with client.session_transaction() as session:
+            session['_user_id'] = str(user_id)
+        return client
+
+    students = [client_of(user_id) for user_id in db.session.scalars(db.select(Student.user_id))]
+    teacher = client_of(db.session.scalars(db.select(User.id).where(User.role == 'teacher')).one())
+
+    print(f"{args.students} students, {args.workers} concurrent workers:")
+    submit_all(students, args.workers, 'first')
+
+    solution_ids = db.session.scalars(db.select(StudentSolution.id)).all()
+    response = teacher.put(f'{PATH}/grades/', json={'grades': [{'solution_id': id_, 'score': 80} for id_ in solution_ids]})
+    assert response.json['data']['graded'] == len(solution_ids), response.json
+
+    submit_all(students, args.workers, 'resubmitted')
+
+    db.session.expire_all()
+    assert db.session.scalar(db.select(func.count(StudentSolution.id))) == args.students
+    assert db.session.scalar(db.select(func.count(Grade.id))) == 0
+    assert db.session.scalar(db.select(func.coalesce(func.sum(GradebookEntry.graded_count), 0))) == 0
+    print("  every solution stored once, every stale grade dropped from the gradebook")
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
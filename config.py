@@ -10,10 +10,63 @@ class Config:
     # Flask
     SECRET_KEY = os.environ.get('SECRET_KEY')
 
+    # JSON encoder (orjson / ujson / stdlib - falls back if the package is missing)
+    JSON_PROVIDER = os.environ.get('JSON_PROVIDER', 'orjson')
+
     # SQLAlchemy
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Read replica (optional) - CRUD reads go to it, writes and transactions to the primary
+    DATABASE_REPLICA_URL = os.environ.get('DATABASE_REPLICA_URL')
+    SQLALCHEMY_BINDS = {'replica': DATABASE_REPLICA_URL} if DATABASE_REPLICA_URL else {}
+    # After a commit, the client's reads stay on the primary while the replica catches up
+    REPLICA_STICKY_SECONDS = int(os.environ.get('REPLICA_STICKY_SECONDS', 5))
+
+    # Connection pool (per worker process; recycle below MySQL's wait_timeout)
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 5))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 10))
+    DB_POOL_TIMEOUT = float(os.environ.get('DB_POOL_TIMEOUT', 10))
+    DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', 1800))
+    DB_POOL_PRE_PING = os.environ.get('DB_POOL_PRE_PING', 'true').lower() == 'true'
+    DB_CONNECT_TIMEOUT = int(os.environ.get('DB_CONNECT_TIMEOUT', 5))
+    DB_READ_TIMEOUT = int(os.environ.get('DB_READ_TIMEOUT', 30))
+    DB_WRITE_TIMEOUT = int(os.environ.get('DB_WRITE_TIMEOUT', 30))
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': DB_POOL_SIZE,
+        'max_overflow': DB_MAX_OVERFLOW,
+        'pool_timeout': DB_POOL_TIMEOUT,
+        'pool_recycle': DB_POOL_RECYCLE,
+        'pool_pre_ping': DB_POOL_PRE_PING,
+        'connect_args': {
+            'connect_timeout': DB_CONNECT_TIMEOUT,
+            'read_timeout': DB_READ_TIMEOUT,
+            'write_timeout': DB_WRITE_TIMEOUT
+        }
+    }
+
+    # Checkouts waiting longer than this (ms) for a pooled connection are logged
+    DB_POOL_SLOW_CHECKOUT_MS = int(os.environ.get('DB_POOL_SLOW_CHECKOUT_MS', 100))
+    # Seconds between pool metrics log lines (checkout wait, in use, overflow); 0 = off
+    DB_POOL_METRICS_LOG_INTERVAL = int(os.environ.get('DB_POOL_METRICS_LOG_INTERVAL', 60))
+    # Level of the pool metrics / overflow log lines; their logger is set to it, so they show outside debug mode
+    DB_POOL_METRICS_LOG_LEVEL = os.environ.get('DB_POOL_METRICS_LOG_LEVEL', 'INFO').upper()
+
+    # Password hashing (0 = hash synchronously in the request thread)
+    PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', 0))
+
+    # Seconds an authenticated user's role and course access are cached for
+    PRINCIPAL_CACHE_TTL = int(os.environ.get('PRINCIPAL_CACHE_TTL', 30))
+    PRINCIPAL_CACHE_MAX_ENTRIES = int(os.environ.get('PRINCIPAL_CACHE_MAX_ENTRIES', 10_000))
+
+    # Login audit records are buffered and bulk-inserted
+    LOGIN_RECORD_BUFFER_SIZE = int(os.environ.get('LOGIN_RECORD_BUFFER_SIZE', 100))
+    LOGIN_RECORD_FLUSH_INTERVAL = float(os.environ.get('LOGIN_RECORD_FLUSH_INTERVAL', 5))
+
+    # Retention (days kept before `flask retention purge` deletes rows)
+    TOKEN_RETENTION_DAYS = int(os.environ.get('TOKEN_RETENTION_DAYS', 7))
+    LOGIN_RECORD_RETENTION_DAYS = int(os.environ.get('LOGIN_RECORD_RETENTION_DAYS', 365))
+
     # Session
     PERMANENT_SESSION_LIFETIME = timedelta(hours=1)
     SESSION_COOKIE_SECURE = True
@@ -27,4 +80,20 @@ class Config:
     MAIL_USE_SSL = True
     MAIL_USERNAME = os.environ.get('MAIL_USERNAME')
     MAIL_PASSWORD = os.environ.get('MAIL_PASSWORD')
-    MAIL_DEFAULT_SENDER = os.environ.get('MAIL_DEFAULT_SENDER')
\ No newline at end of file
+    MAIL_DEFAULT_SENDER = os.environ.get('MAIL_DEFAULT_SENDER')
+
+    # Response cache (lru = per process / redis = shared by all workers)
+    CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'lru')
+    CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL', 'redis://localhost:6379/0')
+    CACHE_TTL = int(os.environ.get('CACHE_TTL', 60))
+    CACHE_MAX_ENTRIES = int(os.environ.get('CACHE_MAX_ENTRIES', 1024))
+
+    # Response compression (gzip, and brotli when the package is installed)
+    COMPRESS_ENABLED = os.environ.get('COMPRESS_ENABLED', 'true').lower() == 'true'
+    COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE', 1024))
+    COMPRESS_GZIP_LEVEL = int(os.environ.get('COMPRESS_GZIP_LEVEL', 6))
+    COMPRESS_BROTLI_QUALITY = int(os.environ.get('COMPRESS_BROTLI_QUALITY', 4))
+
+    # Email delivery (sync / thread / outbox)
+    EMAIL_DELIVERY_BACKEND = os.environ.get('EMAIL_DELIVERY_BACKEND', 'thread')
+    EMAIL_QUEUE_WORKERS = int(os.environ.get('EMAIL_QUEUE_WORKERS', 4))
\ No newline at end of file
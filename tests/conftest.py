@@ -0,0 +1,98 @@
+import os
+
+os.environ['DATABASE_URL'] = 'sqlite://'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ.pop('DATABASE_REPLICA_URL', None)
+
+import pytest
+from sqlalchemy import event
+
+from app import create_app
+from app.constants import AuthConstants
+from app.extensions import db
+from app.models import Course, Exercise, Lecture, Student, StudentCourses, Teacher, TeacherCourses, User
+
+
+@pytest.fixture
+def app():
+    app = create_app()
+    app.config.update(TESTING=True, SESSION_COOKIE_SECURE=False)
+
+    # SQLite cannot autoincrement a column of a composite primary key
+    for table in (StudentCourses.__table__, TeacherCourses.__table__):
+        table.c.id.autoincrement = False
+        table.c.id.primary_key = False
+        table.c.id.nullable = True
+
+    from app.factories import principal_service, response_cache
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        # the caches outlive the app, and the next test reuses the same ids and names
+        db.session.rollback()
+        response_cache.invalidate_course(*db.session.scalars(db.select(Course.name)))
+        principal_service.invalidate_all()
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def queries(app):
+    """SQL statements executed while the test runs."""
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db.engine, 'before_cursor_execute', listener)
+    yield statements
+    event.remove(db.engine, 'before_cursor_execute', listener)
+
+
+@pytest.fixture
+def users(app):
+    """An admin, a teacher and a student user, keyed by role."""
+    admin = User(email='admin@example.com', password='x', role=AuthConstants.Role.ADMIN)
+    teacher_user = User(email='teacher@example.com', password='x', role=AuthConstants.Role.TEACHER)
+    student_user = User(email='student@example.com', password='x', role=AuthConstants.Role.STUDENT)
+    db.session.add_all([admin, teacher_user, student_user])
+    db.session.add_all([
+        Teacher(user=teacher_user, first_name='Tea', last_name='Cher', email='teacher@example.com', phone='0500000001'),
+        Student(user=student_user, first_name='Stu', last_name='Dent', email='student@example.com', phone='0500000002')
+    ])
+    db.session.commit()
+    return {'admin': admin, 'teacher': teacher_user, 'student': student_user}
+
+
+@pytest.fixture
+def make_courses(users):
+    """Create courses taught by the teacher and attended by the student, each with lectures and exercises."""
+    teacher, student = users['teacher'].teacher, users['student'].student
+
+    def make_courses(count: int, start: int = 0, lectures: int = 2) -> list[Course]:
+        courses = []
+        for index in range(start, start + count):
+            course = Course(name=f'course{index}')
+            course.teachers.append(teacher)
+            course.students.append(student)
+            for lecture_index in range(lectures):
+                lecture = Lecture(name=f'lecture{lecture_index}', content='x' * 20, teacher=teacher)
+                lecture.exercises = [Exercise(name=f'exercise{i}', content='y' * 20) for i in range(2)]
+                course.lectures.append(lecture)
+            courses.append(course)
+        db.session.add_all(courses)
+        db.session.commit()
+        return courses
+
+    return make_courses
+
+
+@pytest.fixture
+def login(app):
+    """Return a test client logged in as `user`."""
+    def login(user: User):
+        client = app.test_client()
+        with client.session_transaction() as session:
+            session['_user_id'] = str(user.id)
+            session['_fresh'] = True
+        return client
+
+    return login
\ No newline at end of file
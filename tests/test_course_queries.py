@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.extensions import db
+from app.models import Exercise
+
+
+def _count_list_queries(client, queries) -> int:
+    queries.clear()
+    response = client.get('/course/?limit=500')
+    assert response.status_code == 200, response.json
+    return len(queries)
+
+
+@pytest.mark.parametrize('role', ['admin', 'teacher', 'student'])
+def test_course_list_query_count_does_not_grow_with_courses(users, make_courses, login, queries, role):
+    client = login(users[role])
+    client.get('/course/')  # caches the user's principal
+    make_courses(3)
+    with_few = _count_list_queries(client, queries)
+
+    make_courses(12, start=3)
+    from app.factories import response_cache
+    response_cache.invalidate_course()
+    with_many = _count_list_queries(client, queries)
+
+    assert with_many == with_few
+
+
+def test_course_list_dumps_nested_people(users, make_courses, login):
+    make_courses(1)
+
+    response = login(users['admin']).get('/course/')
+
+    course = response.json['data'][0]
+    assert course['teachers'] == [{'full_name': 'Tea Cher'}]
+    assert course['students'] == [{'full_name': 'Stu Dent'}]
+    assert course['lectures_count'] == 2
+
+
+def test_course_detail_query_count_does_not_grow_with_lectures(users, make_courses, login, queries):
+    make_courses(1, lectures=1)
+    make_courses(1, start=1, lectures=6)
+    client = login(users['student'])
+    client.get('/course/')  # caches the user's principal
+
+    counts = []
+    for name in ('course0', 'course1'):
+        queries.clear()
+        assert client.get(f'/course/{name}').status_code == 200
+        counts.append(len(queries))
+
+    assert counts[0] == counts[1]
+
+
+def test_teacher_solution_shown_after_naive_deadline(users, make_courses, login):
+    make_courses(1)
+    exercise = db.session.scalars(db.select(Exercise)).first()
+    # MySQL DATETIME columns come back naive
+    exercise.target_date = datetime.utcnow() - timedelta(days=1)
+    exercise.teacher_solution = 'solution'
+    db.session.commit()
+
+    response = login(users['student']).get('/course/course0')
+
+    assert response.status_code == 200, response.json
+    exercises = response.json['data']['lectures'][0]['exercises']
+    assert any(item.get('teacher_solution') == 'solution' for item in exercises)
\ No newline at end of file
@@ -0,0 +1,64 @@
+import time
+from datetime import datetime, timedelta
+
+import pytz
+from werkzeug.http import http_date, parse_date
+
+from app.extensions import db
+from app.models import Exercise
+from app.services import LRUCacheBackend, ResponseCache
+from app.utils import json_response
+
+
+def _set_deadline(target_date: datetime) -> None:
+    exercise = db.session.scalars(db.select(Exercise)).first()
+    exercise.target_date = target_date
+    exercise.teacher_solution = 'solution'
+    db.session.commit()
+
+
+def _teacher_solutions(response) -> list:
+    return [
+        exercise['teacher_solution']
+        for lecture in response.json['data']['lectures']
+        for exercise in lecture['exercises']
+        if exercise.get('teacher_solution')
+    ]
+
+
+def test_course_etag_changes_when_a_deadline_passes(users, make_courses, login):
+    make_courses(1)
+    deadline = datetime.now(pytz.utc).replace(microsecond=0) + timedelta(seconds=2)
+    _set_deadline(deadline)
+    client = login(users['student'])
+
+    before = client.get('/course/course0')
+    assert before.status_code == 200, before.json
+    assert _teacher_solutions(before) == []
+    assert parse_date(before.headers['Expires']) == deadline
+    assert client.get('/course/course0', headers={'If-None-Match': before.headers['ETag']}).status_code == 304
+
+    time.sleep((deadline - datetime.now(pytz.utc)).total_seconds() + 0.1)
+
+    after = client.get('/course/course0', headers={'If-None-Match': before.headers['ETag']})
+    assert after.status_code == 200
+    assert _teacher_solutions(after) == ['solution']
+    assert after.headers['ETag'] != before.headers['ETag']
+    assert parse_date(after.headers['Last-Modified']) == deadline
+    assert parse_date(after.headers['Expires']) > deadline
+
+
+def test_response_cache_drops_entries_at_their_expires():
+    cache = ResponseCache(LRUCacheBackend())
+    computed = []
+
+    def compute(expires: datetime):
+        computed.append(expires)
+        return json_response('{}', headers={'Expires': http_date(expires)})
+
+    now = datetime.now(pytz.utc)
+    for expires in (now - timedelta(seconds=1), now - timedelta(seconds=1), now + timedelta(hours=1), now):
+        cache.get_or_compute(['ns'], 'key', lambda: compute(expires))
+
+    # the expired response is computed every time, the next one is then served from the cache
+    assert len(computed) == 3
\ No newline at end of file
@@ -0,0 +1,42 @@
+import logging
+
+import pytest
+from sqlalchemy import create_engine
+
+from app.extensions import db
+from app.utils import InstrumentedQueuePool, pool_metrics
+
+
+@pytest.fixture
+def instrumented_engine(app):
+    engine = create_engine('sqlite://', poolclass=InstrumentedQueuePool)
+    with engine.connect():
+        pass
+    db.engines['metrics'] = engine
+    yield engine
+    del db.engines['metrics']
+    engine.dispose()
+
+
+def _metrics_records(app, caplog) -> list[logging.LogRecord]:
+    return [record for record in caplog.records if record.name == f'{app.logger.name}.{pool_metrics.LOGGER_NAME}']
+
+
+def test_pool_metrics_are_logged_outside_debug_mode(app, instrumented_engine, caplog):
+    assert not app.debug
+    assert app.logger.getEffectiveLevel() == logging.WARNING
+
+    pool_metrics.log_snapshot()
+
+    records = _metrics_records(app, caplog)
+    assert [record.levelno for record in records] == [logging.INFO]
+    assert records[0].getMessage().startswith("Database pool metrics: {'size': 5, 'in_use': 0, 'idle': 1")
+
+
+def test_pool_metrics_log_level_is_configurable(app, instrumented_engine, caplog):
+    app.config['DB_POOL_METRICS_LOG_LEVEL'] = 'WARNING'
+    pool_metrics.init_app(app)
+
+    pool_metrics.log_snapshot()
+
+    assert [record.levelno for record in _metrics_records(app, caplog)] == [logging.WARNING]
\ No newline at end of file
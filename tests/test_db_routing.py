@@ -0,0 +1,49 @@
+import pytest
+from sqlalchemy import create_engine
+from werkzeug.exceptions import Conflict
+
+from app.db_routing import RoutingSession
+from app.extensions import db
+from app.models import Course
+
+
+@pytest.fixture
+def replica(app):
+    """An empty replica database: reads routed to it do not see the primary's rows."""
+    engine = create_engine('sqlite://')
+    db.metadata.create_all(engine)
+    db.engines[RoutingSession.REPLICA_BIND] = engine
+    db.session.add(Course(name='primary-only'))
+    db.session.commit()
+    # a fresh session, not sticky to the primary after the commit above
+    db.session.remove()
+    yield engine
+    db.session.remove()
+    del db.engines[RoutingSession.REPLICA_BIND]
+    engine.dispose()
+
+
+def test_crud_reads_go_to_the_replica(replica):
+    from app.factories import crud_service
+
+    assert crud_service.find_values(Course.name) == []
+
+
+def test_primary_block_keeps_reads_on_the_primary(replica):
+    from app.factories import crud_service, db_service
+
+    with db_service.primary():
+        assert crud_service.find_values(Course.name) == ['primary-only']
+
+
+def test_conflict_checks_read_the_primary(replica):
+    from app.factories import crud_service
+
+    with pytest.raises(Conflict):
+        crud_service.validate_no_record_by_fields(Course, name='primary-only')
+
+
+def test_gradebook_rebuild_reads_courses_from_the_primary(replica):
+    from app.factories import gradebook_service
+
+    assert gradebook_service.refresh_all() == 1
\ No newline at end of file
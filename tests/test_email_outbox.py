@@ -0,0 +1,79 @@
+from smtplib import SMTPServerDisconnected
+
+from flask_mail import Message
+
+from app.constants import ModelConstants
+from app.extensions import db
+from app.models import EmailOutbox
+from app.services import OutboxEmailQueue
+
+
+class StubPool:
+    """Records sent subjects; `on_send` runs inside each send."""
+
+    def __init__(self, on_send=None, error=None):
+        self.sent = []
+        self.on_send = on_send
+        self.error = error
+
+    def send(self, message):
+        if self.on_send:
+            self.on_send()
+        if self.error:
+            raise self.error
+        self.sent.append(message.subject)
+
+
+def make_queue(pool, **kwargs):
+    from app.factories import crud_service, db_service
+
+    return OutboxEmailQueue(db_service, crud_service, pool, **kwargs)
+
+
+def enqueue(queue, count):
+    queue.enqueue_many(
+        Message(subject=f'subject{index}', recipients=['to@example.com'], body='body', sender='from@example.com')
+        for index in range(count)
+    )
+
+
+def statuses():
+    db.session.expire_all()
+    return [(entry.status, entry.attempts) for entry in db.session.scalars(db.select(EmailOutbox))]
+
+
+def test_deliver_pending_sends_and_marks_sent(app):
+    pool = StubPool()
+    queue = make_queue(pool)
+    enqueue(queue, 3)
+
+    assert queue.deliver_pending(10) == 3
+    assert pool.sent == ['subject0', 'subject1', 'subject2']
+    assert statuses() == [(ModelConstants.EmailStatus.SENT, 0)] * 3
+    assert queue.deliver_pending(10) == 0
+
+
+def test_claimed_rows_are_committed_before_sending(app):
+    other_worker = make_queue(StubPool())
+    in_transaction, claimed_by_other = [], []
+
+    def on_send():
+        in_transaction.append(db.session().in_transaction())
+        claimed_by_other.append(other_worker.deliver_pending(10))
+
+    queue = make_queue(StubPool(on_send=on_send))
+    enqueue(queue, 2)
+
+    assert queue.deliver_pending(10) == 2
+    assert in_transaction == [False, False]
+    assert claimed_by_other == [0, 0]
+
+
+def test_failed_send_is_rescheduled_then_marked_failed(app):
+    queue = make_queue(StubPool(error=SMTPServerDisconnected('gone')), max_retries=1, retry_backoff=0)
+    enqueue(queue, 1)
+
+    assert queue.deliver_pending(10) == 1
+    assert statuses() == [(ModelConstants.EmailStatus.PENDING, 1)]
+    assert queue.deliver_pending(10) == 1
+    assert statuses() == [(ModelConstants.EmailStatus.FAILED, 2)]
\ No newline at end of file
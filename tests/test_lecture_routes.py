@@ -0,0 +1,59 @@
+from app.extensions import db
+from app.models import Course, Lecture
+
+
+def _lecture(course_name: str, lecture_name: str) -> Lecture:
+    return db.session.scalars(
+        db.select(Lecture).join(Course).where(Course.name == course_name, Lecture.name == lecture_name)
+    ).one_or_none()
+
+
+def test_update_lecture_rejects_course_id(users, make_courses, login):
+    own, other = make_courses(2)
+    client = login(users['teacher'])
+
+    response = client.put(f'/course/{own.name}/lecture/lecture0', json={'course_id': other.id})
+
+    assert response.status_code == 422
+    assert response.json['success'] is False
+    db.session.expire_all()
+    assert _lecture(own.name, 'lecture0') is not None
+
+
+def test_bulk_update_lectures_rejects_course_id(users, make_courses, login):
+    own, other = make_courses(2)
+    client = login(users['teacher'])
+
+    response = client.put(
+        f'/course/{own.name}/lecture/bulk',
+        json={'lectures': [{'name': 'lecture0', 'course_id': other.id, 'teacher_id': 999}]}
+    )
+
+    assert response.status_code == 400
+    assert 'course_id' in response.json['errors']['0']
+    db.session.expire_all()
+    assert _lecture(own.name, 'lecture0').teacher_id == users['teacher'].teacher.id
+
+
+def test_bulk_create_lectures_ignores_payload_course_id(users, make_courses, login):
+    own, other = make_courses(2)
+    client = login(users['teacher'])
+
+    response = client.post(
+        f'/course/{own.name}/lecture/bulk',
+        json={'lectures': [{'name': 'new lecture', 'content': 'content', 'course_id': other.id}]}
+    )
+
+    assert response.status_code == 201, response.json
+    assert _lecture(own.name, 'new lecture') is not None
+    assert _lecture(other.name, 'new lecture') is None
+
+
+def test_create_lecture_rejects_reserved_name(users, make_courses, login):
+    course = make_courses(1)[0]
+    client = login(users['teacher'])
+
+    response = client.post(f'/course/{course.name}/lecture/', json={'name': 'bulk', 'content': 'content'})
+
+    assert response.status_code == 422
+    assert _lecture(course.name, 'bulk') is None
\ No newline at end of file
@@ -0,0 +1,51 @@
+import atexit
+import threading
+import time
+
+import pytest
+
+from app.extensions import db
+from app.models import LoginRecord
+from app.services import LoginRecordBuffer
+
+
+@pytest.fixture
+def buffer(app, users, monkeypatch):
+    """A two-row buffer whose flusher only wakes up when signalled."""
+    monkeypatch.setattr(atexit, 'register', lambda func: func)
+    buffer = LoginRecordBuffer(max_size=2, flush_interval=3600)
+    buffer.flushed_by = []
+    flush = buffer.flush
+
+    def recording_flush():
+        buffer.flushed_by.append(threading.current_thread().name)
+        flush()
+
+    monkeypatch.setattr(buffer, 'flush', recording_flush)
+    buffer.init_app(app)
+    return buffer
+
+
+def _row(user) -> dict:
+    return {'user_id': user.id, 'ip_address': '127.0.0.1', 'user_agent': 'pytest'}
+
+
+def test_full_buffer_is_flushed_by_the_background_thread(buffer, users):
+    buffer.add(_row(users['student']))
+    buffer.add(_row(users['student']))
+
+    assert threading.current_thread().name not in buffer.flushed_by
+    for _ in range(100):
+        if db.session.scalar(db.select(db.func.count()).select_from(LoginRecord)) == 2:
+            break
+        time.sleep(0.01)
+    assert db.session.scalar(db.select(db.func.count()).select_from(LoginRecord)) == 2
+    assert buffer.flushed_by == ['login-record-flush']
+
+
+def test_partial_buffer_waits_for_the_interval(buffer, users):
+    buffer.add(_row(users['student']))
+    time.sleep(0.05)
+
+    assert buffer.flushed_by == []
+    assert db.session.scalar(db.select(db.func.count()).select_from(LoginRecord)) == 0
\ No newline at end of file
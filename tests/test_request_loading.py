@@ -0,0 +1,87 @@
+import pytest
+from flask import g
+from marshmallow import Schema
+
+from app.extensions import db
+from app.models import Course, Grade, Lecture, StudentSolution
+
+
+@pytest.fixture
+def schema_calls(monkeypatch):
+    """Count the `load` / `validate` calls made on any marshmallow schema."""
+    calls = {'load': 0, 'validate': 0}
+    load, validate = Schema.load, Schema.validate
+
+    def counting_load(self, *args, **kwargs):
+        calls['load'] += 1
+        return load(self, *args, **kwargs)
+
+    def counting_validate(self, *args, **kwargs):
+        calls['validate'] += 1
+        return validate(self, *args, **kwargs)
+
+    monkeypatch.setattr(Schema, 'load', counting_load)
+    monkeypatch.setattr(Schema, 'validate', counting_validate)
+    return calls
+
+
+def test_create_course_loads_the_body_once(users, login, schema_calls):
+    client = login(users['admin'])
+
+    response = client.post('/course/', json={'name': 'new course'})
+
+    assert response.status_code == 201, response.json
+    assert schema_calls == {'load': 1, 'validate': 0}
+    assert db.session.scalars(db.select(Course.name)).all() == ['new course']
+
+
+def test_create_and_update_lecture_load_the_body_once(users, make_courses, login, schema_calls):
+    course = make_courses(1)[0]
+    client = login(users['teacher'])
+
+    response = client.post(f'/course/{course.name}/lecture/', json={'name': 'new lecture', 'content': 'content'})
+    assert response.status_code == 201, response.json
+    assert schema_calls == {'load': 1, 'validate': 0}
+
+    response = client.put(f'/course/{course.name}/lecture/new lecture', json={'content': 'changed'})
+    assert response.status_code == 200, response.json
+    assert schema_calls == {'load': 2, 'validate': 0}
+
+    db.session.expire_all()
+    lecture = db.session.scalars(db.select(Lecture).where(Lecture.name == 'new lecture')).one()
+    assert (lecture.content, lecture.course_id) == ('changed', course.id)
+
+
+def test_bulk_create_loads_each_item_once(users, make_courses, login, schema_calls):
+    course = make_courses(1)[0]
+    client = login(users['teacher'])
+
+    response = client.post(
+        f'/course/{course.name}/lecture/bulk',
+        json={'lectures': [{'name': 'aa', 'content': 'x'}, {'name': 'bb', 'content': ''}, {'name': 'cc', 'content': 'x'}]}
+    )
+
+    assert response.status_code == 201, response.json
+    assert list(response.json['data']['errors']) == ['1']
+    # the envelope, the lectures, then the valid lectures again to build them
+    assert schema_calls == {'load': 3, 'validate': 0}
+
+
+def test_grading_loads_each_grade_once(users, make_courses, login, schema_calls):
+    course = make_courses(1)[0]
+    path = f'/course/{course.name}/lecture/lecture0/exercise/exercise0'
+    assert login(users['student']).put(f'{path}/submission/', json={'content': 'answer'}).status_code == 200
+    # the test requests share the fixture's app context, where Flask-Login keeps the loaded user
+    g.pop('_login_user', None)
+    solution_id = db.session.scalars(db.select(StudentSolution.id)).first()
+
+    response = login(users['teacher']).put(
+        f'{path}/grades/',
+        json={'grades': [{'solution_id': solution_id, 'score': 90}, {'solution_id': solution_id, 'score': 500}]}
+    )
+
+    assert response.status_code == 200, response.json
+    assert response.json['data']['graded'] == 1
+    # the submission body, the envelope, the grades, then the valid grades again
+    assert schema_calls == {'load': 4, 'validate': 0}
+    assert db.session.scalars(db.select(Grade.score)).all() == [90]
\ No newline at end of file
@@ -0,0 +1,78 @@
+from smtplib import SMTPServerDisconnected
+
+import pytest
+from flask_mail import Message
+
+from app.services import SMTPConnectionPool, SyncEmailQueue
+
+
+class FakeHost:
+    def __init__(self):
+        self.closed = False
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    """Delivers to `sent`; raises SMTPServerDisconnected after `drops_after` messages."""
+
+    def __init__(self, sent: list, drops_after: int | None = None):
+        self.host = FakeHost()
+        self.sent = sent
+        self.drops_after = drops_after
+
+    def send(self, message):
+        if self.drops_after is not None and len(self.sent) >= self.drops_after:
+            raise SMTPServerDisconnected("Connection unexpectedly closed")
+        self.sent.append(message.subject)
+
+
+def _messages(count: int) -> list[Message]:
+    return [Message(subject=f'subject{index}', recipients=['to@example.com']) for index in range(count)]
+
+
+@pytest.fixture
+def pool(app, monkeypatch):
+    pool = SMTPConnectionPool(max_size=2)
+    pool.opened = []
+    pool.sent = []
+
+    def open_connection():
+        connection = FakeConnection(pool.sent)
+        pool.opened.append(connection)
+        return connection
+
+    monkeypatch.setattr(pool, '_open', open_connection)
+    return pool
+
+
+def test_send_retries_once_when_the_pooled_connection_was_dropped(pool):
+    stale = FakeConnection(pool.sent, drops_after=0)
+    pool._checkin(stale)
+
+    SyncEmailQueue(pool).enqueue(_messages(1)[0])
+
+    assert pool.sent == ['subject0']
+    assert stale.host.closed
+    assert len(pool.opened) == 1
+
+
+def test_send_many_resumes_from_the_first_unsent_message(pool):
+    dropping = FakeConnection(pool.sent, drops_after=2)
+    pool._checkin(dropping)
+
+    pool.send_many(_messages(4))
+
+    assert pool.sent == ['subject0', 'subject1', 'subject2', 'subject3']
+    assert dropping.host.closed
+
+
+def test_send_gives_up_after_one_retry(pool, monkeypatch):
+    monkeypatch.setattr(pool, '_open', lambda: FakeConnection(pool.sent, drops_after=0))
+
+    with pytest.raises(SMTPServerDisconnected):
+        pool.send(_messages(1)[0])
\ No newline at end of file
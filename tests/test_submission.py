@@ -0,0 +1,51 @@
+from flask import g
+
+from app.constants import GeneralConstants
+from app.extensions import db
+from app.models import Grade, GradebookEntry, StudentSolution
+
+PATH = '/course/course0/lecture/lecture0/exercise/exercise0'
+
+
+def _as(login, user):
+    # the test requests share the fixture's app context, where Flask-Login keeps the loaded user
+    g.pop('_login_user', None)
+    return login(user)
+
+
+def _gradebook_entry() -> tuple[int, int]:
+    db.session.expire_all()
+    entry = db.session.scalars(db.select(GradebookEntry)).one()
+    return entry.graded_count, entry.total_score
+
+
+def test_resubmission_drops_the_grade_from_the_gradebook(users, make_courses, login):
+    make_courses(1)
+    assert _as(login, users['student']).put(f'{PATH}/submission/', json={'content': 'first'}).status_code == 200
+    solution_id = db.session.scalars(db.select(StudentSolution.id)).one()
+    response = _as(login, users['teacher']).put(f'{PATH}/grades/', json={'grades': [{'solution_id': solution_id, 'score': 90}]})
+    assert response.json['data']['graded'] == 1
+    assert _gradebook_entry() == (1, 90)
+
+    response = _as(login, users['student']).put(f'{PATH}/submission/', json={'content': 'second'})
+
+    assert response.status_code == 200, response.json
+    assert _gradebook_entry() == (0, 0)
+    assert db.session.scalars(db.select(Grade)).all() == []
+    solution = db.session.get(StudentSolution, solution_id)
+    assert (solution.content, solution.status) == ('second', GeneralConstants.Status.SUBMITTED)
+
+
+def test_first_submission_does_not_touch_the_gradebook(users, make_courses, login, queries):
+    make_courses(1)
+    client = _as(login, users['student'])
+    client.put(f'{PATH}/submission/', json={'content': 'warm up the principal'})
+    db.session.execute(db.delete(StudentSolution))
+    db.session.commit()
+    queries.clear()
+
+    assert client.put(f'{PATH}/submission/', json={'content': 'first'}).status_code == 200
+
+    # lookup, upsert, grade delete
+    assert len(queries) == 3
+    assert db.session.scalars(db.select(GradebookEntry)).all() == []
\ No newline at end of file